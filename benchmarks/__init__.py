@@ -0,0 +1 @@
+"""대시보드 성능 측정 스크립트 모음 (python -m benchmarks.<이름> 으로 실행)"""
@@ -0,0 +1,144 @@
+"""백엔드 벤치마크 - pandas(메모리 상주 인덱스/큐브) vs duckdb(Parquet + SQL) 결과 비교와 규모별 측정
+
+    python -m benchmarks.bench_backends --keyword-rows 200000 1000000 5000000
+    python -m benchmarks.bench_backends --keyword-rows 1000000 --parity-only
+
+규모마다 합성 데이터를 만들고, 브랜드 × 채널 조합 × 기간 그리드의 모든 선택에서 두 백엔드의
+카드/추이 집계, 월별 상위 100 테이블, 기간 순위 키워드, 3번 탭 시계열이 같은지 먼저 확인한 뒤
+선택 1회당 처리 시간(p50/p95)과 메모리에 상주하는 데이터 크기를 비교한다.
+--parity-only는 두 백엔드끼리만 비교하므로, 원본 CSV 기준 검증은 benchmarks.check_parity로 한다.
+"""
+import argparse
+import itertools
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_pipeline import aggregate, channel_sets, period_months
+from benchmarks.synthetic import card_brands, generate
+from dashboard.config import file_links, keyword_columns, month_column, resident_files
+from dashboard.data import load_cubes, load_dataframes, load_indexes
+from dashboard.profiling import percentile
+from dashboard.ranking import KeywordRanking
+from dashboard.schema import memory_report
+from dashboard.sql import SqlRanking, open_engine, sql_cubes
+
+# ✅ 키워드 파일별 (채널 조건 사용 여부, 감성)
+keyword_queries = {
+    "05.Keyword_Monthly.csv": (True, None),
+    "06.Search_Keyword_Monthly.csv": (False, None),
+    "07.Sentiment_Keyword_Monthly.csv": (True, "긍정"),
+}
+
+
+def pandas_ranking(indexes):
+    def build(file_name, brand, channels, sentiment):
+        df = indexes[file_name].query(brand, channels)
+        if sentiment is not None:
+            df = df[df["감성"] == sentiment]
+        return KeywordRanking(df, *keyword_columns[file_name])
+    return build
+
+def sql_ranking(engine):
+    def build(file_name, brand, channels, sentiment):
+        return SqlRanking(engine, file_name, brand, channels, sentiment)
+    return build
+
+def selection(cubes, build_ranking, brand, selected_channels, since, brands):
+    """선택 1회 - 1·2번 탭 집계 + 키워드 파일별 월별 테이블, 1~12위 키워드, 시계열"""
+    results = aggregate(cubes, brand, selected_channels, since, brands)
+    for file_name, (use_channels, sentiment) in keyword_queries.items():
+        ranking = build_ranking(file_name, brand, selected_channels if use_channels else None, sentiment)
+        keywords = ranking.top_keywords(since, 1, 12) if ranking.has_data(since) else []
+        series = ranking.series(keywords, since)
+        results[file_name] = (ranking.wide_table(since), keywords,
+                              series.sort_values([month_column, series.columns[0]], ignore_index=True))
+    return results
+
+def assert_same(expected, actual, context):
+    """두 백엔드 결과 비교 (dtype 차이는 무시, 값과 순서는 같아야 함)"""
+    for key, value in expected.items():
+        other = actual[key]
+        if isinstance(value, tuple):
+            assert_same(dict(enumerate(value)), dict(enumerate(other)), f"{context} {key}")
+        elif isinstance(value, pd.DataFrame):
+            try:
+                pd.testing.assert_frame_equal(value.reset_index(drop=True), other.reset_index(drop=True),
+                                              check_dtype=False, check_column_type=False, check_index_type=False)
+            except AssertionError as e:
+                raise AssertionError(f"{context} {key}: {e}") from None
+        elif value != other:
+            raise AssertionError(f"{context} {key}: {value!r} != {other!r}")
+
+def run(data_dir, parity_only=False):
+    load_start = time.perf_counter()
+    dataframes, errors = load_dataframes(data_dir)
+    if errors:
+        raise RuntimeError(f"로드 실패: {errors}")
+    cubes, indexes = load_cubes(data_dir), load_indexes(dataframes)
+    pandas_setup = time.perf_counter() - load_start
+
+    open_start = time.perf_counter()
+    engine, errors = open_engine(data_dir)
+    if errors:
+        raise RuntimeError(f"엔진 준비 실패: {errors}")
+    duckdb_setup = time.perf_counter() - open_start
+
+    df_buzz = dataframes["01.Social_Buzz_Monthly.csv"]
+    brands = [brand for brand in card_brands if brand in set(df_buzz["브랜드"])]
+    latest_month = int(df_buzz[month_column].max())
+    grid = list(itertools.product(brands, channel_sets.values(), period_months))
+    backends = {
+        "pandas": (cubes, pandas_ranking(indexes)),
+        "duckdb": (sql_cubes(engine), sql_ranking(engine)),
+    }
+
+    samples = {name: [] for name in backends}
+    for brand, selected_channels, months in grid:
+        since = latest_month - (months - 1)
+        results = {}
+        for name, (backend_cubes, build_ranking) in backends.items():
+            start = time.perf_counter()
+            results[name] = selection(backend_cubes, build_ranking, brand, selected_channels, since, brands)
+            samples[name].append(time.perf_counter() - start)
+        assert_same(results["pandas"], results["duckdb"], f"[{brand}, {len(selected_channels)}개 채널, {months}개월]")
+    if parity_only:
+        return None
+
+    resident = memory_report(dataframes)
+    return {
+        "rows": sum(len(df) for df in dataframes.values()),
+        "setup_s": {"pandas": pandas_setup, "duckdb": duckdb_setup},
+        "p50_ms": {name: percentile(values, 50) * 1000 for name, values in samples.items()},
+        "p95_ms": {name: percentile(values, 95) * 1000 for name, values in samples.items()},
+        "resident_mb": {"pandas": resident["MB"].sum(),
+                        "duckdb": resident[resident["파일"].isin(resident_files)]["MB"].sum()},
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keyword-rows", type=int, nargs="+", default=[200_000, 1_000_000])
+    parser.add_argument("--brands", type=int, default=4)
+    parser.add_argument("--root", default=os.path.join(tempfile.gettempdir(), "dashboard-bench"))
+    parser.add_argument("--parity-only", action="store_true", help="결과 비교만 하고 측정은 생략")
+    args = parser.parse_args()
+
+    print(f"{'행 수':>12} {'준비(s) pandas/duckdb':>22} {'p50(ms) pandas/duckdb':>22} "
+          f"{'p95(ms) pandas/duckdb':>22} {'상주(MB) pandas/duckdb':>22}")
+    for keyword_rows in args.keyword_rows:
+        data_dir = os.path.join(args.root, f"backends-{keyword_rows}", "Data")
+        if any(not os.path.exists(os.path.join(data_dir, file_name)) for file_name in file_links):
+            generate(data_dir, n_brands=args.brands, keyword_rows=keyword_rows)
+        result = run(data_dir, args.parity_only)
+        if result is None:
+            print(f"✅ {keyword_rows:,}행: 두 백엔드 결과 일치")
+            continue
+        pair = lambda values, digits: f"{values['pandas']:.{digits}f} / {values['duckdb']:.{digits}f}"
+        print(f"{result['rows']:>12,} {pair(result['setup_s'], 2):>22} {pair(result['p50_ms'], 1):>22} "
+              f"{pair(result['p95_ms'], 1):>22} {pair(result['resident_mb'], 1):>22}")
+
+
+if __name__ == "__main__":
+    main()
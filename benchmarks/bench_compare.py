@@ -0,0 +1,57 @@
+"""브랜드 비교 벤치마크 - 브랜드마다 큐브를 따로 조회하는 방식 vs compare_brands 한 번 조회
+
+    python -m benchmarks.bench_compare --brands 3 10 50 200
+
+(브랜드 × 채널 × 월) 합성 월별 집계로 큐브를 만들고, 비교 브랜드 수별로 카드 값(합계, 비중,
+전월 대비 증감)을 구하는 시간을 잰다. 두 방식의 결과가 같은지 먼저 확인한다.
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from benchmarks.synthetic import channels
+from dashboard.brands import compare_brands
+from dashboard.config import month_column
+from dashboard.cube import AggregateCube
+
+
+def synthetic_aggregate(n_brands, n_months=24, seed=0):
+    rng = np.random.default_rng(seed)
+    brands = [f"브랜드{i:03d}" for i in range(n_brands)]
+    index = pd.MultiIndex.from_product([range(2023 * 12, 2023 * 12 + n_months), brands, channels],
+                                       names=[month_column, "브랜드", "채널"])
+    return pd.DataFrame({"언급량": rng.integers(0, 5000, len(index))}, index=index).reset_index(), brands
+
+def per_brand(cube, brands, filters, since):
+    """브랜드마다 합계/월별 합계를 따로 조회 (카드 수만큼 큐브 조회)"""
+    rows = []
+    for brand in brands:
+        monthly = cube.frame(["연도-월"], {**filters, "브랜드": brand}, since=since)
+        values = monthly["언급량"].tolist()
+        rows.append((brand, cube.total({**filters, "브랜드": brand}, since=since),
+                     values[-1] if values else 0, values[-2] if len(values) > 1 else 0))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--brands", type=int, nargs="+", default=[3, 10, 50, 200])
+    args = parser.parse_args()
+
+    filters = {"채널": channels[:3]}
+    print(f"{'브랜드 수':>8} {'브랜드별(ms)':>12} {'한 번(ms)':>10} {'배속':>6}")
+    for n_brands in args.brands:
+        aggregate, brands = synthetic_aggregate(n_brands)
+        cube = AggregateCube(aggregate, ["브랜드", "채널"])
+        since = int(aggregate[month_column].max()) - 11
+        expected, per_brand_seconds = best_of(per_brand, cube, brands, filters, since, repeat=20)
+        (comparison, _), single_seconds = best_of(compare_brands, cube, brands, filters, since, repeat=20)
+        per_brand_ms, single_ms = per_brand_seconds * 1000, single_seconds * 1000
+        actual = list(zip(comparison["브랜드"], comparison["합계"], comparison["당월"], comparison["전월"]))
+        assert actual == expected, f"{n_brands}개 브랜드 결과 불일치"
+        print(f"{n_brands:>8} {per_brand_ms:>12.1f} {single_ms:>10.1f} {per_brand_ms / single_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""인코딩 감지 벤치마크 - 전체 파일 chardet(기존 방식) vs 샘플 기반 감지 vs 사이드카 조회
+
+    python -m benchmarks.bench_encoding --size-mb 50 100
+"""
+import argparse
+import os
+import random
+import tempfile
+
+import chardet
+
+from benchmarks.common import best_of
+from dashboard.encoding import detect_encoding, sniff_encoding
+
+brands = ["맥도날드", "버거킹", "롯데리아", "맘스터치", "KFC"]
+channels = ["X(트위터)", "커뮤니티", "네이버 카페", "인스타그램", "블로그"]
+words = ["불고기", "버거", "세트", "감자튀김", "신메뉴", "할인", "배달", "맛있다", "가격", "매장", "콜라", "치즈"]
+
+
+def write_korean_csv(path, size_mb, encoding, seed=0):
+    """연관어 CSV 형식의 한글 데이터를 size_mb 크기까지 생성"""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    with open(path, "w", encoding=encoding, newline="") as f:
+        f.write("날짜,브랜드,채널,연관어,언급량\n")
+        while f.tell() < target:
+            lines = [
+                f"2024-{rng.randint(1, 12):02d}-01,{rng.choice(brands)},{rng.choice(channels)},"
+                f"{rng.choice(words)}{rng.choice(words)},{rng.randint(1, 5000)}\n"
+                for _ in range(10000)
+            ]
+            f.write("".join(lines))
+
+def full_file_chardet(path):
+    """기존 detect_encoding 방식 - 파일 전체를 chardet에 전달"""
+    with open(path, "rb") as f:
+        return chardet.detect(f.read())["encoding"]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, nargs="+", default=[20, 100])
+    parser.add_argument("--encodings", nargs="+", default=["cp949", "utf-8-sig"])
+    parser.add_argument("--skip-full", action="store_true", help="전체 파일 chardet 측정 생략 (대용량에서 매우 느림)")
+    args = parser.parse_args()
+
+    print(f"{'크기':>8} {'인코딩':>10} | {'전체 chardet':>14} {'샘플 감지':>10} {'감지+사이드카':>14} {'사이드카 조회':>14}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.size_mb:
+            for encoding in args.encodings:
+                path = os.path.join(tmp_dir, f"keyword_{size_mb}mb_{encoding}.csv")
+                write_korean_csv(path, size_mb, encoding)
+                if args.skip_full:
+                    full = "-"
+                else:
+                    detected, seconds = best_of(full_file_chardet, path)
+                    full = f"{seconds:.3f}s ({detected})"
+                sniffed, sniff_seconds = best_of(sniff_encoding, path)
+                _, cold_seconds = best_of(detect_encoding, path)
+                _, warm_seconds = best_of(detect_encoding, path)
+                print(f"{size_mb:>6}MB {encoding:>10} | {full:>14} {sniff_seconds:>9.4f}s "
+                      f"{cold_seconds:>13.3f}s {warm_seconds:>13.3f}s  → {sniffed}")
+                os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
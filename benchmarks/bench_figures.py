@@ -0,0 +1,117 @@
+"""그래프 벤치마크 - 3번 탭 키워드 격자: 기존 make_subplots + 셀별 루프 vs small_multiples 일괄 생성
+
+    python -m benchmarks.bench_figures
+    python -m benchmarks.bench_figures --keywords 12 60 120 --months 24
+
+두 방식이 같은 그림(트레이스, 축 영역/설정, 제목 위치)을 만드는지 먼저 확인한 뒤 생성 시간과
+JSON 직렬화 시간을 비교한다.
+"""
+import argparse
+import math
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from dashboard.config import month_column
+from dashboard.figures import small_multiples
+from dashboard.schema import month_key
+
+xaxis = dict(type="date", dtick="M1", tickformat="%y-%m", showgrid=False, tickangle=-45,
+             tickfont=dict(color="white", size=10))
+yaxis = dict(showgrid=False, gridcolor="#d3d3d3", gridwidth=0.1, tickfont=dict(color="white"), tickformat="~s")
+layout = dict(height=800, width=1800, title_text="", title_x=0.5, showlegend=False, plot_bgcolor="#0e1117",
+              paper_bgcolor="#0e1117", font=dict(color="white"), margin=dict(l=40, r=40, t=60, b=40))
+
+
+def keyword_series(n_keywords, n_months, seed=0):
+    """KeywordRanking.series 형태 (연관어, 월 키, 언급량) - 월 오름차순, 일부 키워드는 빠진 달이 있음"""
+    rng = np.random.default_rng(seed)
+    keywords = np.array([f"키워드{i}" for i in range(n_keywords)], dtype=object)
+    first = month_key("2023-01-01")
+    month, keyword = np.meshgrid(np.arange(first, first + n_months), np.arange(n_keywords), indexing="ij")
+    keep = rng.random(month.size) > 0.1
+    return pd.DataFrame({
+        "연관어": keywords[keyword.ravel()[keep]],
+        month_column: month.ravel()[keep].astype(np.int16),
+        "언급량": rng.integers(1, 50_000, keep.sum()),
+    }), list(keywords)
+
+def legacy_grid(series, keywords, rows, cols):
+    """기존 app.py 방식 - 키워드마다 전체 스캔 + 날짜 파싱, 셀마다 update_xaxes/update_yaxes"""
+    import plotly.graph_objects as go
+    import plotly.subplots as sp
+
+    series = series.assign(**{"연도-월": pd.to_datetime(series[month_column].astype(int).map(
+        lambda key: f"{key // 12}-{key % 12 + 1:02d}-01")).dt.strftime("%Y-%m")})
+    fig = sp.make_subplots(rows=rows, cols=cols, subplot_titles=[f"<b>{keyword}</b>" for keyword in keywords[:rows * cols]])
+    r, c = 1, 1
+    for keyword in keywords[:rows * cols]:
+        keyword_data = series[series["연관어"] == keyword]
+        x_values = pd.to_datetime(keyword_data["연도-월"] + "-01")
+        fig.add_trace(go.Bar(x=x_values, y=keyword_data["언급량"], name=keyword, marker_color="#4B0082"), row=r, col=c)
+        c += 1
+        if c > cols:
+            c = 1
+            r += 1
+    fig.update_layout(**layout)
+    for i in range(1, rows * cols + 1):
+        fig.update_yaxes(row=(i - 1) // cols + 1, col=(i - 1) % cols + 1, **yaxis)
+        fig.update_xaxes(row=(i - 1) // cols + 1, col=(i - 1) % cols + 1, **xaxis)
+    return fig
+
+def batched_grid(series, keywords, rows, cols):
+    return small_multiples(series, keywords, "연관어", "언급량", rows=rows, cols=cols,
+                           trace=dict(marker=dict(color="#4B0082")), xaxis=xaxis, yaxis=yaxis, layout=layout)
+
+def same_figure(left, right):
+    """트레이스 값과 레이아웃이 같은지 (영역 좌표는 부동소수점 오차 허용)"""
+    left, right = left.to_plotly_json(), right.to_plotly_json()
+    if len(left["data"]) != len(right["data"]):
+        return False
+    for a, b in zip(left["data"], right["data"]):
+        if a["name"] != b["name"] or a["marker"] != b["marker"]:
+            return False
+        if not (np.array_equal(pd.to_datetime(a["x"]), pd.to_datetime(b["x"])) and np.array_equal(a["y"], b["y"])):
+            return False
+    for key, value in left["layout"].items():
+        if key == "template":
+            continue
+        if not close(value, right["layout"].get(key)):
+            return False
+    return left["layout"].keys() == right["layout"].keys()
+
+def close(a, b):
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(close(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return isinstance(b, (list, tuple)) and len(a) == len(b) and all(close(x, y) for x, y in zip(a, b))
+    if isinstance(a, float):
+        return isinstance(b, (int, float)) and math.isclose(a, b, abs_tol=1e-9)
+    return a == b
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keywords", type=int, nargs="+", default=[12, 60])
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--vocabulary", type=int, default=200, help="시계열에 들어 있는 키워드 수")
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    series, vocabulary = keyword_series(max(args.vocabulary, *args.keywords), args.months)
+    print(f"시계열 행 수: {len(series):,}  ({args.months}개월)")
+    print(f"{'키워드':>6} {'기존':>10} {'일괄':>10} {'배속':>7} {'기존+JSON':>11} {'일괄+JSON':>11}")
+    for n in args.keywords:
+        keywords, rows = vocabulary[:n], math.ceil(n / args.cols)
+        legacy, legacy_seconds = best_of(legacy_grid, series, keywords, rows, args.cols, repeat=args.repeat)
+        batched, batched_seconds = best_of(batched_grid, series, keywords, rows, args.cols, repeat=args.repeat)
+        assert same_figure(legacy, batched), f"{n}개 키워드 그림이 다름"
+        _, legacy_json = best_of(lambda: legacy_grid(series, keywords, rows, args.cols).to_json(), repeat=args.repeat)
+        _, batched_json = best_of(lambda: batched_grid(series, keywords, rows, args.cols).to_json(), repeat=args.repeat)
+        print(f"{n:>6} {legacy_seconds * 1000:>8.1f}ms {batched_seconds * 1000:>8.1f}ms "
+              f"{legacy_seconds / batched_seconds:>6.1f}x {legacy_json * 1000:>9.1f}ms {batched_json * 1000:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
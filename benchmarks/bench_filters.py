@@ -0,0 +1,90 @@
+"""필터 벤치마크 - 기존 boolean mask 필터 vs (브랜드, 월) 정렬 인덱스, 키워드 순위 증분 반영(extend) vs 전체 재구성
+
+    python -m benchmarks.bench_filters --rows 10000000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from dashboard.config import month_column
+from dashboard.filters import FrameIndex, sort_for_index
+from dashboard.ranking import KeywordRanking
+from dashboard.schema import month_keys
+
+channels = ["X(트위터)", "커뮤니티", "네이버 카페", "다음 카페", "인스타그램", "유튜브", "블로그", "티스토리"]
+
+
+def keyword_frame(rows, n_brands, n_keywords, n_months, seed=0):
+    """05.Keyword_Monthly.csv 형태의 데이터프레임을 메모리에서 바로 생성 (CSV 파일 순서처럼 월 순으로 정렬)"""
+    rng = np.random.default_rng(seed)
+    brands = [f"브랜드{i:02d}" for i in range(n_brands)]
+    months = pd.date_range("2020-01-01", periods=n_months, freq="MS")
+    month_codes = np.sort(rng.integers(0, n_months, rows))
+    df = pd.DataFrame({
+        "날짜": months[month_codes],
+        month_column: month_keys(months[month_codes]),
+        "브랜드": pd.Categorical.from_codes(rng.integers(0, n_brands, rows), brands),
+        "채널": pd.Categorical.from_codes(rng.integers(0, len(channels), rows), channels),
+        "연관어": pd.Categorical.from_codes(rng.integers(0, n_keywords, rows), [f"키워드{i}" for i in range(n_keywords)]),
+        "언급량": rng.integers(1, 5000, rows),
+    })
+    return df, brands, months
+
+def mask_filter(df, brand, selected_channels, since):
+    """app.py의 기존 필터 방식"""
+    return df[(df["브랜드"] == brand) & (df["채널"].isin(selected_channels)) & (df["날짜"] >= since)]
+
+def check_extend(index, brand, selected_channels, months, repeat):
+    """마지막 달을 extend로 추가한 순위가 전체 재구성과 같은지 확인하고 두 방식의 시간 비교"""
+    df = index.query(brand, selected_channels)
+    old, new = df[df["날짜"] < months[-1]], df[df["날짜"] >= months[-1]]
+    base = KeywordRanking(old, "연관어", "언급량")
+    expected, rebuild_seconds = best_of(KeywordRanking, df, "연관어", "언급량", repeat=repeat)
+    result, extend_seconds = best_of(base.extended, new, repeat=repeat)
+    for since in [None, months[-3], months[-1]]:
+        keywords = expected.top_keywords(since)
+        assert result.top_keywords(since) == keywords
+        assert result.wide_table(since).equals(expected.wide_table(since))
+        assert result.series(keywords[:12], since).equals(expected.series(keywords[:12], since))
+    assert len(base.months) == len(KeywordRanking(old, "연관어", "언급량").months)  # 원본 인덱스는 그대로
+    print(f"\n키워드 순위 마지막 달 반영 ({len(df):,}행 중 {len(new):,}행): 전체 재구성 {rebuild_seconds * 1000:.1f}ms, "
+          f"extend {extend_seconds * 1000:.1f}ms ({rebuild_seconds / extend_seconds:.0f}x, 결과 동일)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--brands", type=int, default=30)
+    parser.add_argument("--keywords", type=int, default=200_000)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df, brands, months = keyword_frame(args.rows, args.brands, args.keywords, args.months)
+    print(f"행 수: {len(df):,}  메모리: {df.memory_usage(deep=True).sum() / 1e6:,.0f}MB")
+
+    build_start = time.perf_counter()
+    index = FrameIndex(sort_for_index(df))
+    print(f"인덱스 구성 (정렬 포함, 1회): {time.perf_counter() - build_start:.3f}s\n")
+
+    cases = [
+        ("전체 채널, 24개월", channels, months[-24]),
+        ("5개 채널, 12개월", channels[:5], months[-12]),
+        ("2개 채널, 3개월", channels[:2], months[-3]),
+    ]
+    print(f"{'조건':<20} {'mask':>10} {'index':>10} {'배속':>8} {'행 수':>10}")
+    for label, selected_channels, since in cases:
+        brand = brands[len(brands) // 2]
+        expected, mask_seconds = best_of(mask_filter, df, brand, selected_channels, since, repeat=args.repeat)
+        result, index_seconds = best_of(index.query, brand, selected_channels, since, repeat=args.repeat)
+        assert len(expected) == len(result) and expected["언급량"].sum() == result["언급량"].sum()
+        print(f"{label:<20} {mask_seconds * 1000:>8.1f}ms {index_seconds * 1000:>8.2f}ms "
+              f"{mask_seconds / index_seconds:>7.0f}x {len(result):>10,}")
+
+    check_extend(index, brands[len(brands) // 2], channels[:5], months, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""메모리 벤치마크 - 기존 방식(문자열 object 컬럼 + int64 + '연도-월' 문자열) vs 압축 스키마
+
+    python -m benchmarks.bench_memory --keyword-rows 5000000
+    python -m benchmarks.bench_memory --data-dir Data --columns
+
+기존 방식은 app.py의 원래 load_data처럼 CSV를 그대로 읽어 날짜 변환과 strftime만 적용하고,
+압축 스키마는 load_dataframes 결과(공유 범주 사전, 다운캐스트 정수, int16 월 키)를 측정한다.
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from benchmarks.synthetic import generate
+from dashboard.config import date_formats, file_links, string_columns
+from dashboard.data import load_dataframes
+from dashboard.encoding import detect_encoding
+from dashboard.schema import memory_report
+
+
+def legacy_frame(file_name, file_path):
+    """압축 전 표현 - 범주형 없이 object 문자열, int64, '연도-월' 문자열 컬럼"""
+    df = pd.read_csv(file_path, encoding=detect_encoding(file_path))
+    date_format = date_formats.get(file_name)
+    if date_format and "날짜" in df.columns:
+        df["날짜"] = pd.to_datetime(df["날짜"], format=date_format, errors="coerce")
+        df["연도-월"] = df["날짜"].dt.strftime("%Y-%m").astype(object)
+    for column in df.columns:
+        if not pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].astype(object)
+    for column in string_columns.get(file_name, []):
+        df[column] = df[column].astype(str).astype(object)
+    return df
+
+def totals(report):
+    return report.groupby("파일", sort=False)["MB"].sum()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "dashboard-bench", "Data"))
+    parser.add_argument("--keyword-rows", type=int, default=1_000_000, help="데이터가 없을 때 생성할 05 파일 행 수")
+    parser.add_argument("--columns", action="store_true", help="컬럼별 상세 출력")
+    args = parser.parse_args()
+
+    if any(not os.path.exists(os.path.join(args.data_dir, file_name)) for file_name in file_links):
+        print(f"합성 데이터 생성 중 ({args.keyword_rows:,}행) → {args.data_dir}")
+        generate(args.data_dir, keyword_rows=args.keyword_rows)
+
+    before = memory_report({file_name: legacy_frame(file_name, os.path.join(args.data_dir, file_name))
+                            for file_name in file_links})
+    dataframes, errors = load_dataframes(args.data_dir)
+    if errors:
+        raise RuntimeError(f"로드 실패: {errors}")
+    after = memory_report(dataframes)
+
+    summary = pd.DataFrame({"기존(MB)": totals(before), "압축(MB)": totals(after)}).fillna(0)
+    summary.loc["합계"] = summary.sum()
+    summary["비율"] = summary["압축(MB)"] / summary["기존(MB)"]
+    print(summary.round(2).to_string())
+    if args.columns:
+        for label, report in [("기존", before), ("압축", after)]:
+            print(f"\n[{label}]")
+            print(report.round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
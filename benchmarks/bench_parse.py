@@ -0,0 +1,72 @@
+"""병렬 적재 벤치마크 - CSV 엔진(c vs pyarrow)과 작업 프로세스 수별 콜드 적재(CSV → 스냅샷) 시간
+
+    python -m benchmarks.bench_parse --keyword-rows 1000000 5000000 --workers 1 4 16
+
+규모마다 합성 데이터를 만들고, 가장 큰 05 파일 하나를 두 엔진으로 읽는 시간과 8개 파일 전체를
+스냅샷으로 적재하는 시간을 작업 프로세스 수별로 잰다. 적재 결과(로드한 데이터프레임)는
+단일 프로세스 적재와 같은지 먼저 확인한다.
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import generate
+from dashboard.config import file_links, parse_chunk_mb
+from dashboard.data import load_dataframes
+from dashboard.encoding import detect_encoding
+from dashboard.ingest import ingest_files
+from dashboard.snapshot import snapshot_dir
+
+
+def read_seconds(path, engine):
+    encoding = detect_encoding(path)
+    start = time.perf_counter()
+    pd.read_csv(path, encoding=encoding, engine=engine, dtype={"날짜": "str"})
+    return time.perf_counter() - start
+
+def cold_ingest(data_dir, workers, chunk_bytes):
+    """스냅샷을 지우고 전체 적재 → (초, 로드한 데이터프레임)"""
+    for file_name in file_links:
+        shutil.rmtree(snapshot_dir(file_name, data_dir), ignore_errors=True)
+    start = time.perf_counter()
+    _, errors = ingest_files(file_links, data_dir, workers=workers, chunk_bytes=chunk_bytes)
+    seconds = time.perf_counter() - start
+    if errors:
+        raise RuntimeError(f"적재 실패: {errors}")
+    return seconds, load_dataframes(data_dir)[0]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keyword-rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--chunk-mb", type=int, default=parse_chunk_mb)
+    parser.add_argument("--root", default=os.path.join(tempfile.gettempdir(), "dashboard-bench"))
+    args = parser.parse_args()
+
+    for keyword_rows in args.keyword_rows:
+        data_dir = os.path.join(args.root, f"parse-{keyword_rows}", "Data")
+        if any(not os.path.exists(os.path.join(data_dir, file_name)) for file_name in file_links):
+            generate(data_dir, keyword_rows=keyword_rows)
+        csv_mb = sum(os.path.getsize(os.path.join(data_dir, file_name)) for file_name in file_links) / 1e6
+        keyword_path = os.path.join(data_dir, "05.Keyword_Monthly.csv")
+        print(f"## {keyword_rows:,}행 ({csv_mb:.0f}MB)")
+        print(f"05 read_csv  c: {read_seconds(keyword_path, 'c'):.2f}s  pyarrow: {read_seconds(keyword_path, 'pyarrow'):.2f}s")
+
+        baseline = None
+        for workers in args.workers:
+            seconds, dataframes = cold_ingest(data_dir, workers, args.chunk_mb * 1024 * 1024)
+            if baseline is None:
+                baseline = (seconds, dataframes)
+            else:
+                for file_name in file_links:
+                    pd.testing.assert_frame_equal(baseline[1][file_name], dataframes[file_name])
+            print(f"적재 {workers:>3}개 프로세스: {seconds:6.2f}s  ({csv_mb / seconds:.0f}MB/s, "
+                  f"{baseline[0] / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
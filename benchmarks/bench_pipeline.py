@@ -0,0 +1,229 @@
+"""파이프라인 벤치마크 - 합성 데이터로 로드 → 필터 → 집계 → 변환 → 그래프 생성을 헤드리스로 측정
+
+    python -m benchmarks.bench_pipeline --keyword-rows 5000000 --save benchmarks/results/before.json
+    python -m benchmarks.bench_pipeline --keyword-rows 5000000 --compare benchmarks/results/before.json
+
+브랜드 × 채널 조합 × 기간 선택 그리드를 돌며 단계별 p50/p95, 처리량, 최대 RSS를 측정하고
+같은 형식의 JSON으로 저장한다. --compare로 이전 결과와 비교하면 p95가 --tolerance 이상
+느려진 단계를 표시하고 종료 코드 1을 반환한다.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.synthetic import card_brands, channels, generate
+from dashboard.brands import compare_brands
+from dashboard.config import file_links, month_column
+from dashboard.data import load_cubes, load_dataframes, load_indexes
+from dashboard.figures import small_multiples
+from dashboard.encoding import sidecar_name
+from dashboard.profiling import percentile
+from dashboard.ranking import KeywordRanking
+from dashboard.snapshot import snapshot_dir
+
+# ✅ 선택 그리드 (채널 조합, 기간 개월 수)
+channel_sets = {
+    "전체 채널": channels,
+    "기본 5개": ["X(트위터)", "커뮤니티", "네이버 카페", "인스타그램", "블로그"],
+    "2개": ["X(트위터)", "블로그"],
+}
+period_months = [3, 6, 12, 24]
+
+
+class Timings:
+    """단계별 측정값 누적"""
+
+    def __init__(self):
+        self.samples = {}
+
+    def measure(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.samples.setdefault(name, []).append(time.perf_counter() - start)
+        return result
+
+    def summary(self):
+        return {name: {"count": len(values),
+                       "p50_ms": round(percentile(values, 50) * 1000, 3),
+                       "p95_ms": round(percentile(values, 95) * 1000, 3),
+                       "mean_ms": round(sum(values) / len(values) * 1000, 3)}
+                for name, values in self.samples.items()}
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (리눅스는 KB, macOS는 바이트 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def git_version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def filter_frames(indexes, brand, selected_channels, since):
+    """키워드 파일 필터링 → {파일명: (데이터프레임, 키워드 컬럼, 값 컬럼)}"""
+    return {
+        "05.Keyword_Monthly.csv": (indexes["05.Keyword_Monthly.csv"].query(brand, selected_channels, since), "연관어", "언급량"),
+        "06.Search_Keyword_Monthly.csv": (indexes["06.Search_Keyword_Monthly.csv"].query(brand, since=since), "키워드", "검색량"),
+        "07.Sentiment_Keyword_Monthly.csv": (indexes["07.Sentiment_Keyword_Monthly.csv"].query(brand, selected_channels, since), "연관어", "언급량"),
+    }
+
+def aggregate(cubes, brand, selected_channels, since, brands):
+    """1·2번 탭 카드/추이 그래프 집계"""
+    buzz_cube = cubes["01.Social_Buzz_Monthly.csv"]
+    search_cube = cubes["02.SearchVolume_Monthly.csv"]
+    sentiment_cube = cubes["04.Sentiment_Buzz_Monthly.csv"]
+    return {
+        "buzz_monthly": buzz_cube.frame(["연도-월", "채널"], {"브랜드": brand, "채널": selected_channels}, since=since),
+        "brand_mentions": compare_brands(buzz_cube, brands, {"채널": selected_channels}, since=since),
+        "sentiment_monthly": sentiment_cube.frame(["연도-월", "채널", "감성"], {"브랜드": brand, "채널": selected_channels}, since=since),
+        "search_monthly": search_cube.frame(["연도-월"], {"브랜드": brand}, since=since),
+        "brand_search": compare_brands(search_cube, brands, since=since),
+    }
+
+def transform(filtered, since):
+    """키워드 순위 인덱스 구성 → 월별 상위 100 테이블 + 3번 탭 1~12위 시계열"""
+    tables = {}
+    for file_name, (df, keyword_column, value_column) in filtered.items():
+        ranking = KeywordRanking(df, keyword_column, value_column)
+        keywords = ranking.top_keywords(since, 1, 12) if ranking.has_data(since) else []
+        tables[file_name] = (ranking.wide_table(since), keywords, ranking.series(keywords, since))
+    return tables
+
+def build_figures(aggregates, tables):
+    """앱과 같은 plotly 그래프 생성 (직렬화 포함)"""
+    import plotly.express as px
+
+    figures = [
+        px.bar(aggregates["buzz_monthly"], x="연도-월", y="언급량", color="채널", barmode="stack"),
+        px.bar(aggregates["sentiment_monthly"], x="연도-월", y="언급량", color="감성", barmode="stack"),
+        px.bar(aggregates["search_monthly"], x="연도-월", y="검색량", barmode="group"),
+    ]
+    _, keywords, series = tables["05.Keyword_Monthly.csv"]
+    if keywords:
+        figures.append(small_multiples(series, keywords, "연관어", "언급량", rows=4, cols=3,
+                                       xaxis=dict(type="date", dtick="M1", tickformat="%y-%m"),
+                                       yaxis=dict(tickformat="~s")))
+    return [fig.to_json() for fig in figures]
+
+def run(data_dir, repeat=1):
+    timings = Timings()
+    # 콜드 로드 (인코딩 감지 + CSV 파싱 + 스냅샷 생성) → 웜 로드 (스냅샷 메모리 매핑)
+    for file_name in file_links:
+        shutil.rmtree(snapshot_dir(file_name, data_dir), ignore_errors=True)
+    if os.path.exists(os.path.join(data_dir, sidecar_name)):
+        os.remove(os.path.join(data_dir, sidecar_name))
+    dataframes, errors = timings.measure("load_cold", load_dataframes, data_dir)
+    if errors:
+        raise RuntimeError(f"로드 실패: {errors}")
+    dataframes, _ = timings.measure("load_warm", load_dataframes, data_dir)
+    rows = sum(len(df) for df in dataframes.values())
+    csv_bytes = sum(os.path.getsize(os.path.join(data_dir, file_name)) for file_name in file_links)
+    cubes = timings.measure("build_cubes", load_cubes, data_dir)
+    indexes = timings.measure("build_indexes", load_indexes, dataframes)
+
+    df_buzz = dataframes["01.Social_Buzz_Monthly.csv"]
+    brands = [brand for brand in card_brands if brand in set(df_buzz["브랜드"])]
+    latest_month = int(df_buzz[month_column].max())
+    grid = list(itertools.product(brands, channel_sets.items(), period_months))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for brand, (_, selected_channels), months in grid:
+            since = latest_month - (months - 1)
+            filtered = timings.measure("filter", filter_frames, indexes, brand, selected_channels, since)
+            aggregates = timings.measure("aggregate", aggregate, cubes, brand, selected_channels, since, brands)
+            tables = timings.measure("transform", transform, filtered, since)
+            timings.measure("figure", build_figures, aggregates, tables)
+    grid_seconds = time.perf_counter() - start
+    selections = len(grid) * repeat
+
+    stages = timings.summary()
+    return {
+        "version": git_version(),
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "rows": rows,
+        "csv_mb": round(csv_bytes / 1e6, 1),
+        "selections": selections,
+        "stages": stages,
+        "throughput": {
+            "load_cold_rows_per_s": round(rows / (stages["load_cold"]["mean_ms"] / 1000)),
+            "load_cold_mb_per_s": round(csv_bytes / 1e6 / (stages["load_cold"]["mean_ms"] / 1000), 1),
+            "selections_per_s": round(selections / grid_seconds, 2),
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def print_result(result):
+    print(f"버전 {result['version']}  행 {result['rows']:,}  CSV {result['csv_mb']}MB  선택 {result['selections']}회")
+    print(f"{'단계':<16} {'횟수':>5} {'p50(ms)':>10} {'p95(ms)':>10}")
+    for name, stage in result["stages"].items():
+        print(f"{name:<16} {stage['count']:>5} {stage['p50_ms']:>10.2f} {stage['p95_ms']:>10.2f}")
+    for name, value in result["throughput"].items():
+        print(f"{name:<24} {value:>12,}")
+    print(f"{'peak_rss_mb':<24} {result['peak_rss_mb']:>12,}")
+
+def compare(result, baseline, tolerance):
+    """단계별 p95 비교 - tolerance보다 느려진 단계 목록"""
+    regressions = []
+    print(f"\n{'단계':<16} {'기준 p95':>10} {'현재 p95':>10} {'비율':>7}   (기준 {baseline.get('version')})")
+    for name, stage in result["stages"].items():
+        base = baseline["stages"].get(name)
+        if not base or not base["p95_ms"]:
+            continue
+        ratio = stage["p95_ms"] / base["p95_ms"]
+        flag = " ⚠️" if ratio > 1 + tolerance else ""
+        print(f"{name:<16} {base['p95_ms']:>10.2f} {stage['p95_ms']:>10.2f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    rss_ratio = result["peak_rss_mb"] / baseline["peak_rss_mb"]
+    print(f"{'peak_rss_mb':<16} {baseline['peak_rss_mb']:>10.1f} {result['peak_rss_mb']:>10.1f} {rss_ratio:>6.2f}x")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "dashboard-bench", "Data"))
+    parser.add_argument("--keyword-rows", type=int, default=1_000_000, help="데이터가 없거나 --regenerate일 때 생성할 05 파일 행 수")
+    parser.add_argument("--brands", type=int, default=4)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1, help="선택 그리드 반복 횟수")
+    parser.add_argument("--save", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="p95 회귀 허용 비율")
+    args = parser.parse_args()
+
+    missing = any(not os.path.exists(os.path.join(args.data_dir, file_name)) for file_name in file_links)
+    if args.regenerate or missing:
+        print(f"합성 데이터 생성 중 ({args.keyword_rows:,}행) → {args.data_dir}")
+        generate(args.data_dir, n_brands=args.brands, keyword_rows=args.keyword_rows)
+
+    result = run(args.data_dir, args.repeat)
+    print_result(result)
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or ".", exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n⚠️ p95 회귀: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
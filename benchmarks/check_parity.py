@@ -0,0 +1,257 @@
+"""결과 검증 - 큐브/필터 인덱스/키워드 순위(duckdb가 설치되어 있으면 SQL 백엔드도)를 원본 CSV의 단순 pandas 계산과 비교
+
+    python -m benchmarks.check_parity
+    python -m benchmarks.check_parity --data-dir Data
+
+벤치마크 하네스나 대시보드의 변환 코드를 거치지 않고 원본 CSV를 pd.read_csv로 다시 읽어, 기존 app.py와
+같은 방식(불리언 마스크 → groupby().sum(), 월별 정렬 후 head(100), nlargest)으로 기대값을 만든다.
+브랜드 × 채널 조합 × 기간 선택마다 1·2번 탭 집계, 필터 결과, 월별 상위 100 테이블, 기간 순위 키워드,
+3번 탭 시계열을 비교하고 하나라도 다르면 차이를 출력한 뒤 종료 코드 1을 반환한다.
+같은 값의 키워드는 키워드 정렬 순서로 순위를 매긴다 (기존 정렬 + head(100)과 같음).
+--data-dir에 CSV가 없으면 합성 데이터를 만든다.
+"""
+import argparse
+import importlib.util
+import itertools
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from benchmarks.synthetic import card_brands, generate
+from dashboard.config import date_formats, file_links, indexed_files, keyword_columns, month_column
+from dashboard.data import load_cubes, load_dataframes, load_indexes
+from dashboard.ranking import KeywordRanking
+from dashboard.schema import month_labels
+
+raw_encodings = ["utf-8-sig", "cp949"]
+period_months = [3, 6, 12, 24]
+sentiments = ["긍정", "부정", "중립"]
+max_reported = 20
+
+
+def read_raw(file_path, date_format=None):
+    """원본 CSV를 그대로 읽고 기존 app.py처럼 날짜/연도-월 컬럼 추가"""
+    for encoding in raw_encodings:
+        try:
+            df = pd.read_csv(file_path, encoding=encoding)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError(f"{file_path}: 인코딩을 확인할 수 없습니다 ({', '.join(raw_encodings)})")
+    if date_format is not None and "날짜" in df.columns:
+        df["날짜"] = pd.to_datetime(df["날짜"], format=date_format, errors="coerce")
+        df["연도-월"] = df["날짜"].dt.strftime("%Y-%m")
+    return df
+
+def selected(raw, brand=None, channels=None, since=None, sentiment=None):
+    """기존 app.py의 불리언 마스크 필터 (since는 '연도-월' 문자열)"""
+    mask = pd.Series(True, index=raw.index)
+    if brand is not None:
+        mask &= raw["브랜드"].isin([brand] if isinstance(brand, str) else brand)
+    if channels is not None:
+        mask &= raw["채널"].isin(channels)
+    if since is not None:
+        mask &= raw["연도-월"] >= since
+    if sentiment is not None:
+        mask &= raw["감성"] == sentiment
+    return raw[mask]
+
+def expected_frame(df, by, value_column):
+    return df.groupby(by)[value_column].sum().reset_index()
+
+def expected_monthly_top(df, keyword_column, value_column, top_n=100):
+    """월별 상위 top_n → {연도-월: [(키워드, 값), ...]}"""
+    grouped = df.groupby(["연도-월", keyword_column])[value_column].sum().reset_index()
+    grouped = grouped.sort_values(by=["연도-월", value_column], ascending=[True, False], kind="stable")
+    grouped = grouped.groupby("연도-월").head(top_n)
+    return {month: list(zip(rows[keyword_column], rows[value_column].astype(int)))
+            for month, rows in grouped.groupby("연도-월", sort=True)}
+
+def table_monthly_top(wide, keyword_column, value_column):
+    """월별 와이드 테이블 → {연도-월: [(키워드, 값), ...]}"""
+    if wide.empty:
+        return {}
+    months = dict.fromkeys(wide.columns.get_level_values(0))
+    return {month: [(keyword, int(value)) for keyword, value in zip(wide[(month, keyword_column)], wide[(month, value_column)])
+                    if not pd.isna(keyword)]
+            for month in months}
+
+def expected_top_keywords(df, keyword_column, value_column, start_rank, end_rank):
+    if df.empty:
+        return []
+    totals = df.groupby(keyword_column)[value_column].sum()
+    return list(totals.nlargest(end_rank).iloc[start_rank - 1:end_rank].index)
+
+
+def first_difference(expected, actual):
+    """처음 다른 위치 설명 (월별 사전/목록은 해당 월과 순위만)"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in sorted(set(expected) | set(actual)):
+            if expected.get(key) != actual.get(key):
+                return f"{key} {first_difference(expected.get(key), actual.get(key))}"
+    if isinstance(expected, list) and isinstance(actual, list):
+        for rank, (left, right) in enumerate(itertools.zip_longest(expected, actual), start=1):
+            if left != right:
+                return f"{rank}위: 기대 {left!r} / 결과 {right!r}"
+    return f"기대 {expected!r} / 결과 {actual!r}"
+
+
+class Checker:
+    """비교 결과 누적 - 다른 항목은 설명과 함께 보관"""
+
+    def __init__(self):
+        self.count = 0
+        self.mismatches = []
+
+    def frames(self, context, expected, actual):
+        self.count += 1
+        try:
+            pd.testing.assert_frame_equal(expected.reset_index(drop=True), actual.reset_index(drop=True),
+                                          check_dtype=False, check_column_type=False, check_index_type=False,
+                                          check_categorical=False)
+        except AssertionError as e:
+            self.mismatches.append(f"{context}: {e}")
+
+    def values(self, context, expected, actual):
+        self.count += 1
+        if expected != actual:
+            self.mismatches.append(f"{context}: {first_difference(expected, actual)}")
+
+
+def pandas_backend(data_dir):
+    dataframes, errors = load_dataframes(data_dir)
+    if errors:
+        raise RuntimeError(f"로드 실패: {errors}")
+    indexes = load_indexes(dataframes)
+
+    def ranking(file_name, brand, channels, sentiment):
+        df = indexes[file_name].query(brand, channels)
+        if sentiment is not None:
+            df = df[df["감성"] == sentiment]
+        return KeywordRanking(df, *keyword_columns[file_name])
+    return load_cubes(data_dir), indexes, ranking
+
+def duckdb_backend(data_dir):
+    from dashboard.sql import SqlRanking, open_engine, sql_cubes, sql_indexes
+
+    engine, errors = open_engine(data_dir)
+    if errors:
+        raise RuntimeError(f"엔진 준비 실패: {errors}")
+
+    def ranking(file_name, brand, channels, sentiment):
+        return SqlRanking(engine, file_name, brand, channels, sentiment)
+    return sql_cubes(engine), sql_indexes(engine), ranking
+
+def check_aggregates(checker, context, raw, cubes, brand, channels, since, since_label):
+    buzz, search, sentiment = (raw["01.Social_Buzz_Monthly.csv"], raw["02.SearchVolume_Monthly.csv"],
+                               raw["04.Sentiment_Buzz_Monthly.csv"])
+    cases = [
+        ("01 추이", "01.Social_Buzz_Monthly.csv", ["연도-월", "채널"], {"브랜드": brand, "채널": channels},
+         selected(buzz, brand, channels, since_label)),
+        ("01 카드", "01.Social_Buzz_Monthly.csv", ["브랜드"], {"브랜드": card_brands, "채널": channels},
+         selected(buzz, card_brands, channels, since_label)),
+        ("04 추이", "04.Sentiment_Buzz_Monthly.csv", ["연도-월", "채널", "감성"], {"브랜드": brand, "채널": channels},
+         selected(sentiment, brand, channels, since_label)),
+        ("02 추이", "02.SearchVolume_Monthly.csv", ["연도-월"], {"브랜드": brand}, selected(search, brand, since=since_label)),
+        ("02 카드", "02.SearchVolume_Monthly.csv", ["브랜드"], {"브랜드": card_brands},
+         selected(search, card_brands, since=since_label)),
+    ]
+    for label, file_name, by, filters, df in cases:
+        cube = cubes[file_name]
+        checker.frames(f"{context} {label}", expected_frame(df, by, cube.value_column), cube.frame(by, filters, since))
+        checker.values(f"{context} {label} 합계", int(df[cube.value_column].sum()), cube.total(filters, since))
+
+def check_indexes(checker, context, raw, indexes, brand, channels, since, since_label):
+    """필터 결과의 행 수와 값 합계"""
+    for file_name, index in indexes.items():
+        df = raw[file_name]
+        use_channels = channels if "채널" in df.columns else None
+        use_since = since if "연도-월" in df.columns else None
+        expected = selected(df, brand, use_channels, since_label if use_since is not None else None)
+        result = index.query(brand, use_channels, use_since)
+        value_column = next(column for column in ["언급량", "검색량"] if column in df.columns)
+        checker.values(f"{context} {file_name} 필터", (len(expected), int(expected[value_column].sum())),
+                       (len(result), int(result[value_column].sum())))
+
+def check_rankings(checker, context, raw, build_ranking, brand, channels, since, since_label):
+    for file_name, (keyword_column, value_column) in keyword_columns.items():
+        df = raw[file_name]
+        use_channels = channels if "채널" in df.columns else None
+        for sentiment in sentiments if "감성" in df.columns else [None]:
+            label = f"{context} {file_name}{f' {sentiment}' if sentiment else ''}"
+            expected = selected(df, brand, use_channels, since_label, sentiment)
+            ranking = build_ranking(file_name, brand, use_channels, sentiment)
+            checker.values(f"{label} 월별 상위 100", expected_monthly_top(expected, keyword_column, value_column),
+                           table_monthly_top(ranking.wide_table(since), keyword_column, value_column))
+
+            has_data = ranking.has_data(since)
+            for start_rank, end_rank in [(1, 12), (13, 24)]:
+                checker.values(f"{label} 기간 순위 {start_rank}~{end_rank}위",
+                               expected_top_keywords(expected, keyword_column, value_column, start_rank, end_rank),
+                               ranking.top_keywords(since, start_rank, end_rank) if has_data else [])
+
+            keywords = expected_top_keywords(expected, keyword_column, value_column, 1, 12)
+            series = ranking.series(keywords, since)
+            series = pd.DataFrame({keyword_column: series[keyword_column].astype(str).to_numpy(),
+                                   "연도-월": month_labels(series[month_column].to_numpy()),
+                                   value_column: series[value_column].to_numpy()})
+            checker.frames(f"{label} 시계열",
+                           expected_frame(expected[expected[keyword_column].isin(keywords)], ["연도-월", keyword_column],
+                                          value_column)[[keyword_column, "연도-월", value_column]],
+                           series.sort_values(["연도-월", keyword_column], ignore_index=True))
+
+def run(data_dir, backends):
+    raw = {file_name: read_raw(os.path.join(data_dir, file_name), date_formats.get(file_name)) for file_name in file_links}
+    buzz = raw["01.Social_Buzz_Monthly.csv"]
+    brands = [brand for brand in card_brands if brand in set(buzz["브랜드"])]
+    all_channels = sorted(channel for channel in buzz["채널"].dropna().unique() if channel != "전체")
+    channel_sets = [all_channels, all_channels[:2]]
+    latest = buzz["날짜"].max()
+
+    results = {}
+    for name, open_backend in backends.items():
+        cubes, indexes, build_ranking = open_backend(data_dir)
+        indexes = {file_name: index for file_name, index in indexes.items() if file_name in indexed_files}
+        checker = Checker()
+        for brand, channels, months in itertools.product(brands, channel_sets, period_months):
+            since = latest - pd.DateOffset(months=months - 1)
+            since_label = since.strftime("%Y-%m")
+            context = f"[{name} {brand}, {len(channels)}개 채널, {months}개월]"
+            check_aggregates(checker, context, raw, cubes, brand, channels, since, since_label)
+            check_indexes(checker, context, raw, indexes, brand, channels, since, since_label)
+            check_rankings(checker, context, raw, build_ranking, brand, channels, since, since_label)
+        results[name] = checker
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "dashboard-bench", "parity", "Data"))
+    parser.add_argument("--keyword-rows", type=int, default=200_000, help="데이터가 없을 때 생성할 05 파일 행 수")
+    parser.add_argument("--brands", type=int, default=4)
+    args = parser.parse_args()
+
+    if any(not os.path.exists(os.path.join(args.data_dir, file_name)) for file_name in file_links):
+        generate(args.data_dir, n_brands=args.brands, keyword_rows=args.keyword_rows)
+    backends = {"pandas": pandas_backend}
+    if importlib.util.find_spec("duckdb") is not None:
+        backends["duckdb"] = duckdb_backend
+    else:
+        print("duckdb가 설치되어 있지 않아 pandas 백엔드만 확인합니다.")
+
+    failed = False
+    for name, checker in run(args.data_dir, backends).items():
+        if not checker.mismatches:
+            print(f"✅ {name}: {checker.count:,}개 항목 일치")
+            continue
+        failed = True
+        print(f"❌ {name}: {checker.count:,}개 중 {len(checker.mismatches):,}개 불일치")
+        for message in checker.mismatches[:max_reported]:
+            print(f"  {message}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""벤치마크 공용 측정 도구"""
+from dashboard.profiling import timed
+
+
+def best_of(func, *args, repeat=1):
+    """func(*args)를 repeat번 실행 → (마지막 결과, 가장 빠른 실행 시간(초))"""
+    samples = {}
+    for attempt in range(repeat):
+        with timed(samples, attempt):
+            result = func(*args)
+    return result, min(samples.values())
@@ -0,0 +1,289 @@
+"""동시 세션 부하 테스트 - Streamlit AppTest로 app.py를 헤드리스 실행하며 동시 접속 수를 늘려 측정
+
+    pip install -r benchmarks/requirements.txt   # 확인한 Streamlit 버전 설치
+    python -m benchmarks.load_test --sessions 1 4 16 --duration 60
+    python -m benchmarks.load_test --sessions 8 --keyword-rows 5000000 --save /tmp/load.json
+
+작업 폴더(--root)의 Data/에 합성 데이터를 만들고(없을 때만) 원본 위치도 그 폴더로 고정하므로
+Google Drive에 접속하지 않는다. 세션마다 테스트 비밀번호로 check_password를 통과한 뒤
+브랜드 변경, 채널 on/off, 기간 변경, 3번 탭 키워드 유형/순위 구간 넘기기를 무작위 순서로
+반복한다. 모든 세션은 한 프로세스의 스레드로 실행되어 실제 서버처럼 공유 캐시(데이터 버전,
+화면 캐시)를 함께 쓴다. 동시 세션 수 단계마다 rerun 지연 p50/p95/p99, 처리량(rerun/s),
+프로세스 CPU 사용률과 RSS를 출력한다. 측정 대상은 스크립트 rerun(위젯 처리 → 화면 메시지
+생성)까지이고 브라우저 전송/렌더링은 포함하지 않는다.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+password = "load-test"
+# ✅ share_app_globals가 바꾸는 Streamlit 내부(Runtime 싱글턴, st.secrets, 설정 조회)를 확인한 버전 (benchmarks/requirements.txt와 맞춤)
+validated_streamlit = "1.66."
+app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4, 8], help="단계별 동시 세션 수")
+    parser.add_argument("--duration", type=float, default=30, help="단계별 측정 시간 (초)")
+    parser.add_argument("--think", type=float, default=0.0, help="세션별 조작 사이 대기 시간 (초)")
+    parser.add_argument("--root", default=os.path.join(tempfile.gettempdir(), "dashboard-load"))
+    parser.add_argument("--keyword-rows", type=int, default=200_000, help="합성 데이터 05 파일 행 수")
+    parser.add_argument("--brands", type=int, default=4)
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument("--timeout", type=float, default=300, help="rerun 한 번의 제한 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="결과 JSON 저장 경로")
+    return parser.parse_args()
+
+def prepare(root, keyword_rows, brands, regenerate):
+    """root/Data에 합성 데이터 준비 후 오프라인 설정 - dashboard 모듈을 읽기 전에 호출해야 함"""
+    data_dir = os.path.join(root, "Data")
+    if regenerate:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    # ✅ 원본 위치를 같은 로컬 폴더로 고정 (dashboard.config가 import 시점에 환경 변수를 읽음)
+    os.environ["DASHBOARD_DATA_SOURCE"] = os.path.abspath(data_dir)
+    os.makedirs(root, exist_ok=True)
+    os.chdir(root)
+
+    from benchmarks.synthetic import generate
+    from dashboard.config import file_links
+
+    if any(not os.path.exists(os.path.join(data_dir, file_name)) for file_name in file_links):
+        print(f"📦 합성 데이터 생성: {data_dir}")
+        generate(data_dir, n_brands=brands, keyword_rows=keyword_rows)
+
+
+def share_app_globals():
+    """AppTest를 여러 스레드에서 동시에 실행할 수 있게 전역 상태 고정
+
+    AppTest는 rerun마다 Runtime 싱글턴, st.secrets, 설정 조회를 바꿨다가 끝나면 되돌려서 동시에 도는
+    다른 세션의 rerun이 Runtime이나 비밀번호를 잃는다. 처음 만든 Runtime 하나를 모든 세션이 공유하고
+    (실제 서버처럼 미디어/캐시 저장소도 하나) 비밀번호와 테스트 설정은 프로세스 전체에 한 번 넣어 둔다.
+    Streamlit 내부를 직접 바꾸므로 validated_streamlit 버전에서만 실행한다.
+    """
+    import streamlit as st
+
+    if not st.__version__.startswith(validated_streamlit):
+        raise SystemExit(f"부하 테스트는 Streamlit {validated_streamlit}x에서 확인되었습니다 (설치된 버전: {st.__version__}). "
+                         "share_app_globals가 바꾸는 내부 API를 새 버전에서 확인한 뒤 validated_streamlit을 올리세요.")
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.secrets import Secrets
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    shared = []
+
+    def instance(cls):
+        if cls._instance is not None and not shared:
+            shared.append(cls._instance)
+        if cls._instance is None and not shared:
+            raise RuntimeError("Runtime hasn't been created!")
+        return cls._instance or shared[0]
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(shared))
+    st.secrets = Secrets()
+    st.secrets._secrets = {"general": {"password": password}}
+    config.get_option = build_mock_config_get_option({"global.appTest": True})
+    # 설정 파일을 읽을 때 로그 수준이 다시 정해지므로 읽은 뒤에 낮춤 (rerun마다 나오는 경고로 결과 표가 묻히지 않게)
+    config.get_option("logger.level")
+    set_log_level("error")
+
+
+# ✅ 세션 조작 - (이름, 함수(at, rng)) / 위젯은 라벨로 찾고, 지금 화면에 없으면 건너뜀
+def widget(elements, label):
+    return next((element for element in elements if element.label == label), None)
+
+def change_brand(at, rng):
+    box = widget(at.selectbox, "📌 브랜드 선택")
+    return box and box.select(rng.choice([option for option in box.options if option != box.value] or box.options))
+
+def toggle_channel(at, rng):
+    box = widget(at.multiselect, "📌 소셜미디어 채널 선택")
+    if box is None:
+        return None
+    channel = rng.choice(box.options)
+    return box.unselect(channel) if channel in box.value and len(box.value) > 1 else box.select(channel)
+
+def switch_period(at, rng):
+    box = widget(at.selectbox, "📆 기간 선택")
+    return box and box.select(rng.choice(box.options))
+
+def switch_keyword_type(at, rng):
+    box = widget(at.selectbox, "키워드 유형 선택")
+    return box and box.select(rng.choice(box.options))
+
+def page_rank_range(at, rng):
+    box = widget(at.selectbox, "키워드 순위 선택")
+    if box is None:
+        return None
+    position = box.options.index(box.value)
+    return box.select(box.options[(position + rng.choice([1, 1, 2, -1])) % len(box.options)])
+
+actions = [
+    ("brand", change_brand, 3),
+    ("channels", toggle_channel, 2),
+    ("period", switch_period, 2),
+    ("keyword_type", switch_keyword_type, 1),
+    ("rank_range", page_rank_range, 3),
+]
+
+
+class Session(threading.Thread):
+    """인증된 세션 하나 - stop 이벤트가 설정될 때까지 무작위 조작을 반복하며 rerun 시간 기록"""
+
+    def __init__(self, number, stop, samples, errors, think, timeout, seed):
+        super().__init__(name=f"load-session-{number}", daemon=True)
+        self.stop = stop
+        self.samples = samples
+        self.errors = errors
+        self.think = think
+        self.timeout = timeout
+        self.rng = random.Random(seed + number)
+
+    def rerun(self, name, element):
+        start = time.perf_counter()
+        at = element.run(timeout=self.timeout)
+        seconds = time.perf_counter() - start
+        if at.exception:
+            self.errors.append(f"{name}: {at.exception[0].value}")
+        self.samples.append((name, seconds, time.perf_counter()))
+        return at
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+
+        try:
+            at = AppTest.from_file(app_path, default_timeout=self.timeout)
+            self.rerun("open", at)
+            self.rerun("login", at.text_input[0].input(password))
+            names, functions, weights = zip(*actions)
+            while not self.stop.is_set():
+                index = self.rng.choices(range(len(actions)), weights=weights)[0]
+                element = functions[index](at, self.rng)
+                if element is not None:
+                    self.rerun(names[index], element)
+                if self.think:
+                    self.stop.wait(self.rng.uniform(0, 2 * self.think))
+        except Exception as e:  # 세션 하나가 실패해도 나머지 측정은 계속
+            self.errors.append(f"{type(e).__name__}: {e}")
+
+
+class ResourceSampler(threading.Thread):
+    """프로세스 CPU 사용률(코어 1개 = 100%)과 RSS를 주기적으로 기록"""
+
+    def __init__(self, interval=0.5):
+        super().__init__(name="load-sampler", daemon=True)
+        self.interval = interval
+        self.stop = threading.Event()
+        self.cpu = []
+        self.rss = []
+
+    def run(self):
+        last_cpu, last_wall = self.cpu_seconds(), time.perf_counter()
+        while not self.stop.wait(self.interval):
+            cpu, wall = self.cpu_seconds(), time.perf_counter()
+            self.cpu.append((cpu - last_cpu) / (wall - last_wall) * 100)
+            self.rss.append(rss_mb())
+            last_cpu, last_wall = cpu, wall
+
+    @staticmethod
+    def cpu_seconds():
+        times = os.times()
+        return times.user + times.system
+
+def rss_mb():
+    """현재 RSS (리눅스 /proc, 그 외에는 최대 RSS로 대신함)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1e6 if sys.platform == "darwin" else 1e3)
+
+def run_level(n_sessions, duration, think, timeout, seed):
+    """동시 세션 n개로 duration초 측정 → 요약 딕셔너리 (로그인 rerun은 처리량/지연에서 제외)"""
+    from dashboard.profiling import percentile
+
+    stop, samples, errors = threading.Event(), [], []
+    sampler = ResourceSampler()
+    sessions = [Session(i, stop, samples, errors, think, timeout, seed) for i in range(n_sessions)]
+    sampler.start()
+    started = time.perf_counter()
+    for session in sessions:
+        session.start()
+    time.sleep(duration)
+    stop.set()
+    for session in sessions:
+        session.join()
+    elapsed = time.perf_counter() - started
+    sampler.stop.set()
+    sampler.join()
+
+    interactions = [seconds for name, seconds, _ in samples if name not in ("open", "login")]
+    by_action = {}
+    for name, seconds, _ in samples:
+        by_action.setdefault(name, []).append(seconds)
+    summary = lambda values: {"count": len(values),
+                              "p50_ms": round(percentile(values, 50) * 1000, 1),
+                              "p95_ms": round(percentile(values, 95) * 1000, 1),
+                              "p99_ms": round(percentile(values, 99) * 1000, 1)} if values else {"count": 0}
+    return {
+        "sessions": n_sessions,
+        "seconds": round(elapsed, 1),
+        "reruns": len(interactions),
+        "throughput": round(len(interactions) / elapsed, 2),
+        "latency": summary(interactions),
+        "actions": {name: summary(values) for name, values in by_action.items()},
+        "cpu_percent": round(sum(sampler.cpu) / len(sampler.cpu), 1) if sampler.cpu else None,
+        "rss_mb": round(max(sampler.rss), 1) if sampler.rss else round(rss_mb(), 1),
+        "errors": errors[:20],
+    }
+
+def print_level(result):
+    latency = result["latency"]
+    print(f"{result['sessions']:>6} {result['reruns']:>7} {result['throughput']:>8.2f} "
+          f"{latency.get('p50_ms', 0):>9.1f} {latency.get('p95_ms', 0):>9.1f} {latency.get('p99_ms', 0):>9.1f} "
+          f"{result['cpu_percent'] or 0:>7.1f} {result['rss_mb']:>8.1f} {len(result['errors']):>4}")
+
+def main():
+    args = parse_args()
+    prepare(os.path.abspath(args.root), args.keyword_rows, args.brands, args.regenerate)
+    share_app_globals()
+
+    # 첫 로드(스냅샷 적재/큐브 구성)는 측정에서 제외 - 세션 하나로 데이터 버전을 먼저 게시
+    warmup = run_level(1, 0, 0, args.timeout, args.seed)
+    if warmup["errors"]:
+        raise SystemExit(f"준비 실행 실패: {warmup['errors']}")
+    print(f"준비 완료 (로그인 rerun {warmup['actions']['login']['p50_ms']:.0f}ms)")
+
+    print(f"{'세션':>6} {'rerun':>7} {'rerun/s':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} "
+          f"{'CPU(%)':>7} {'RSS(MB)':>8} {'오류':>4}")
+    results = []
+    for n_sessions in args.sessions:
+        result = run_level(n_sessions, args.duration, args.think, args.timeout, args.seed)
+        print_level(result)
+        for error in result["errors"][:3]:
+            print(f"   ⚠️ {error}")
+        results.append(result)
+
+    slowest = results[-1]["actions"]
+    print("\n마지막 단계 조작별 p50 / p95 (ms): " + ", ".join(
+        f"{name} {values['p50_ms']:.0f}/{values['p95_ms']:.0f}" for name, values in slowest.items() if values["count"]))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "levels": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
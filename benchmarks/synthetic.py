@@ -0,0 +1,181 @@
+"""합성 데이터 생성기 - 8개 원본 CSV와 같은 컬럼/형식(한글 컬럼명, 날짜 형식, 기간 문자열,
+비율 컬럼, cp949/utf-8 인코딩)의 데이터를 원하는 규모로 생성
+
+    python -m benchmarks.synthetic --out /tmp/bench/Data --keyword-rows 5000000
+    python -m benchmarks.synthetic --out /tmp/bench/Data --keyword-rows 50000000 --encoding cp949
+
+키워드 파일(05/06/07)은 월 단위로 나눠 이어 쓰므로 5천만 행도 메모리에 한 번에 올리지 않는다.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from dashboard.config import date_formats, file_links
+
+card_brands = ["맥도날드", "버거킹", "롯데리아"]
+channels = ["X(트위터)", "커뮤니티", "네이버 카페", "다음 카페", "인스타그램", "유튜브", "블로그", "티스토리",
+            "네이버 뉴스", "다음 뉴스", "언론사 뉴스"]
+sentiments = ["긍정", "부정", "중립"]
+age_columns = ["12세 이하(%)", "13~19세(%)", "20~24세(%)", "25~29세(%)", "30~39세(%)", "40~49세(%)", "50세 이상(%)"]
+
+# ✅ 파일별 기본 인코딩 (원본처럼 cp949와 utf-8이 섞여 있음)
+default_encodings = {
+    "01.Social_Buzz_Monthly.csv": "cp949",
+    "02.SearchVolume_Monthly.csv": "utf-8-sig",
+    "04.Sentiment_Buzz_Monthly.csv": "utf-8-sig",
+    "05.Keyword_Monthly.csv": "cp949",
+    "06.Search_Keyword_Monthly.csv": "utf-8-sig",
+    "07.Sentiment_Keyword_Monthly.csv": "cp949",
+    "08.Search_Keyword_Gender_Monthly.csv": "utf-8-sig",
+    "09.Search_Keyword_Age_Monthly.csv": "cp949",
+}
+
+# 키워드 파일별 행 수 비율 (05 기준)
+keyword_row_ratios = {
+    "05.Keyword_Monthly.csv": 1.0,
+    "06.Search_Keyword_Monthly.csv": 0.3,
+    "07.Sentiment_Keyword_Monthly.csv": 0.6,
+}
+
+
+def brand_names(n_brands):
+    """카드 비교 3개 브랜드 + 추가 브랜드"""
+    return card_brands[:n_brands] + [f"브랜드{i:02d}" for i in range(len(card_brands), n_brands)]
+
+def keyword_ids(rng, size, n_keywords):
+    """소수 키워드에 언급이 몰리는 분포 (상위 순위가 월마다 크게 바뀌지 않도록)"""
+    return np.minimum((n_keywords * rng.random(size) ** 3).astype(np.int64), n_keywords - 1)
+
+def write_frame(path, df, encoding, header=True):
+    df.to_csv(path, index=False, encoding=encoding, mode="w" if header else "a", header=header)
+
+
+class Generator:
+    """8개 원본 CSV 형식의 합성 데이터 생성 (월 × 브랜드 × 채널 × 감성 × 키워드)"""
+
+    def __init__(self, out, n_brands=4, n_months=24, keyword_rows=1_000_000, n_keywords=None,
+                 encoding=None, end_month="2024-12", seed=0):
+        self.out = out
+        self.rng = np.random.default_rng(seed)
+        self.brands = brand_names(n_brands)
+        self.months = pd.period_range(end=end_month, periods=n_months, freq="M").to_timestamp()
+        self.keyword_rows = keyword_rows
+        n_keywords = n_keywords or max(1000, min(keyword_rows // 50, 500_000))
+        self.keywords = np.array([f"키워드{i}" for i in range(n_keywords)], dtype=object)
+        self.encodings = {name: encoding or default_encodings[name] for name in file_links}
+        first = self.months[-12] if len(self.months) >= 12 else self.months[0]
+        last = self.months[-1] + pd.offsets.MonthEnd(0)
+        self.period_label = f"{first:%Y.%m.%d}~{last:%Y.%m.%d}"  # 성별/연령 파일의 기간 문자열
+
+    def path(self, file_name):
+        return os.path.join(self.out, file_name)
+
+    def dates(self, file_name):
+        """파일별 날짜 형식의 월 문자열 목록"""
+        return list(self.months.strftime(date_formats[file_name]))
+
+    def counts(self, size, low, high):
+        return self.rng.integers(low, high, size)
+
+    def grid(self, *axes):
+        """축 라벨 목록의 모든 조합 (월 × 브랜드 × ...) 데이터프레임 컬럼"""
+        mesh = np.meshgrid(*[np.arange(len(axis)) for axis in axes], indexing="ij")
+        return [np.asarray(axis, dtype=object)[codes.ravel()] for axis, codes in zip(axes, mesh)]
+
+    def social_buzz(self):
+        month, brand, channel = self.grid(self.dates("01.Social_Buzz_Monthly.csv"), self.brands, ["전체"] + channels)
+        df = pd.DataFrame({"날짜": month, "브랜드": brand, "채널": channel, "언급량": self.counts(len(month), 100, 50_000)})
+        write_frame(self.path("01.Social_Buzz_Monthly.csv"), df, self.encodings["01.Social_Buzz_Monthly.csv"])
+        return len(df)
+
+    def search_volume(self):
+        month, brand = self.grid(self.dates("02.SearchVolume_Monthly.csv"), self.brands)
+        df = pd.DataFrame({"날짜": month, "브랜드": brand, "검색량": self.counts(len(month), 1_000, 1_000_000)})
+        write_frame(self.path("02.SearchVolume_Monthly.csv"), df, self.encodings["02.SearchVolume_Monthly.csv"])
+        return len(df)
+
+    def sentiment_buzz(self):
+        month, brand, channel, sentiment = self.grid(self.dates("04.Sentiment_Buzz_Monthly.csv"), self.brands, ["전체"] + channels, sentiments)
+        df = pd.DataFrame({"날짜": month, "브랜드": brand, "채널": channel, "감성": sentiment,
+                           "언급량": self.counts(len(month), 10, 10_000)})
+        write_frame(self.path("04.Sentiment_Buzz_Monthly.csv"), df, self.encodings["04.Sentiment_Buzz_Monthly.csv"])
+        return len(df)
+
+    def keyword_file(self, file_name):
+        """월마다 (브랜드, [채널], [감성], 키워드) 행을 생성해 이어 씀 (파일 전체가 월 순으로 정렬됨)"""
+        size = max(1, int(self.keyword_rows * keyword_row_ratios[file_name]) // len(self.months))
+        total = 0
+        for i, date in enumerate(self.dates(file_name)):
+            columns = {"날짜": np.full(size, date, dtype=object),
+                       "브랜드": np.asarray(self.brands, dtype=object)[self.rng.integers(0, len(self.brands), size)]}
+            if file_name.startswith("06"):
+                columns["키워드"] = self.keywords[keyword_ids(self.rng, size, len(self.keywords))]
+                columns["검색량"] = self.counts(size, 1, 50_000)
+            else:
+                columns["채널"] = np.asarray(channels, dtype=object)[self.rng.integers(0, len(channels), size)]
+                if file_name.startswith("07"):
+                    columns["감성"] = np.asarray(sentiments, dtype=object)[self.rng.integers(0, len(sentiments), size)]
+                columns["연관어"] = self.keywords[keyword_ids(self.rng, size, len(self.keywords))]
+                columns["언급량"] = self.counts(size, 1, 5_000)
+            write_frame(self.path(file_name), pd.DataFrame(columns), self.encodings[file_name], header=i == 0)
+            total += size
+        return total
+
+    def demographic_keywords(self, per_brand=100):
+        brand = np.repeat(np.asarray(self.brands, dtype=object), per_brand)
+        keyword = np.tile(self.keywords[:per_brand], len(self.brands))
+        base = {"기간": self.period_label, "브랜드": brand, "키워드": keyword,
+                "검색량": self.counts(len(brand), 10, 100_000)}
+
+        male = self.rng.uniform(0, 100, len(brand)).round(1)
+        gender = pd.DataFrame(dict(base, **{"남성(%)": male, "여성(%)": (100 - male).round(1)}))
+        write_frame(self.path("08.Search_Keyword_Gender_Monthly.csv"), gender,
+                    self.encodings["08.Search_Keyword_Gender_Monthly.csv"])
+
+        shares = (self.rng.dirichlet(np.ones(len(age_columns)), len(brand)) * 100).round(1)
+        age = pd.DataFrame(dict(base, **dict(zip(age_columns, shares.T))))
+        write_frame(self.path("09.Search_Keyword_Age_Monthly.csv"), age,
+                    self.encodings["09.Search_Keyword_Age_Monthly.csv"])
+        return {"08.Search_Keyword_Gender_Monthly.csv": len(gender), "09.Search_Keyword_Age_Monthly.csv": len(age)}
+
+    def generate_all(self):
+        """8개 파일 생성 → {파일명: 행 수}"""
+        os.makedirs(self.out, exist_ok=True)
+        rows = {
+            "01.Social_Buzz_Monthly.csv": self.social_buzz(),
+            "02.SearchVolume_Monthly.csv": self.search_volume(),
+            "04.Sentiment_Buzz_Monthly.csv": self.sentiment_buzz(),
+        }
+        for file_name in keyword_row_ratios:
+            rows[file_name] = self.keyword_file(file_name)
+        rows.update(self.demographic_keywords())
+        return rows
+
+
+def generate(out, **options):
+    return Generator(out, **options).generate_all()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="Data")
+    parser.add_argument("--brands", type=int, default=4)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--keyword-rows", type=int, default=1_000_000, help="05.Keyword_Monthly.csv 행 수 (06/07은 비율로 결정)")
+    parser.add_argument("--keywords", type=int, default=None, help="키워드 어휘 수 (기본: 행 수 / 50)")
+    parser.add_argument("--encoding", choices=["cp949", "utf-8-sig"], default=None, help="모든 파일에 같은 인코딩 사용 (기본: 파일별 혼합)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = generate(args.out, n_brands=args.brands, n_months=args.months, keyword_rows=args.keyword_rows,
+                    n_keywords=args.keywords, encoding=args.encoding, seed=args.seed)
+    for file_name, count in rows.items():
+        print(f"✅ {file_name:<40} {count:>12,}행")
+    print(f"생성 시간: {time.perf_counter() - start:.1f}s → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Publicis Groupe Korea Dashboard 데이터 계층"""
@@ -0,0 +1,112 @@
+"""브랜드 레지스트리와 브랜드 비교 집계
+
+레지스트리는 브랜드별 로고/로고 크기/카테고리와 기본 비교 브랜드 목록이다. 기본값은 아래
+default_brands이고, DASHBOARD_BRANDS_FILE(JSON)로 코드 수정 없이 브랜드를 추가하거나 덮어쓴다.
+
+    {"brands": {"맘스터치": {"logo": "https://...", "logo_size": [200, 100], "category": "버거"}},
+     "compare": ["맥도날드", "버거킹", "롯데리아", "맘스터치"]}
+
+compare_brands는 임의의 브랜드 집합에 대해 (브랜드 × 월) 합계를 큐브 조회 한 번으로 구한 뒤
+합계/비중/전월 대비 증감을 배열 연산으로 계산한다 (브랜드 수가 늘어도 조회 횟수는 그대로).
+"""
+import numpy as np
+import pandas as pd
+
+from .config import brands_file
+from .files import read_json
+from .schema import month_key, month_label
+
+# ✅ 기본 브랜드 (로고 URL, 로고 크기 (width, height), 카테고리)
+default_brands = {
+    "맥도날드": {
+        "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/3/36/McDonald%27s_Golden_Arches.svg/1280px-McDonald%27s_Golden_Arches.svg.png",
+        "logo_size": (100, 100),
+        "category": "버거",
+    },
+    "버거킹": {
+        "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/c/cc/Burger_King_2020.svg/330px-Burger_King_2020.svg.png",
+        "logo_size": (100, 100),
+        "category": "버거",
+    },
+    "롯데리아": {
+        "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/3/34/Lotteria_logo.svg/1920px-Lotteria_logo.svg.png",
+        "logo_size": (300, 100),
+        "category": "버거",
+    },
+}
+
+# ✅ 기본 비교 브랜드 (카드 순서)
+default_compare = ["맥도날드", "버거킹", "롯데리아"]
+
+
+class BrandRegistry:
+    """브랜드 정보 조회 - 등록되지 않은 브랜드도 이름만으로 비교할 수 있음"""
+
+    def __init__(self, brands=None, compare=None):
+        self.brands = dict(default_brands if brands is None else brands)
+        self.compare = list(default_compare if compare is None else compare)
+
+    def logo(self, brand):
+        """(로고 URL, width, height) - 로고가 없으면 None"""
+        entry = self.brands.get(brand, {})
+        if not entry.get("logo"):
+            return None
+        width, height = entry.get("logo_size", (100, 100))
+        return entry["logo"], width, height
+
+    def categories(self):
+        return sorted({entry["category"] for entry in self.brands.values() if entry.get("category")})
+
+    def comparison_set(self, available, category=None):
+        """비교할 브랜드 목록 - category가 없으면 기본 비교 브랜드, 있으면 그 카테고리 브랜드 (available 안에서, 중복 제거)"""
+        available = set(available)
+        if category is None:
+            brands = self.compare
+        else:
+            brands = [brand for brand, entry in self.brands.items() if entry.get("category") == category]
+        return [brand for brand in dict.fromkeys(brands) if brand in available]
+
+
+def load_registry(path=brands_file):
+    """기본 브랜드 + 레지스트리 파일(있으면)의 브랜드/비교 목록"""
+    data = read_json(path, {}) if path else {}
+    brands = dict(default_brands)
+    for brand, entry in (data.get("brands") or {}).items():
+        brands[brand] = {**brands.get(brand, {}), **entry}
+    return BrandRegistry(brands, data.get("compare", default_compare))
+
+def compare_brands(cube, brands, filters=None, since=None):
+    """브랜드별 비교 표와 기준 월 → (데이터프레임, 마지막 달 '연도-월' 또는 None)
+
+    컬럼: 브랜드, 합계, 비중(선택한 브랜드 합계 대비 %), 당월, 전월, 증감(전월 대비 %, 전월이 0이면 NaN).
+    행 순서는 brands 순서이고 브랜드마다 한 행이다 (중복된 브랜드는 처음 나온 위치에 한 번만).
+    데이터가 없는 브랜드는 0으로 채운다. 당월은 기간 안에서 데이터가 있는 마지막 달, 전월은 그 직전 달력 월이다.
+    """
+    brands = list(dict.fromkeys(brands))
+    frame = cube.frame(["브랜드", "연도-월"], {**(filters or {}), "브랜드": brands}, since=since)
+    months = np.array(sorted(set(frame["연도-월"])), dtype=object)
+    sums = np.zeros((len(brands), len(months)), dtype=np.int64)
+    if len(frame):
+        rows = pd.Index(brands).get_indexer(frame["브랜드"].astype(str))
+        cols = np.searchsorted(months, frame["연도-월"].to_numpy())
+        np.add.at(sums, (rows, cols), frame[cube.value_column].to_numpy(dtype=np.int64))
+
+    totals = sums.sum(axis=1)
+    grand_total = totals.sum()
+    month = months[-1] if len(months) else None
+    current = sums[:, -1] if len(months) else np.zeros(len(brands), dtype=np.int64)
+    previous = np.zeros(len(brands), dtype=np.int64)
+    if month is not None:
+        previous_month = np.flatnonzero(months == month_label(month_key(month) - 1))
+        if len(previous_month):
+            previous = sums[:, previous_month[0]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = np.where(previous > 0, (current - previous) / previous * 100, np.nan)
+    return pd.DataFrame({
+        "브랜드": brands,
+        "합계": totals,
+        "비중": totals / grand_total * 100 if grand_total else np.zeros(len(brands)),
+        "당월": current,
+        "전월": previous,
+        "증감": delta,
+    }), month
@@ -0,0 +1,131 @@
+import os
+
+# ✅ Google Drive 파일 ID 매핑
+file_links = {
+    "01.Social_Buzz_Monthly.csv": "1-2fNHis_rQvrOqrhvGUFqXL64OcGPvbn",
+    "02.SearchVolume_Monthly.csv": "1r8LpCvwb-FvQvKnMqimE7xOnrMkr4hCf",
+    "04.Sentiment_Buzz_Monthly.csv": "19mmYdWEbDdh0D2okPMFDqPjo0IkqdHl7",
+    "05.Keyword_Monthly.csv": "1HutFBwcKVkDs_IR2vRlD3a7q-RzRwVLF",
+    "06.Search_Keyword_Monthly.csv": "1U7iZU2iqnezsB_HGhYuH9akKD3h675jf",
+    "07.Sentiment_Keyword_Monthly.csv": "1UbGxKX81iBJqbQB62IFDbVAOta5vcXko",
+    "08.Search_Keyword_Gender_Monthly.csv": "1KzlKvy76zoQtc-Kx_xz1OauFHqO4cyrR",
+    "09.Search_Keyword_Age_Monthly.csv": "1mooWsfx-YnqbGeyHFs4tinDb_70VIzt1"
+}
+
+# ✅ 날짜 형식 지정
+date_formats = {
+    "01.Social_Buzz_Monthly.csv": "%Y-%m",
+    "02.SearchVolume_Monthly.csv": "%Y-%m",
+    "04.Sentiment_Buzz_Monthly.csv": "%Y-%m",
+    "05.Keyword_Monthly.csv": "%Y-%m-%d",
+    "06.Search_Keyword_Monthly.csv": "%Y-%m",
+    "07.Sentiment_Keyword_Monthly.csv": "%Y-%m-%d",
+}
+
+# ✅ 문자열로 고정할 컬럼 (성별/연령 데이터)
+string_columns = {
+    "08.Search_Keyword_Gender_Monthly.csv": ["브랜드", "기간"],
+    "09.Search_Keyword_Age_Monthly.csv": ["브랜드", "기간"],
+}
+
+# ✅ 데이터 저장 폴더 (환경 변수로 변경 가능)
+data_dir = os.environ.get("DASHBOARD_DATA_DIR", "Data")
+
+# ✅ 스냅샷에서 사전(dictionary) 인코딩으로 저장할 범주형 컬럼
+category_columns = ["브랜드", "채널", "감성", "연관어", "키워드"]
+
+# ✅ 파일 간 공유 범주 사전 (사전 이름 → 컬럼) - 같은 라벨은 모든 파일에서 같은 코드
+# (키워드 어휘는 따로 두어 브랜드/채널/감성 코드는 작은 정수 그대로 유지)
+category_dictionaries = {
+    "브랜드": ["브랜드"],
+    "채널": ["채널"],
+    "감성": ["감성"],
+    "키워드": ["연관어", "키워드"],
+}
+
+# ✅ 정수로 저장할 집계 컬럼 (값 범위에 맞는 가장 작은 정수형으로 다운캐스트)
+count_columns = ["언급량", "검색량"]
+
+# ✅ 정수 월 키 컬럼 (연도 * 12 + 월 - 1, '연도-월' 문자열은 화면 출력 시에만 생성)
+month_column = "월키"
+
+# ✅ 원본 파일 위치 - 기본은 Google Drive(gdown), http(s) URL 또는 로컬 폴더로 대체 가능
+data_source = os.environ.get("DASHBOARD_DATA_SOURCE", "gdown")
+
+# ✅ 이미 받은 파일을 다시 확인하는 주기 (초)
+refresh_interval = int(os.environ.get("DASHBOARD_REFRESH_INTERVAL", 6 * 60 * 60))
+# ✅ 백그라운드 갱신 스레드가 로컬 파일 변경(서명)을 확인하는 주기 (초)
+refresh_poll = int(os.environ.get("DASHBOARD_REFRESH_POLL", 60))
+
+# ✅ 동시 다운로드 개수와 재시도 설정
+fetch_workers = int(os.environ.get("DASHBOARD_FETCH_WORKERS", 4))
+fetch_retries = 4
+fetch_backoff = 1.0
+
+# ✅ 증분 적재 - 원본 CSV 뒤에 행만 추가된 경우 새 행만 파싱해서 스냅샷에 붙임
+incremental_ingest = os.environ.get("DASHBOARD_INCREMENTAL", "1") != "0"
+
+# ✅ 병렬 적재 - 파싱/정규화 작업 프로세스 수, CSV 엔진(pyarrow: 멀티스레드, c: pandas 기본)
+# (코어가 하나면 pyarrow 엔진은 변환 비용만 더 들어서 c 엔진 사용)
+parse_workers = int(os.environ.get("DASHBOARD_PARSE_WORKERS", os.cpu_count() or 1))
+parse_engine = os.environ.get("DASHBOARD_PARSE_ENGINE", "pyarrow" if (os.cpu_count() or 1) > 1 else "c")
+# 이보다 큰 파일은 줄 경계에 맞춘 바이트 구간으로 나눠 병렬 파싱 (적재할 전체 크기가 이보다 작으면 풀 없이 처리)
+parse_chunk_mb = int(os.environ.get("DASHBOARD_PARSE_CHUNK_MB", 32))
+
+# ✅ 적재 시 함께 갱신하는 월별 집계 (파일 → 집계 기준 컬럼)
+monthly_aggregates = {
+    "01.Social_Buzz_Monthly.csv": ["브랜드", "채널"],
+    "02.SearchVolume_Monthly.csv": ["브랜드"],
+    "04.Sentiment_Buzz_Monthly.csv": ["브랜드", "채널", "감성"],
+}
+
+# ✅ (브랜드, 날짜) 정렬 인덱스로 필터링하는 파일
+indexed_files = [
+    "05.Keyword_Monthly.csv",
+    "06.Search_Keyword_Monthly.csv",
+    "07.Sentiment_Keyword_Monthly.csv",
+    "08.Search_Keyword_Gender_Monthly.csv",
+    "09.Search_Keyword_Age_Monthly.csv",
+]
+
+# ✅ 키워드 파일별 (키워드 컬럼, 값 컬럼)
+keyword_columns = {
+    "05.Keyword_Monthly.csv": ("연관어", "언급량"),
+    "06.Search_Keyword_Monthly.csv": ("키워드", "검색량"),
+    "07.Sentiment_Keyword_Monthly.csv": ("연관어", "언급량"),
+}
+
+# ✅ 시작 방식 - lazy: 무거운 모듈을 필요한 시점에 로드 / eager: 인증 직후 모두 로드
+startup_mode = os.environ.get("DASHBOARD_STARTUP_MODE", "lazy")
+
+# ✅ 단계별 실행 시간 측정 (opt-in) 및 JSON-lines 로그 위치
+profiling = os.environ.get("DASHBOARD_PROFILE", "").lower() in ("1", "true", "yes")
+profile_log = os.environ.get("DASHBOARD_PROFILE_LOG") or os.path.join(data_dir, ".profile.jsonl")
+
+# ✅ 화면(그래프/테이블) 캐시 크기 상한 - 모든 세션이 공유, 데이터 버전이 바뀌면 비움
+view_cache_mb = int(os.environ.get("DASHBOARD_VIEW_CACHE_MB", 256))
+view_cache_entries = int(os.environ.get("DASHBOARD_VIEW_CACHE_ENTRIES", 512))
+
+# ✅ 테이블 전송 방식 - window: 행 페이지 × 월 구간만 잘라서 전송 / full: 전체 테이블 전송
+table_mode = os.environ.get("DASHBOARD_TABLE_MODE", "window")
+table_page_rows = int(os.environ.get("DASHBOARD_TABLE_PAGE_ROWS", 25))
+table_month_window = int(os.environ.get("DASHBOARD_TABLE_MONTHS", 12))
+table_top_n = int(os.environ.get("DASHBOARD_TABLE_TOP_N", 100))  # 월별 키워드 테이블 순위 수
+
+# ✅ 브랜드 레지스트리 파일 (JSON, 없으면 기본 브랜드만 사용) - 로고/카테고리/기본 비교 브랜드 추가
+brands_file = os.environ.get("DASHBOARD_BRANDS_FILE", "brands.json")
+# ✅ 브랜드 카드 격자 - 한 줄 카드 수, 한 페이지에 그리는 줄 수 (보이는 페이지의 카드만 렌더링)
+card_columns = int(os.environ.get("DASHBOARD_CARD_COLUMNS", 3))
+card_page_rows = int(os.environ.get("DASHBOARD_CARD_PAGE_ROWS", 2))
+
+# ✅ 화면 출처 - live: 선택할 때마다 계산 / prerendered: python -m dashboard.prerender로 미리 만든 산출물을 읽고
+# 산출물에 없는 조합(기본값이 아닌 채널/비교 브랜드 선택 등)만 계산
+view_source = os.environ.get("DASHBOARD_VIEW_SOURCE", "live")
+# 사전 렌더링 산출물 폴더 (데이터 버전별 하위 폴더) 및 남겨 둘 버전 수
+artifact_dir = os.environ.get("DASHBOARD_ARTIFACT_DIR") or os.path.join(data_dir, ".artifacts")
+artifact_keep = int(os.environ.get("DASHBOARD_ARTIFACT_KEEP", 3))
+
+# ✅ 조회 백엔드 - pandas: 전체 데이터를 메모리에 올려 인덱스/큐브로 조회 / duckdb: Parquet을 SQL로 조회 (pip install duckdb)
+backend = os.environ.get("DASHBOARD_BACKEND", "pandas")
+# duckdb 백엔드에서도 메모리에 올리는 파일 (사이드바 선택지용)
+resident_files = ["01.Social_Buzz_Monthly.csv"]
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from .config import month_column, monthly_aggregates
+from .schema import month_key, month_labels
+
+
+class AggregateCube:
+    """(브랜드, 채널, 감성, 월) 합계 큐브 - 적재 시 한 번 만들고 이후에는 잘라서 더하기만 함
+
+    - 차원별 라벨을 정렬해 정수 코드로 바꾸고, 월은 정수 월 키로 축을 만든다
+    - values[차원 코드..., 월] 에 합계, present 에 원본 데이터 존재 여부를 저장
+      (groupby와 같은 결과를 내도록 데이터가 없는 칸은 결과에서 제외)
+    """
+
+    def __init__(self, aggregate, dimensions, value_column=None):
+        aggregate = aggregate[aggregate[month_column] >= 0]
+        self.dimensions = list(dimensions)
+        self.value_column = value_column or next(
+            column for column in aggregate.columns if column not in [month_column, *self.dimensions])
+        months = aggregate[month_column].to_numpy(dtype=np.int64)
+        self.first_month = int(months.min()) if len(months) else 0
+        n_months = int(months.max()) - self.first_month + 1 if len(months) else 0
+
+        self.labels, self.positions, codes = {}, {}, []
+        for dimension in self.dimensions:
+            column = aggregate[dimension].astype(str)
+            labels = sorted(column.unique())
+            self.labels[dimension] = np.array(labels, dtype=object)
+            self.positions[dimension] = {label: i for i, label in enumerate(labels)}
+            codes.append(pd.Categorical(column, categories=labels).codes)
+        codes.append(months - self.first_month)
+
+        shape = [len(self.labels[dimension]) for dimension in self.dimensions] + [n_months]
+        self.values = np.zeros(shape, dtype=np.int64)
+        np.add.at(self.values, tuple(codes), aggregate[self.value_column].to_numpy())
+        self.present = np.zeros(shape, dtype=bool)
+        self.present[tuple(codes)] = True
+
+    def indexer(self, filters, since):
+        """필터(차원 → 라벨 또는 라벨 목록)와 시작 월을 축별 인덱스 배열로 변환"""
+        index = []
+        for dimension in self.dimensions:
+            selected = (filters or {}).get(dimension)
+            if selected is None:
+                index.append(np.arange(len(self.labels[dimension])))
+                continue
+            if isinstance(selected, str):
+                selected = [selected]
+            positions = self.positions[dimension]
+            index.append(np.sort(np.array([positions[label] for label in selected if label in positions], dtype=np.intp)))
+        start = 0 if since is None else max(month_key(since) - self.first_month, 0)
+        index.append(np.arange(start, self.values.shape[-1]))
+        return np.ix_(*index), index
+
+    def frame(self, by, filters=None, since=None):
+        """by 컬럼(차원 또는 '연도-월')별 합계 데이터프레임 - groupby(by).sum().reset_index()와 같은 결과"""
+        ix, index = self.indexer(filters, since)
+        axes = self.dimensions + ["연도-월"]
+        keep = [axes.index(column) for column in by]
+        drop = tuple(axis for axis in range(len(axes)) if axis not in keep)
+        # 남은 축을 by 순서로 재배열
+        order = np.argsort(np.argsort(keep))
+        sums = self.values[ix].sum(axis=drop).transpose(order)
+        present = self.present[ix].any(axis=drop).transpose(order)
+
+        cells = np.nonzero(present)
+        data = {}
+        for column, cell in zip(by, cells):
+            positions = index[axes.index(column)][cell]
+            if column == "연도-월":
+                data[column] = month_labels(self.first_month + positions)
+            else:
+                data[column] = self.labels[column][positions]
+        data[self.value_column] = sums[cells]
+        return pd.DataFrame(data)
+
+    def total(self, filters=None, since=None):
+        """필터 조건 전체 합계"""
+        ix, _ = self.indexer(filters, since)
+        return int(self.values[ix].sum())
+
+
+def build_cubes(aggregates):
+    """{파일명: 월별 집계} → {파일명: AggregateCube}"""
+    return {file_name: AggregateCube(aggregate, monthly_aggregates[file_name])
+            for file_name, aggregate in aggregates.items() if aggregate is not None}
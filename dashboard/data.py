@@ -0,0 +1,163 @@
+import contextvars
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import (backend, data_dir, file_links, indexed_files, monthly_aggregates, parse_workers,
+                     resident_files)
+from .cube import build_cubes
+from .fetch import fetch_files
+from .filters import FrameIndex, sort_for_index
+from .ingest import ingest_file, ingest_files
+from .schema import unify_categories
+from .snapshot import read_aggregate, read_meta, read_snapshot
+
+# ✅ 데이터 버전마다 보관하는 키워드 순위 인덱스 수 (버전이 회수되면 함께 사라짐)
+ranking_cache_entries = 256
+
+
+# ✅ 파일 로드 함수 - 스냅샷이 최신이면 CSV 파싱을 건너뛰고 메모리 매핑으로 읽음
+def load_dataframe(file_name, data_dir=data_dir):
+    file_path = os.path.join(data_dir, file_name)
+    if not os.path.exists(file_path):
+        fetch_files([file_name], data_dir=data_dir)
+    ingest_file(file_name, file_path, data_dir)  # 원본이 바뀐 경우에만 (증분) 적재
+    df = read_snapshot(file_name, file_path, data_dir)
+    if file_name in indexed_files:
+        df = sort_for_index(df)  # 스냅샷이 이미 (브랜드, 월) 순이므로 순서 확인만 (복사 없음)
+    return df
+
+def data_signature(data_dir=data_dir):
+    """파일별 (이름, 수정 시각, 크기) 튜플 - 파일이 바뀌면 캐시 키도 바뀜"""
+    signature = []
+    for file_name in file_links:
+        try:
+            stat = os.stat(os.path.join(data_dir, file_name))
+            signature.append((file_name, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((file_name, None, None))
+    return tuple(signature)
+
+def read_metas(data_dir=data_dir):
+    """파일별 스냅샷 메타데이터 (스냅샷이 없으면 None)"""
+    return {file_name: read_meta(file_name, data_dir) for file_name in file_links}
+
+def content_id(data_dir=data_dir, metas=None):
+    """원본 파일 내용 기준 데이터 식별자 (스냅샷에 기록된 원본 해시 조합) - 스냅샷이 없는 파일이 있으면 None
+
+    같은 내용을 다시 내려받아 수정 시각만 바뀐 경우에도, 증분 적재를 거쳐 같은 내용이 된 경우에도 같은 값이므로
+    사전 렌더링 산출물을 계속 쓸 수 있다.
+    """
+    metas = metas or read_metas(data_dir)
+    digest = hashlib.blake2b(digest_size=8)
+    for file_name in file_links:
+        meta = metas.get(file_name)
+        if meta is None:
+            return None
+        digest.update(f"{file_name}:{meta['source']['hash']}\n".encode())
+    return digest.hexdigest()
+
+def source_change(previous, meta):
+    """이전 버전 이후 스냅샷 변경 종류 - "same"(내용 그대로), "append"(뒤에 조각만 추가), None(그 밖)"""
+    if not previous or not meta:
+        return None
+    if meta["source"]["hash"] == previous["source"]["hash"]:
+        return "same"
+    count = len(previous["parts"])
+    if previous.get("high_water") and len(meta["parts"]) > count and meta["parts"][:count] == previous["parts"]:
+        return "append"
+    return None
+
+def load_dataframes(data_dir=data_dir, files=file_links):
+    """CSV(기본: 8개 전체)를 로드/정규화하여 (데이터프레임, 오류) 딕셔너리로 반환
+
+    반환된 데이터프레임은 모든 세션이 공유하므로 호출 측에서 수정하면 안 된다.
+    바뀐 CSV는 ingest_files가 작업 프로세스에서 병렬로 스냅샷에 반영하고, 스냅샷 읽기/정렬은 스레드로 동시에 실행.
+    """
+    _, errors = ingest_files(files, data_dir)
+    with ThreadPoolExecutor(max_workers=max(1, min(parse_workers, len(files)))) as pool:
+        # 스레드마다 호출 측 컨텍스트를 복사해 넘김 - 읽기 단계가 진행 중인 측정 실행에 기록됨
+        futures = {file_name: pool.submit(contextvars.copy_context().run, load_dataframe, file_name, data_dir)
+                   for file_name in files if file_name not in errors}
+    dataframes = {}
+    for file_name in files:
+        if file_name in errors:
+            dataframes[file_name] = None
+            continue
+        try:
+            dataframes[file_name] = futures[file_name].result()
+        except Exception as e:
+            dataframes[file_name] = None
+            errors[file_name] = e
+    unify_categories(dataframes)  # 브랜드/채널/감성/키워드 사전을 파일 간에 공유
+    return dataframes, errors
+
+def load_cubes(data_dir=data_dir):
+    """적재 시 계산해 둔 월별 집계로 (브랜드 × 채널 × 감성 × 월) 집계 큐브 생성"""
+    return build_cubes({file_name: read_aggregate(file_name, data_dir) for file_name in monthly_aggregates})
+
+def load_indexes(dataframes):
+    """(브랜드, 월) 정렬된 데이터프레임마다 필터 인덱스 생성"""
+    return {file_name: FrameIndex(dataframes[file_name])
+            for file_name in indexed_files if dataframes.get(file_name) is not None}
+
+
+class Dataset:
+    """게시된 데이터 버전 하나 - 데이터프레임/큐브/인덱스와 파생 객체 캐시 (게시 후에는 변경하지 않음)
+
+    세션은 rerun을 시작할 때 받은 Dataset만 끝까지 사용하므로, 백그라운드에서 다음 버전이
+    게시되어도 진행 중인 화면은 이전 버전으로 끝난다.
+    """
+
+    def __init__(self, version, signature, dataframes, errors, cubes, indexes, engine=None, content_id=None,
+                 sources=None):
+        self.version = version
+        self.signature = signature
+        self.content_id = content_id
+        self.sources = sources or {}  # 파일별 스냅샷 메타데이터 (다음 버전이 바뀐 파일을 판단할 때 사용)
+        self.dataframes = dataframes
+        self.errors = errors
+        self.cubes = cubes
+        self.indexes = indexes
+        self.engine = engine
+        self.loaded_at = time.time()
+        self._derived = OrderedDict()
+        self._lock = threading.Lock()
+
+    def cached(self, key, build):
+        """이 버전에서 만든 파생 객체(키워드 순위 등) LRU - 없으면 build()로 만들어 저장"""
+        with self._lock:
+            if key in self._derived:
+                self._derived.move_to_end(key)
+                return self._derived[key]
+        value = build()
+        with self._lock:
+            self._derived[key] = value
+            while len(self._derived) > ranking_cache_entries:
+                self._derived.popitem(last=False)
+        return value
+
+    def derived(self):
+        """캐시된 파생 객체 (키, 값) 목록 - 오래 쓰지 않은 것부터"""
+        with self._lock:
+            return list(self._derived.items())
+
+
+def load_dataset(version=0, data_dir=data_dir):
+    """현재 파일로 Dataset 구성 - pandas 백엔드는 전체 로드, duckdb 백엔드는 Parquet 엔진 + 사이드바용 파일만"""
+    signature = data_signature(data_dir)
+    if backend == "duckdb":
+        from .sql import open_engine, sql_cubes, sql_indexes
+
+        engine, errors = open_engine(data_dir)
+        dataframes, load_errors = load_dataframes(data_dir, files=resident_files)
+        metas = read_metas(data_dir)
+        return Dataset(version, signature, dataframes, {**errors, **load_errors},
+                       sql_cubes(engine), sql_indexes(engine), engine, content_id(data_dir, metas), metas)
+    dataframes, errors = load_dataframes(data_dir)
+    metas = read_metas(data_dir)
+    return Dataset(version, signature, dataframes, errors, load_cubes(data_dir), load_indexes(dataframes),
+                   content_id=content_id(data_dir, metas), sources=metas)
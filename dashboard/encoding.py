@@ -0,0 +1,93 @@
+import codecs
+import os
+
+from .files import atomic_write_json, file_hash, read_json
+
+# ✅ 순서대로 시도할 인코딩 (cp949는 euc-kr의 상위 집합)
+candidate_encodings = ["utf-8-sig", "cp949", "euc-kr"]
+
+# ✅ 샘플 읽기 단위와 최대 샘플 크기
+chunk_size = 64 * 1024
+max_sample_bytes = 1024 * 1024
+
+# ✅ 인코딩 사이드카 파일명 (데이터 폴더에 저장, 파일 해시 → 인코딩)
+sidecar_name = ".encodings.json"
+max_sidecar_entries = 64
+
+
+def sniff_encoding(file_path, candidates=candidate_encodings, max_bytes=max_sample_bytes):
+    """파일 앞부분을 chunk 단위로 읽으며 후보 인코딩으로 디코딩해 보고, 확신이 서면 바로 중단
+
+    - 한글(비 ASCII) 바이트가 포함된 구간이 디코딩되면 남은 후보 중 첫 번째를 확정
+    - 후보가 모두 실패하면 읽은 샘플만 chardet에 넘겨 추정
+    """
+    decoders = {encoding: codecs.getincrementaldecoder(encoding)() for encoding in candidates}
+    sample = bytearray()
+    has_non_ascii = False
+    with open(file_path, "rb") as f:
+        while decoders and len(sample) < max_bytes:
+            chunk = f.read(min(chunk_size, max_bytes - len(sample)))
+            eof = not chunk
+            sample += chunk
+            has_non_ascii = has_non_ascii or not chunk.isascii()
+            for encoding, decoder in list(decoders.items()):
+                try:
+                    decoder.decode(chunk, final=eof)
+                except UnicodeDecodeError:
+                    del decoders[encoding]
+            if decoders and (has_non_ascii or eof):
+                return next(iter(decoders))
+    if decoders:  # 샘플 한도까지 ASCII만 있는 경우
+        return next(iter(decoders))
+    return detect_with_chardet(bytes(sample)) or candidates[0]
+
+def detect_with_chardet(sample):
+    """chardet 점진 감지 - 확신이 서면(done) 나머지 샘플은 보지 않음"""
+    import chardet  # 후보 인코딩이 모두 실패한 경우에만 로드
+
+    detector = chardet.UniversalDetector()
+    for start in range(0, len(sample), chunk_size):
+        detector.feed(sample[start:start + chunk_size])
+        if detector.done:
+            break
+    detector.close()
+    return detector.result["encoding"]
+
+def sidecar_key(file_path, sidecar):
+    """감지 샘플(앞부분 max_sample_bytes) 해시 - 크기/수정 시각이 그대로면 사이드카에 기록된 해시를 재사용
+
+    감지는 샘플만 보므로 샘플이 같으면 결과도 같다. 뒤에 행만 추가된 파일은 다시 감지하지 않고,
+    파일 전체를 해시하지도 않는다.
+    """
+    stat = os.stat(file_path)
+    stamp = [stat.st_size, stat.st_mtime_ns]
+    known = sidecar["files"].get(os.path.basename(file_path))
+    if known and known["stamp"] == stamp:
+        return known["hash"]
+    key = file_hash(file_path, limit=min(stat.st_size, max_sample_bytes))
+    sidecar["files"][os.path.basename(file_path)] = {"stamp": stamp, "hash": key}
+    return key
+
+def update_sidecar(file_path, encoding=None):
+    """사이드카(파일 해시 → 인코딩) 조회/갱신 - encoding이 주어지면 그 값으로 기록"""
+    sidecar_path = os.path.join(os.path.dirname(file_path), sidecar_name)
+    sidecar = read_json(sidecar_path, None) or {"files": {}, "encodings": {}}
+    before = repr(sidecar)
+    key = sidecar_key(file_path, sidecar)
+    if encoding is not None:
+        sidecar["encodings"][key] = encoding
+    elif key not in sidecar["encodings"]:
+        sidecar["encodings"][key] = sniff_encoding(file_path)
+    # 오래된 항목부터 정리
+    sidecar["encodings"] = dict(list(sidecar["encodings"].items())[-max_sidecar_entries:])
+    if repr(sidecar) != before:
+        atomic_write_json(sidecar_path, sidecar)
+    return sidecar["encodings"][key]
+
+# ✅ 인코딩 감지 함수 (사이드카에 기록된 파일은 다시 감지하지 않음)
+def detect_encoding(file_path):
+    return update_sidecar(file_path)
+
+def remember_encoding(file_path, encoding):
+    """실제 파싱에 성공한 인코딩으로 사이드카 갱신"""
+    return update_sidecar(file_path, encoding)
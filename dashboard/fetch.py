@@ -0,0 +1,206 @@
+import os
+import random
+import shutil
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import (data_dir, data_source, fetch_backoff, fetch_retries, fetch_workers, file_links,
+                     refresh_interval)
+from .files import atomic_write_json, file_hash, read_json
+from .profiling import stage
+
+manifest_name = ".manifest.json"
+partial_dir_name = ".partial"
+
+
+class GdownTransport:
+    """Google Drive 다운로드 (gdown 자체의 이어받기 기능 사용)
+
+    gdown은 받는 중인 내용을 part_path 옆의 임시 파일(<part_path>*.part)에 쓰고 다 받으면 part_path로 옮긴다.
+    임시 파일은 Fetcher.partial_path가 다른 조각과 함께 오래되면 지운다.
+    """
+
+    def remote_stamp(self, file_name, file_id):
+        return None  # Drive는 가벼운 메타데이터 조회가 없으므로 주기 기반으로만 갱신
+
+    def fetch(self, file_name, file_id, part_path, remote=None):
+        import gdown  # 실제로 내려받을 때만 로드 (requests/bs4 등 import 비용이 큼)
+
+        # gdown은 출력 파일이 이미 있으면 다 받은 것으로 보고 건너뛰므로 지우고 임시 파일로만 이어받음
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        file_url = f"https://drive.google.com/uc?id={file_id}"
+        if gdown.download(file_url, part_path, quiet=True, resume=True) is None:
+            raise IOError(f"{file_name} 다운로드 실패")
+
+
+class HTTPTransport:
+    """http(s) 서버에서 <base_url>/<파일명> 다운로드 (Range + If-Range 요청으로 이어받기)"""
+
+    def __init__(self, base_url, timeout=60):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def url(self, file_name):
+        return f"{self.base_url}/{urllib.parse.quote(file_name)}"
+
+    def remote_stamp(self, file_name, file_id):
+        request = urllib.request.Request(self.url(file_name), method="HEAD")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            headers = response.headers
+            return [headers.get("ETag"), headers.get("Last-Modified"), headers.get("Content-Length")]
+
+    def fetch(self, file_name, file_id, part_path, remote=None):
+        """받던 조각이 있으면 이어받음 - If-Range로 서버 파일이 그대로일 때만 이어 붙이고, 바뀌었으면 전체를 받음"""
+        etag, last_modified = (remote or [None, None])[:2]
+        validator = etag if etag and not etag.startswith("W/") else last_modified  # 약한 ETag는 If-Range에 못 씀
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) and validator else 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+        request = urllib.request.Request(self.url(file_name), headers=headers)
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 416:  # 이미 끝까지 받은 상태
+                return
+            raise
+        with response, open(part_path, "ab" if response.status == 206 else "wb") as f:
+            shutil.copyfileobj(response, f)
+
+
+class LocalTransport:
+    """로컬 폴더에서 복사 (테스트/오프라인 환경용, 이어받기 지원)"""
+
+    def __init__(self, source_dir):
+        self.source_dir = source_dir
+
+    def remote_stamp(self, file_name, file_id):
+        stat = os.stat(os.path.join(self.source_dir, file_name))
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def fetch(self, file_name, file_id, part_path, remote=None):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        with open(os.path.join(self.source_dir, file_name), "rb") as src, open(part_path, "ab") as dst:
+            src.seek(offset)
+            shutil.copyfileobj(src, dst)
+
+
+def make_transport(source=data_source):
+    """DASHBOARD_DATA_SOURCE 값에 맞는 전송 방식 생성 (gdown / http(s) URL / 로컬 폴더)"""
+    if source == "gdown":
+        return GdownTransport()
+    if source.startswith(("http://", "https://")):
+        return HTTPTransport(source)
+    return LocalTransport(source)
+
+
+class Fetcher:
+    """원본 파일 병렬 다운로드
+
+    - 스레드 풀로 여러 파일을 동시에 받음
+    - Data/.partial 에 받은 뒤 rename 하므로 반쯤 받은 CSV가 파싱되는 일이 없음
+    - 실패하면 지수 백오프로 재시도하고, 받던 파일은 이어받음 (원격 식별 정보가 그대로일 때만)
+    - Data/.manifest.json (크기/해시/받은 시각)으로 갱신 여부 판단
+    """
+
+    def __init__(self, transport=None, data_dir=data_dir, max_workers=fetch_workers,
+                 retries=fetch_retries, backoff=fetch_backoff, max_age=refresh_interval):
+        self.transport = transport or make_transport()
+        self.data_dir = data_dir
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.max_age = max_age
+        self.manifest_path = os.path.join(data_dir, manifest_name)
+
+    def fetch_all(self, file_names=None, refresh=True):
+        """파일을 받아 {파일명: 경로} 반환 - refresh=False면 없는 파일만 받음
+
+        일부 파일이 실패해도 받은 파일의 manifest 항목은 기록한 뒤 첫 오류를 다시 발생시킨다.
+        """
+        file_names = list(file_names or file_links)
+        manifest = read_json(self.manifest_path, {})
+        entries, errors = {}, []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {name: pool.submit(self.fetch_one, name, manifest.get(name), refresh) for name in file_names}
+            for name, future in futures.items():
+                try:
+                    entries[name] = future.result()
+                except Exception as e:
+                    errors.append(e)
+        # 다른 프로세스가 그 사이 기록한 항목을 지우지 않도록 다시 읽어서 병합
+        manifest = read_json(self.manifest_path, {})
+        manifest.update({name: entry for name, entry in entries.items() if entry is not None})
+        atomic_write_json(self.manifest_path, manifest)
+        if errors:
+            raise errors[0]
+        return {name: os.path.join(self.data_dir, name) for name in file_names}
+
+    def fetch_one(self, file_name, entry, refresh):
+        """파일 하나 처리 - 바뀐 내용이 있을 때만 교체하고 갱신된 manifest 항목 반환"""
+        file_path = os.path.join(self.data_dir, file_name)
+        exists = os.path.exists(file_path)
+        if exists and not refresh:
+            return None
+        remote = self.with_retries(self.transport.remote_stamp, file_name, file_links.get(file_name))
+        if exists and not entry:
+            # 기록 없이 이미 있던 파일은 그대로 받아들이고 다음 주기부터 비교
+            now = time.time()
+            return {"size": os.path.getsize(file_path), "hash": file_hash(file_path), "remote": remote,
+                    "fetched_at": os.path.getmtime(file_path), "checked_at": now}
+        if exists:
+            if remote is not None and entry.get("remote") == remote:
+                return dict(entry, checked_at=time.time())
+            if remote is None and time.time() - entry.get("checked_at", 0) < self.max_age:
+                return None
+
+        part_path = self.partial_path(file_name, remote)
+        self.with_retries(self.transport.fetch, file_name, file_links.get(file_name), part_path, remote)
+        os.remove(self.stamp_path(file_name))
+        digest = file_hash(part_path)
+        if entry and os.path.exists(file_path) and entry.get("hash") == digest:
+            os.remove(part_path)  # 내용이 같으면 기존 파일 유지 (수정 시각 그대로 → 캐시 유지)
+        else:
+            os.replace(part_path, file_path)
+        now = time.time()
+        return {"size": os.path.getsize(file_path), "hash": digest, "remote": remote,
+                "fetched_at": now, "checked_at": now}
+
+    def stamp_path(self, file_name):
+        """받던 조각의 원격 식별 정보 파일"""
+        return os.path.join(self.data_dir, partial_dir_name, file_name + ".stamp")
+
+    def partial_path(self, file_name, remote=None):
+        """이어받을 조각 경로 - 남은 조각(전송 방식의 임시 파일 포함)이 다른 원격 버전이거나 너무 오래됐으면 지움
+
+        원격 식별 정보(remote)는 조각 옆에 기록해 두고 다음 시도에서 비교한다 (바뀐 원본의 바이트가
+        이전 원본의 조각 뒤에 이어 붙는 일이 없게). 식별 정보가 없는 전송 방식은 max_age로만 판단.
+        """
+        partial_dir = os.path.join(self.data_dir, partial_dir_name)
+        os.makedirs(partial_dir, exist_ok=True)
+        part_path = os.path.join(partial_dir, file_name + ".part")
+        stamp_path = self.stamp_path(file_name)
+        changed = read_json(stamp_path, {}).get("remote") != remote
+        for name in os.listdir(partial_dir):
+            path = os.path.join(partial_dir, name)
+            if name.startswith(file_name + ".part") and (changed or time.time() - os.path.getmtime(path) > self.max_age):
+                os.remove(path)
+        atomic_write_json(stamp_path, {"remote": remote})
+        return part_path
+
+    def with_retries(self, func, *args):
+        for attempt in range(self.retries + 1):
+            try:
+                return func(*args)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt + random.uniform(0, self.backoff))
+
+
+# ✅ 전체 파일 다운로드/갱신 (refresh=False면 이미 있는 파일은 건너뜀)
+def fetch_files(file_names=None, data_dir=data_dir, refresh=False):
+    with stage("fetch", files=len(file_names or file_links)):
+        return Fetcher(data_dir=data_dir).fetch_all(file_names, refresh=refresh)
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+
+from .config import month_column
+from .schema import month_dates
+
+
+def grid_domains(rows, cols):
+    """make_subplots 기본 간격(셀 제목이 있을 때)과 같은 셀별 (x 영역, y 영역) - 왼쪽 위 셀부터 행 우선 순서"""
+    horizontal_spacing, vertical_spacing = 0.2 / cols, 0.5 / rows
+    width = (1.0 - horizontal_spacing * (cols - 1)) / cols
+    height = (1.0 - vertical_spacing * (rows - 1)) / rows
+    domains = []
+    for r in range(rows):
+        top = 1.0 - r * (height + vertical_spacing)
+        for c in range(cols):
+            left = c * (width + horizontal_spacing)
+            domains.append(([left, left + width], [max(top - height, 0.0), min(top, 1.0)]))
+    return domains
+
+def partition(series, keywords, keyword_column):
+    """선택된 키워드 행 위치를 groupby 한 번으로 나눔 → {키워드: 행 위치 배열}"""
+    groups = series.groupby(keyword_column, observed=True, sort=False).indices
+    empty = np.array([], dtype=np.intp)
+    return {keyword: groups.get(keyword, empty) for keyword in keywords}
+
+def small_multiples(series, keywords, keyword_column, value_column, rows=None, cols=3,
+                    trace=None, xaxis=None, yaxis=None, layout=None):
+    """키워드별 월 추이 막대그래프 격자 - 트레이스/축 설정을 dict로 모아 Figure를 한 번에 생성
+
+    series는 (키워드, 월 키, 값) 시계열(KeywordRanking.series), rows를 주지 않으면 키워드 수에 맞춰 결정.
+    trace/xaxis/yaxis는 모든 셀에 공통으로 적용할 속성, layout은 전체 레이아웃 속성.
+    make_subplots + 셀마다 add_trace/update_*axes를 호출하는 방식과 같은 그림을 만듦.
+    """
+    import plotly.graph_objects as go
+
+    rows = rows or max(1, math.ceil(len(keywords) / cols))
+    keywords = list(keywords)[:rows * cols]
+    positions = partition(series, keywords, keyword_column)
+    dates = month_dates(series[month_column].to_numpy())  # 날짜 변환은 전체 시계열에 한 번만
+    values = series[value_column].to_numpy()
+
+    figure_layout = dict(layout or {})
+    annotations = []
+    traces = []
+    for i, (x_domain, y_domain) in enumerate(grid_domains(rows, cols)):
+        suffix = "" if i == 0 else str(i + 1)
+        figure_layout[f"xaxis{suffix}"] = dict(xaxis or {}, anchor=f"y{suffix}", domain=x_domain)
+        figure_layout[f"yaxis{suffix}"] = dict(yaxis or {}, anchor=f"x{suffix}", domain=y_domain)
+        if i >= len(keywords):
+            continue
+        keyword = keywords[i]
+        rows_of_keyword = positions[keyword]
+        traces.append(dict(trace or {}, type="bar", x=dates[rows_of_keyword], y=values[rows_of_keyword],
+                           name=keyword, xaxis=f"x{suffix}", yaxis=f"y{suffix}"))
+        annotations.append(dict(text=f"<b>{keyword}</b>", x=sum(x_domain) / 2, y=y_domain[1],
+                                xref="paper", yref="paper", xanchor="center", yanchor="bottom",
+                                showarrow=False, font=dict(size=16)))
+    figure_layout["annotations"] = annotations + list(figure_layout.get("annotations", []))
+    return go.Figure(data=traces, layout=figure_layout)
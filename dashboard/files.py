@@ -0,0 +1,40 @@
+import hashlib
+import json
+import os
+import tempfile
+
+
+def file_hash(file_path, limit=None, offset=0, chunk_size=1024 * 1024):
+    """파일 내용 해시 (blake2b, 16진수 문자열) - offset부터 limit 바이트만 해시 (기본: 파일 전체)"""
+    digest = hashlib.blake2b()
+    remaining = os.path.getsize(file_path) - offset if limit is None else limit
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+def read_json(path, default=None):
+    """JSON 파일 읽기 - 없거나 깨져 있으면 default 반환"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+def atomic_write_json(path, data):
+    """같은 폴더의 임시 파일에 쓴 뒤 교체 - 읽는 쪽은 항상 완전한 파일만 보게 됨"""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from .config import month_column
+from .schema import month_key
+
+
+def brand_keys(brands):
+    """브랜드 정렬 키 - 라벨 사전순 정수 코드 (브랜드가 없는 행은 -1, 범주 사전의 순서와 무관)"""
+    codes, uniques = pd.factorize(brands)
+    if not len(uniques):
+        return codes
+    ranks = np.argsort(np.argsort(pd.Index(uniques).astype(str), kind="stable"))
+    return np.where(codes >= 0, ranks[codes], -1)
+
+def index_order(brands, months=None):
+    """(브랜드, 월) 안정 정렬 순서 - 정수 키로 lexsort (범주형 다중 컬럼 sort_values보다 훨씬 빠름)"""
+    keys = [brand_keys(brands)]
+    if months is not None:
+        keys.insert(0, np.asarray(months))
+    return np.lexsort(keys)
+
+def is_index_sorted(brands, months=None):
+    """이미 (브랜드, 월) 순인지 확인 (복사 없이 인접 행 비교만)"""
+    step = np.diff(brand_keys(brands))
+    if months is None:
+        return bool((step >= 0).all())
+    return bool(((step > 0) | ((step == 0) & (np.diff(np.asarray(months)) >= 0))).all())
+
+def sort_for_index(df, brand_column="브랜드", month_column=month_column):
+    """(브랜드, 월) 순으로 안정 정렬 - 같은 키 안에서는 원래 행 순서 유지, 날짜 없는 행(월 키 -1)은 브랜드 구간 맨 앞
+
+    스냅샷은 이 순서로 기록되므로 보통은 순서 확인만 하고 그대로 반환한다 (메모리 매핑된 데이터를 복사하지 않음).
+    """
+    if brand_column not in df.columns:
+        return df
+    months = df[month_column].to_numpy() if month_column in df.columns else None
+    if is_index_sorted(df[brand_column], months):
+        return df
+    return df.take(index_order(df[brand_column], months)).reset_index(drop=True)
+
+
+class FrameIndex:
+    """브랜드/채널/기간 필터를 전체 스캔 없이 처리하는 인덱스 (sort_for_index로 정렬된 프레임 전용)
+
+    - 브랜드별 행 구간(offset)을 저장해 두고 브랜드 선택은 구간 슬라이스로 처리
+    - 구간 안의 월 키는 정렬되어 있으므로 시작 월은 searchsorted로 찾음
+    - 채널은 범주 코드 비트맵으로 걸러내고, 모든 채널이 선택되면 슬라이스(뷰)를 그대로 반환
+    """
+
+    def __init__(self, df, brand_column="브랜드", month_column=month_column, channel_column="채널"):
+        self.df = df
+        codes, uniques = pd.factorize(df[brand_column])
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.r_[0, boundaries] if len(df) else np.array([], dtype=np.intp)
+        stops = np.r_[boundaries, len(df)] if len(df) else np.array([], dtype=np.intp)
+        # 브랜드가 비어 있는 행(코드 -1)은 어느 브랜드에도 속하지 않으므로 구간에서 제외
+        valid = codes[starts] >= 0
+        starts, stops = starts[valid], stops[valid]
+        self.offsets = {str(uniques[codes[start]]): (int(start), int(stop)) for start, stop in zip(starts, stops)}
+        if len(self.offsets) != len(starts):
+            raise ValueError("sort_for_index로 정렬된 데이터프레임이 아닙니다.")
+
+        self.months = None
+        if month_column in df.columns:
+            self.months = df[month_column].to_numpy()  # 날짜 없는 행(-1)은 구간 맨 앞에 위치
+
+        self.channel_codes = None
+        if channel_column in df.columns:
+            channels = pd.Categorical(df[channel_column])
+            self.channel_codes = channels.codes
+            self.channel_lookup = {label: code for code, label in enumerate(channels.categories)}
+
+    def query(self, brand, channels=None, since=None):
+        """브랜드 brand, 채널 channels, since(날짜 또는 월 키)가 속한 달 이후 행 반환 (채널을 거르지 않으면 복사 없는 뷰)"""
+        if brand not in self.offsets:
+            return self.df.iloc[0:0]
+        start, stop = self.offsets[brand]
+        if since is not None and self.months is not None:
+            start += int(np.searchsorted(self.months[start:stop], month_key(since), side="left"))
+        result = self.df.iloc[start:stop]
+        if channels is not None and self.channel_codes is not None:
+            # 마지막 칸은 채널 값이 없는 행(코드 -1)용으로 항상 False
+            bitmap = np.zeros(len(self.channel_lookup) + 1, dtype=bool)
+            for channel in channels:
+                if channel in self.channel_lookup:
+                    bitmap[self.channel_lookup[channel]] = True
+            mask = bitmap[self.channel_codes[start:stop]]
+            if not mask.all():
+                result = result[mask]
+        return result
@@ -0,0 +1,171 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .config import data_dir, date_formats, file_links, incremental_ingest, parse_chunk_mb, parse_workers
+from .encoding import detect_encoding
+from .fetch import fetch_files
+from .parse import parse_csv, parse_csv_range, parse_csv_tail
+from .profiling import add_stages, profiled
+from .snapshot import (append_snapshot, commit_parts, is_fresh, new_meta, read_meta, snapshot_dir, tail_hash,
+                       write_part_files, write_snapshot)
+
+
+def appended_since(meta, source_path):
+    """스냅샷을 만든 뒤 원본 CSV 뒤에 행만 추가되었는지 확인 (이전 크기 직전 tail_window 구간 해시 비교)
+
+    비교 구간 크기가 일정하므로 원본 이력이 길어져도 확인 비용은 그대로다. 그 구간보다 앞만 바뀐
+    경우는 잡지 못하므로, 새 행 날짜가 이전 최신 날짜보다 뒤인지 한 번 더 확인한다 (ingest_file).
+    """
+    previous = meta["source"]
+    size = os.path.getsize(source_path)
+    if previous["size"] == 0 or size <= previous["size"]:
+        return False
+    with open(source_path, "rb") as f:
+        f.seek(previous["size"] - 1)
+        if f.read(1) != b"\n":  # 마지막 줄이 끝나지 않은 상태에서 이어 쓴 경우
+            return False
+    return tail_hash(source_path, previous["size"]) == previous["tail_hash"]
+
+def can_append(file_name, meta, source_path):
+    """증분 적재 대상인지 (날짜가 있는 파일 + 이전 최신 날짜 기록 + 뒤에 행만 추가됨)"""
+    return bool(incremental_ingest and file_name in date_formats and meta and meta.get("high_water")
+                and appended_since(meta, source_path))
+
+def byte_ranges(source_path, chunk_bytes):
+    """헤더 다음부터 약 chunk_bytes 크기로 나눈 (시작, 끝) 바이트 구간 - 끝은 항상 줄바꿈 바로 뒤"""
+    size = os.path.getsize(source_path)
+    ranges = []
+    with open(source_path, "rb") as f:
+        f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def ingest_file(file_name, source_path, data_dir=data_dir):
+    """원본 CSV를 스냅샷에 반영하고 적재 방식("fresh"/"append"/"full") 반환
+
+    날짜 컬럼이 있는 월별 파일은 최신 날짜(high-water mark)를 기록해 두고,
+    원본 뒤에 행만 추가된 경우 새 행만 파싱해서 붙인다 (월별 집계도 새 달만 계산).
+    새 행에 기존 날짜 이하의 데이터가 섞여 있으면 과거 데이터가 바뀐 것이므로 전체 재적재.
+    """
+    meta = read_meta(file_name, data_dir)
+    if is_fresh(meta, source_path):
+        return "fresh"
+    if can_append(file_name, meta, source_path):
+        new_rows = parse_csv_tail(file_name, source_path, meta["source"]["size"])
+        if (new_rows["날짜"] > pd.Timestamp(meta["high_water"])).all():
+            append_snapshot(file_name, new_rows, source_path, data_dir)
+            return "append"
+    write_snapshot(file_name, parse_csv(file_name, source_path), source_path, data_dir)
+    return "full"
+
+def ingest_range(file_name, source_path, start, end, number, data_dir=data_dir):
+    """(작업 프로세스) 원본의 바이트 구간 하나를 파싱/정규화해 스냅샷 조각으로 기록 → 조각 정보만 반환"""
+    df = parse_csv_range(file_name, source_path, start, end)
+    return write_part_files(file_name, df, snapshot_dir(file_name, data_dir), number)
+
+def limit_arrow_threads(threads):
+    """(작업 프로세스 초기화) 프로세스마다 Arrow 스레드 수를 나눠 코어 수를 넘지 않게 함"""
+    import pyarrow as pa
+
+    pa.set_cpu_count(threads)
+
+def process_pool(workers, initializer=limit_arrow_threads, initargs=(), preload=(__name__,)):
+    """작업 프로세스 풀 - 가능하면 preload 모듈(pandas/pyarrow 등)을 미리 로드한 forkserver에서 작업 프로세스를 만듦
+
+    initializer는 작업 프로세스마다 (Arrow 스레드 수, *initargs)로 한 번 호출된다.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(list(preload))
+    else:
+        context = multiprocessing.get_context("spawn")
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=initializer, initargs=(threads, *initargs))
+
+def worker_result(future):
+    """작업 프로세스 결과 - 작업 프로세스에서 측정한 단계는 진행 중인 측정 실행에 합침"""
+    result, stages = future.result()
+    add_stages(stages)
+    return result
+
+def ingest_files(files, data_dir=data_dir, workers=parse_workers, chunk_bytes=parse_chunk_mb * 1024 * 1024):
+    """여러 CSV를 (필요한 경우에만) 동시에 스냅샷으로 반영 → ({파일명: 적재 방식}, {파일명: 오류})
+
+    파싱/정규화는 작업 프로세스에서 실행하고 결과는 스냅샷(Arrow IPC) 조각 파일로만 주고받는다 -
+    읽는 쪽은 조각을 메모리 매핑하므로 데이터프레임을 피클링해서 돌려받지 않는다.
+    전체 재적재할 파일이 chunk_bytes보다 크면 줄 경계 바이트 구간으로 나눠 구간마다 조각 하나를 만든다.
+    """
+    modes, errors, stale = {}, {}, []
+    for file_name in files:
+        source_path = os.path.join(data_dir, file_name)
+        try:
+            if not os.path.exists(source_path):
+                fetch_files([file_name], data_dir=data_dir)
+            if is_fresh(read_meta(file_name, data_dir), source_path):
+                modes[file_name] = "fresh"
+            else:
+                stale.append(file_name)
+        except Exception as e:
+            errors[file_name] = e
+
+    stale_bytes = sum(os.path.getsize(os.path.join(data_dir, file_name)) for file_name in stale)
+    if workers <= 1 or stale_bytes < chunk_bytes:  # 적재할 양이 적으면 프로세스 시작 비용이 더 큼
+        for file_name in stale:
+            try:
+                modes[file_name] = ingest_file(file_name, os.path.join(data_dir, file_name), data_dir)
+            except Exception as e:
+                errors[file_name] = e
+        return modes, errors
+
+    with process_pool(workers) as pool:
+        jobs = {}
+        for file_name in stale:
+            source_path = os.path.join(data_dir, file_name)
+            try:
+                # 인코딩 사이드카를 먼저 기록 - 작업 프로세스들이 같은 파일을 동시에 감지/기록하지 않게 함
+                detect_encoding(source_path)
+                meta = read_meta(file_name, data_dir)
+                if os.path.getsize(source_path) <= chunk_bytes or can_append(file_name, meta, source_path):
+                    jobs[file_name] = (None, [pool.submit(profiled, ingest_file, file_name, source_path, data_dir)])
+                    continue
+                meta = new_meta(file_name, data_dir)
+                os.makedirs(snapshot_dir(file_name, data_dir), exist_ok=True)
+                jobs[file_name] = (meta, [pool.submit(profiled, ingest_range, file_name, source_path, start, end,
+                                                      meta["next_part"] + i, data_dir)
+                                          for i, (start, end) in enumerate(byte_ranges(source_path, chunk_bytes))])
+            except Exception as e:
+                errors[file_name] = e
+        for file_name, (meta, futures) in jobs.items():
+            try:
+                if meta is None:
+                    modes[file_name] = worker_result(futures[0])
+                    continue
+                # 구간 순서대로 조각을 이어 붙여 한 번에 게시 (원래 행 순서 유지)
+                commit_parts(file_name, [worker_result(future) for future in futures],
+                             os.path.join(data_dir, file_name), meta, data_dir)
+                modes[file_name] = "full"
+            except Exception as e:
+                errors[file_name] = e
+    return modes, errors
+
+def ingest_all(data_dir=data_dir):
+    """모든 CSV를 (없으면 내려받아, 필요한 경우에만) 스냅샷으로 반영 - 배포/초기화 단계에서 실행"""
+    return ingest_files(file_links, data_dir)
+
+
+if __name__ == "__main__":
+    modes, errors = ingest_all()
+    for file_name, mode in modes.items():
+        print(f"✅ {file_name}: {mode}")
+    for file_name, error in errors.items():
+        print(f"⚠️ {file_name}: {error}")
@@ -0,0 +1,64 @@
+import io
+import os
+
+import pandas as pd
+
+from .config import date_formats, month_column, parse_engine, string_columns
+from .encoding import candidate_encodings, detect_encoding, remember_encoding
+from .profiling import stage
+from .schema import month_keys
+
+
+# ✅ 날짜 변환 및 컬럼 타입 정리 (로드 시 한 번만 수행)
+def normalize_dataframe(file_name, df):
+    date_format = date_formats.get(file_name)
+    if date_format and "날짜" in df.columns:
+        with stage("to_datetime", file=file_name, rows=len(df)):
+            df["날짜"] = pd.to_datetime(df["날짜"], format=date_format, errors="coerce")
+            df[month_column] = month_keys(df["날짜"])  # '연도-월' 문자열 대신 int16 월 키
+    for column in string_columns.get(file_name, []):
+        if column in df.columns:
+            df[column] = df[column].astype(str)
+    return df
+
+def read_csv(source, encoding, file_name):
+    """CSV 읽기 - parse_engine(기본 pyarrow 멀티스레드)으로 파싱, 날짜 컬럼은 문자열로 받아 정규화에서 변환"""
+    dtype = {"날짜": "str"} if file_name in date_formats else None
+    return pd.read_csv(source, encoding=encoding, engine=parse_engine, dtype=dtype)
+
+def read_csv_with_fallback(file_path, open_source):
+    """감지한 인코딩으로 읽고, 샘플 이후 구간에서 디코딩이 실패하면 남은 후보 인코딩으로 재시도"""
+    file_name = os.path.basename(file_path)
+    with stage("detect_encoding", file=file_name):
+        encoding = detect_encoding(file_path)  # 자동 인코딩 감지 (샘플 기반, 사이드카 캐시)
+    try:
+        with stage("read_csv", file=file_name, bytes=os.path.getsize(file_path)) as timer:
+            df = read_csv(open_source(), encoding, file_name)
+            timer.count(rows=len(df))
+        return df
+    except UnicodeDecodeError:
+        for fallback in [enc for enc in candidate_encodings if enc != encoding]:
+            try:
+                df = read_csv(open_source(), fallback, file_name)
+            except UnicodeDecodeError:
+                continue
+            remember_encoding(file_path, fallback)
+            return df
+        raise
+
+# ✅ CSV 파일 파싱 함수 (자동 인코딩 감지 + 정규화)
+def parse_csv(file_name, file_path):
+    return normalize_dataframe(file_name, read_csv_with_fallback(file_path, lambda: file_path))
+
+def parse_csv_range(file_name, file_path, start, end=None):
+    """start~end 바이트 구간의 행만 파싱 (헤더는 파일 첫 줄 재사용, 구간 경계는 줄 경계여야 함)"""
+    with open(file_path, "rb") as f:
+        header = f.readline()
+        f.seek(start)
+        body = f.read() if end is None else f.read(end - start)
+    df = read_csv_with_fallback(file_path, lambda: io.BytesIO(header + body))
+    return normalize_dataframe(file_name, df)
+
+def parse_csv_tail(file_name, file_path, offset):
+    """offset 바이트 이후에 추가된 행만 파싱"""
+    return parse_csv_range(file_name, file_path, offset)
@@ -0,0 +1,43 @@
+"""직렬화해 둔 그래프 - 화면 캐시/사전 렌더링 산출물의 그래프를 rerun마다 다시 직렬화하지 않도록
+
+plotly를 쓰는 모듈이므로 그래프를 다룰 때만 import 한다 (views/prerender에서 지연 로드).
+"""
+import json
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+class SerializedFigure(go.Figure):
+    """JSON으로 한 번 직렬화한 그래프 - to_dict/to_plotly_json이 JSON 타입만 남은 사전을 복사 없이 반환
+
+    st.plotly_chart는 그래프를 to_dict로 꺼내 JSON으로 바꾸는데, 일반 Figure의 to_dict는 깊은 복사와
+    numpy 배열 변환을 하므로 rerun마다 수 ms가 든다. 이 사전은 JSON 타입만 있어 인코딩만 하면 된다.
+    그래프 속성 자체는 비어 있으므로 수정하지 말고 출력에만 쓴다.
+    """
+
+    def __init__(self, spec):
+        super().__init__()
+        self._spec = spec
+        self._plain = json.loads(spec)
+
+    @property
+    def nbytes(self):
+        """직렬화된 JSON 길이 (화면 캐시 크기 계산용)"""
+        return len(self._spec)
+
+    def to_dict(self):
+        return self._plain
+
+    def to_plotly_json(self):
+        return self._plain
+
+    def to_json(self, *args, **kwargs):
+        return self._spec
+
+
+def serialize_figure(fig):
+    """그래프를 SerializedFigure로 변환 (이미 변환된 그래프는 그대로)"""
+    if isinstance(fig, SerializedFigure):
+        return fig
+    return SerializedFigure(pio.to_json(fig, validate=False))
@@ -0,0 +1,257 @@
+"""사전 렌더링 - 전체 선택 조합(브랜드 × 기간 × 화면)의 그래프/테이블을 데이터 버전별 산출물 폴더에 미리 저장
+
+    python -m dashboard.prerender                   # 작업 프로세스 수 = DASHBOARD_PARSE_WORKERS
+    python -m dashboard.prerender --workers 4 --html
+
+조합은 브랜드 × 기간 4개 × (1번 탭 화면, 감성어 테이블 3개, 2번 탭 화면, 3번 탭 격자 25개)와
+비교 브랜드 카드(레지스트리 기본 비교/카테고리별) × 기간이다. 채널은 사이드바 기본 선택만 미리 만든다.
+산출물은 <artifact_dir>/<데이터 식별자>-v<형식 버전>/ 에 manifest.json(화면 키 → 값 구조)과 그래프
+(Plotly JSON, --html이면 HTML도), 테이블(Arrow IPC) 파일로 저장한다. 임시 폴더에 모두 쓴 뒤 폴더
+이름을 바꿔 게시하므로 앱은 완성된 산출물만 본다.
+
+DASHBOARD_VIEW_SOURCE=prerendered로 실행한 앱은 현재 데이터와 식별자가 같은 산출물이 있으면 화면을
+여기서 읽고, 산출물에 없는 화면(직접 고른 채널/비교 브랜드 조합 등)만 계산한다.
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import threading
+import time
+
+from .config import artifact_dir, artifact_keep, data_dir, parse_workers
+from .files import atomic_write_json, read_json
+
+# ✅ 산출물 형식/화면 구성이 바뀌면 올려서 기존 산출물을 무효화 (그래프 모양을 바꾼 경우 포함)
+artifact_version = 1
+
+manifest_name = "manifest.json"
+
+# 작업 프로세스별 Dataset과 출력 위치 (process_pool 초기화 시 설정)
+_worker = {}
+
+
+def artifact_name(content_id):
+    return f"{content_id}-v{artifact_version}"
+
+def key_name(key):
+    """화면 키 → 파일 이름 접두사"""
+    return hashlib.blake2b(repr(key).encode(), digest_size=10).hexdigest()
+
+def write_frame(path, df):
+    """테이블을 Arrow IPC 파일로 저장 (MultiIndex 컬럼/nullable 정수/범주형은 pandas 메타데이터로 복원)"""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = pa.Table.from_pandas(df)
+    with pa.OSFile(path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+def read_frame(path):
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    return ipc.open_file(pa.memory_map(path, "r")).read_all().to_pandas()
+
+def encode(value, directory, name, html=False):
+    """화면 값(그래프/테이블/dict/tuple/스칼라)을 파일로 쓰고 manifest에 넣을 구조 반환"""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        write_frame(os.path.join(directory, f"{name}.arrow"), value)
+        return {"table": f"{name}.arrow"}
+    if hasattr(value, "to_plotly_json"):
+        import plotly.io as pio
+
+        with open(os.path.join(directory, f"{name}.json"), "w", encoding="utf-8") as f:
+            f.write(pio.to_json(value, validate=False))
+        entry = {"figure": f"{name}.json"}
+        if html:
+            value.write_html(os.path.join(directory, f"{name}.html"), include_plotlyjs="cdn")
+            entry["html"] = f"{name}.html"
+        return entry
+    if isinstance(value, dict):
+        return {"dict": {key: encode(item, directory, f"{name}-{key}", html) for key, item in value.items()}}
+    if isinstance(value, (list, tuple)):
+        items = [encode(item, directory, f"{name}-{i}", html) for i, item in enumerate(value)]
+        return {"tuple": items} if isinstance(value, tuple) else {"list": items}
+    if isinstance(value, np.generic):
+        value = value.item()
+    return {"value": value}
+
+def decode(entry, directory):
+    if "table" in entry:
+        return read_frame(os.path.join(directory, entry["table"]))
+    if "figure" in entry:
+        from .payloads import SerializedFigure
+
+        # plotly가 직접 쓴 JSON을 그대로 직렬화된 그래프로 사용 (Figure 구성/검증 없이, 출력 JSON은 같음)
+        with open(os.path.join(directory, entry["figure"]), encoding="utf-8") as f:
+            return SerializedFigure(f.read())
+    if "dict" in entry:
+        return {key: decode(item, directory) for key, item in entry["dict"].items()}
+    if "tuple" in entry:
+        return tuple(decode(item, directory) for item in entry["tuple"])
+    if "list" in entry:
+        return [decode(item, directory) for item in entry["list"]]
+    return entry["value"]
+
+
+class ArtifactStore:
+    """게시된 산출물 하나 - 화면 키로 조회, 없으면 직접 계산 (스레드 안전)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        manifest = read_json(os.path.join(directory, manifest_name), {})
+        self.content_id = manifest.get("content_id")
+        self.entries = manifest.get("entries", {})
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def load(self, key, build):
+        """key 화면을 산출물에서 읽음 - 없거나 읽지 못하면(정리된 이전 버전 등) build()로 계산"""
+        entry = self.entries.get(repr(key))
+        if entry is not None:
+            try:
+                value = decode(entry, self.directory)
+            except OSError:
+                entry = None
+        with self.lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return build() if entry is None else value
+
+    def stats(self):
+        with self.lock:
+            return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+
+def open_artifacts(content_id, artifact_dir=artifact_dir):
+    """데이터 식별자에 맞는 산출물 - 아직 만들지 않았으면 None"""
+    if content_id is None:
+        return None
+    directory = os.path.join(artifact_dir, artifact_name(content_id))
+    if not os.path.exists(os.path.join(directory, manifest_name)):
+        return None
+    return ArtifactStore(directory)
+
+def render_tasks(dataset, registry):
+    """작업 목록 - 브랜드별 화면 (기간 전체) + 비교 브랜드 집합별 카드 (기간 전체)"""
+    from .tabs import channel_options
+
+    df_buzz = dataset.dataframes["01.Social_Buzz_Monthly.csv"]
+    brands = list(df_buzz["브랜드"].unique())
+    compare_sets = [registry.comparison_set(brands, None)]
+    compare_sets += [registry.comparison_set(brands, category) for category in registry.categories()]
+    tasks = [("brand", brand) for brand in brands]
+    tasks += [("cards", compare_key) for compare_key in dict.fromkeys(map(tuple, compare_sets))]
+    _, channels = channel_options(df_buzz)
+    return tasks, tuple(sorted(channels))
+
+def task_specs(dataset, task, channel_key):
+    """작업 하나의 (화면 키, 구성 함수) - 앱과 같은 *_spec 함수를 사용하므로 키가 항상 같음"""
+    from .tabs import (cards_spec, keyword_grid_spec, keyword_types, period_options, rank_range_options,
+                       search_spec, sentiment_keywords_spec, sentiments, social_spec)
+
+    kind, value = task
+    for period, period_start in period_options(dataset.dataframes["01.Social_Buzz_Monthly.csv"]).items():
+        if kind == "cards":
+            yield cards_spec(dataset, "01.Social_Buzz_Monthly.csv", value, channel_key, period_start)
+            yield cards_spec(dataset, "02.SearchVolume_Monthly.csv", value, None, period_start)
+            continue
+        yield social_spec(dataset, value, channel_key, period, period_start)
+        for sentiment in sentiments:
+            yield sentiment_keywords_spec(dataset, value, channel_key, period_start, sentiment)
+        yield search_spec(dataset, value, period, period_start)
+        for keyword_type in keyword_types:
+            for sentiment in sentiments if keyword_type == "감성어" else ["해당 없음"]:
+                for selected_range in rank_range_options:
+                    yield keyword_grid_spec(dataset, value, channel_key, period, period_start,
+                                            keyword_type, sentiment, selected_range)
+
+def render_task(dataset, task, channel_key, directory, html=False):
+    """작업 하나의 화면을 모두 구성해 파일로 저장 → {repr(화면 키): manifest 항목}"""
+    entries = {}
+    for key, build in task_specs(dataset, task, channel_key):
+        entries[repr(key)] = encode(build(), directory, key_name(key), html)
+    return entries
+
+def start_worker(threads, data_dir, directory, html):
+    """(작업 프로세스 초기화) Arrow 스레드 수 제한 후 Dataset을 한 번만 로드 (스냅샷 메모리 매핑)"""
+    from .data import load_dataset
+    from .ingest import limit_arrow_threads
+
+    limit_arrow_threads(threads)
+    _worker.update(dataset=load_dataset(data_dir=data_dir), directory=directory, html=html)
+
+def render_in_worker(task, channel_key):
+    return render_task(_worker["dataset"], task, channel_key, _worker["directory"], _worker["html"])
+
+def prune_artifacts(artifact_dir=artifact_dir, keep=artifact_keep):
+    """최근 keep개 버전만 남기고 이전 산출물 폴더 삭제 (다른 프로세스가 만드는 중인 임시 폴더는 그대로 둠)"""
+    published = [name for name in os.listdir(artifact_dir)
+                 if not name.endswith(".tmp") and os.path.isdir(os.path.join(artifact_dir, name))]
+    published.sort(key=lambda name: os.path.getmtime(os.path.join(artifact_dir, name)), reverse=True)
+    for name in published[keep:]:
+        shutil.rmtree(os.path.join(artifact_dir, name), ignore_errors=True)
+
+def prerender(data_dir=data_dir, artifact_dir=artifact_dir, workers=parse_workers, html=False, force=False):
+    """현재 데이터로 전체 조합을 렌더링해 산출물 게시 → (산출물 폴더, 화면 수, 초) - 이미 있으면 건너뜀 (화면 수 None)"""
+    from .brands import load_registry
+    from .data import load_dataset
+    from .ingest import process_pool
+
+    start = time.perf_counter()
+    dataset = load_dataset(data_dir=data_dir)  # 바뀐 원본은 여기서 스냅샷에 반영 (작업 프로세스는 읽기만)
+    if dataset.errors or dataset.content_id is None:
+        raise RuntimeError(f"데이터 로드 실패: {dataset.errors}")
+    directory = os.path.join(artifact_dir, artifact_name(dataset.content_id))
+    if os.path.exists(os.path.join(directory, manifest_name)) and not force:
+        return directory, None, time.perf_counter() - start
+
+    tmp_directory = f"{directory}.{os.getpid()}.tmp"
+    os.makedirs(tmp_directory, exist_ok=True)
+    tasks, channel_key = render_tasks(dataset, load_registry())
+    entries = {}
+    try:
+        if workers <= 1:
+            for task in tasks:
+                entries.update(render_task(dataset, task, channel_key, tmp_directory, html))
+        else:
+            with process_pool(workers, initializer=start_worker, initargs=(data_dir, tmp_directory, html),
+                              preload=(__name__, "dashboard.tabs")) as pool:
+                for result in pool.map(render_in_worker, tasks, [channel_key] * len(tasks)):
+                    entries.update(result)
+        atomic_write_json(os.path.join(tmp_directory, manifest_name), {
+            "content_id": dataset.content_id,
+            "format": artifact_version,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "entries": entries,
+        })
+        shutil.rmtree(directory, ignore_errors=True)  # --force로 다시 만드는 경우
+        os.rename(tmp_directory, directory)
+    except BaseException:
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+        raise
+    prune_artifacts(artifact_dir)
+    return directory, len(entries), time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전체 선택 조합 사전 렌더링")
+    parser.add_argument("--workers", type=int, default=parse_workers, help="작업 프로세스 수 (1이면 풀 없이 실행)")
+    parser.add_argument("--html", action="store_true", help="그래프를 HTML 파일로도 저장 (보고서 공유용)")
+    parser.add_argument("--force", action="store_true", help="같은 데이터의 산출물이 있어도 다시 생성")
+    parser.add_argument("--data-dir", default=data_dir)
+    parser.add_argument("--artifact-dir", default=artifact_dir)
+    args = parser.parse_args()
+
+    directory, count, seconds = prerender(args.data_dir, args.artifact_dir, args.workers, args.html, args.force)
+    if count is None:
+        print(f"✅ 이미 최신 산출물이 있습니다: {directory} (--force로 다시 생성)")
+    else:
+        print(f"✅ 화면 {count}개 사전 렌더링 완료: {directory} ({seconds:.1f}s)")
@@ -0,0 +1,199 @@
+"""단계별 실행 시간 측정 (DASHBOARD_PROFILE=1 일 때만 동작)
+
+    with stage("read_csv") as s:
+        df = pd.read_csv(...)
+        s.count(rows=len(df))
+
+측정 결과는 rerun(또는 프래그먼트 실행, 백그라운드 데이터 갱신) 단위로 묶어 JSON-lines 로그에 추가하고,
+프로세스 내 최근 기록으로 단계별 p50/p95를 계산한다. 비활성화 상태에서는
+stage()가 공용 no-op 객체를 돌려주므로 호출 비용만 든다.
+
+    python -m dashboard.profiling [로그 경로]   # 로그 파일의 단계별 p50/p95
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .config import profile_log, profiling
+
+# 단계별 최근 측정값 (프로세스 전체, p50/p95 계산용)
+history_size = 500
+
+_current = ContextVar("profiling_run", default=None)
+_history = defaultdict(lambda: deque(maxlen=history_size))
+_lock = threading.Lock()
+
+
+class _NullStage:
+    """비활성화/측정 중인 실행이 없을 때 사용하는 no-op 단계"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def count(self, **counters):
+        pass
+
+
+_null_stage = _NullStage()
+
+
+class Stage:
+    """이름 있는 타이머 + 행/바이트 등 카운터"""
+
+    def __init__(self, run, name, counters):
+        self.run = run
+        self.name = name
+        self.counters = counters
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record = {"name": self.name, "seconds": round(time.perf_counter() - self.start, 6)}
+        record.update(self.counters)
+        self.run.stages.append(record)
+        return False
+
+    def count(self, **counters):
+        self.counters.update(counters)
+
+
+class Run:
+    """rerun 한 번의 측정 기록 (세션, 필터 조건, 단계 목록)"""
+
+    def __init__(self, kind, session, context):
+        self.kind = kind
+        self.session = session
+        self.context = context
+        self.stages = []
+        self.start = time.perf_counter()
+        self.total = None
+
+
+def stage(name, **counters):
+    """측정 중인 실행이 있으면 단계 타이머, 없으면 no-op"""
+    if not profiling:
+        return _null_stage
+    run = _current.get()
+    if run is None:
+        return _null_stage
+    return Stage(run, name, counters)
+
+def begin_run(kind, session=None, nested=False, **context):
+    """측정 시작 - nested이면 진행 중인 실행을 그대로 사용 (전체 rerun 안에서 호출된 프래그먼트)
+
+    새로 시작한 경우에만 Run을 반환하므로 end_run()에는 이 반환값을 넘긴다.
+    전체 rerun 시작(nested=False)은 예외로 끝나지 못한 이전 실행을 버리고 새로 시작한다.
+    """
+    if not profiling or (nested and _current.get() is not None):
+        return None
+    run = Run(kind, session, context)
+    _current.set(run)
+    return run
+
+def annotate(**context):
+    """진행 중인 실행에 필터 조건 등 추가"""
+    run = _current.get() if profiling else None
+    if run is not None:
+        run.context.update(context)
+
+def end_run(run, record=True):
+    """측정 종료 - 단계별 기록을 누적하고 로그에 한 줄 추가 (record=False이면 기록 없이 종료만)"""
+    if run is None:
+        return None
+    _current.set(None)
+    if not record:
+        return run
+    run.total = round(time.perf_counter() - run.start, 6)
+    with _lock:
+        _history["total"].append(run.total)
+        for record in run.stages:
+            _history[record["name"]].append(record["seconds"])
+    write_log(run)
+    return run
+
+def profiled(func, *args):
+    """(작업 프로세스) func(*args)를 따로 측정 → (결과, 단계 기록 목록) - 호출 측에서 add_stages로 합침"""
+    run = begin_run("worker")
+    try:
+        result = func(*args)
+    finally:
+        end_run(run, record=False)
+    return result, run.stages if run else []
+
+def add_stages(stages):
+    """작업 프로세스에서 측정한 단계 기록을 진행 중인 실행에 추가"""
+    run = _current.get() if profiling else None
+    if run is not None:
+        run.stages.extend(stages)
+
+def write_log(run, path=profile_log):
+    line = json.dumps({
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "kind": run.kind,
+        "session": run.session,
+        "context": run.context,
+        "total": run.total,
+        "stages": run.stages,
+    }, ensure_ascii=False, default=str)
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with _lock, open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass  # 로그 기록 실패가 화면 렌더링을 막지 않도록
+
+@contextmanager
+def timed(timings, name):
+    """with 블록 실행 시간(초)을 timings[name]에 기록 - 측정 실행과 무관하게 항상 동작 (시작 리포트, 벤치마크용)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round(time.perf_counter() - start, 6)
+
+def percentile(values, q):
+    """nearest-rank 백분위수"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))]
+
+def summarize(samples):
+    """{단계: [초, ...]} → 단계별 (횟수, p50, p95) 목록 (p95 큰 순)"""
+    rows = [{"단계": name, "횟수": len(values), "p50(ms)": percentile(values, 50) * 1000,
+             "p95(ms)": percentile(values, 95) * 1000}
+            for name, values in samples.items() if values]
+    return sorted(rows, key=lambda row: row["p95(ms)"], reverse=True)
+
+def stage_summary():
+    """이 프로세스의 최근 기록 기준 단계별 p50/p95"""
+    with _lock:
+        samples = {name: list(values) for name, values in _history.items()}
+    return summarize(samples)
+
+def read_log(path=profile_log):
+    """로그 파일의 단계별 측정값 {단계: [초, ...]}"""
+    samples = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            samples["total"].append(entry["total"])
+            for record in entry["stages"]:
+                samples[record["name"]].append(record["seconds"])
+    return samples
+
+
+if __name__ == "__main__":
+    for row in summarize(read_log(sys.argv[1] if len(sys.argv) > 1 else profile_log)):
+        print(f"{row['단계']:<32} {row['횟수']:>6}  p50 {row['p50(ms)']:9.2f}ms  p95 {row['p95(ms)']:9.2f}ms")
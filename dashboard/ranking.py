@@ -0,0 +1,136 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+from .config import month_column
+from .schema import month_key, month_labels
+from .tables import wide_from_ranked
+
+
+def top_k(values, k, tie_order):
+    """값 내림차순 상위 k개 위치 - 전체 정렬 대신 argpartition으로 후보만 골라 정렬
+
+    같은 값은 tie_order가 작은 쪽이 앞 (k번째 값과 같은 후보는 모두 포함한 뒤 잘라내므로 결과가 항상 같음)
+    """
+    if len(values) > k > 0:
+        kth = values[np.argpartition(-values, k - 1)[k - 1]]
+        candidates = np.flatnonzero(values >= kth)
+    else:
+        candidates = np.arange(len(values))
+    order = np.lexsort((tie_order[candidates], -values[candidates]))
+    return candidates[order][:k]
+
+
+class KeywordRanking:
+    """(브랜드, 채널 조합, 감성) 하나에 대한 키워드 순위 인덱스
+
+    - 월 × 키워드 합계를 월 순으로 정렬된 배열로 한 번만 만들어 둠
+    - 월별 상위 top_n 키워드는 달마다 미리 계산 (새 달이 들어오면 extend로 그 달만 계산)
+    - 기간 순위는 시작 월별로 한 번 계산해 두고, 순위 구간(1~12위, 13~24위 ...)은 슬라이스로 반환
+    """
+
+    def __init__(self, df, keyword_column, value_column, top_n=100):
+        self.keyword_column = keyword_column
+        self.value_column = value_column
+        self.top_n = top_n
+        self.labels = np.array([], dtype=object)
+        self.keyword_codes = {}
+        self.tie_order = np.array([], dtype=np.int64)
+        self.months = np.array([], dtype=np.int64)    # 행별 월 키 (오름차순)
+        self.keywords = np.array([], dtype=np.int64)  # 행별 키워드 ID
+        self.values = np.array([], dtype=np.int64)    # 행별 합계
+        self.monthly = {}  # 월 키 → 상위 top_n 행 위치 (순위 순)
+        self.period = {}   # 시작 월 키 → 기간 합계 순위 (키워드 ID, 합계)
+        self.extend(df)
+
+    def extend(self, df):
+        """새 달 데이터 반영 - 기존 달의 순위는 그대로 두고 새 달 순위만 계산"""
+        df = df[df[month_column] >= 0]  # 날짜가 없는 행(월 키 -1) 제외
+        grouped = df.groupby([month_column, self.keyword_column], observed=True)[self.value_column].sum()
+        if grouped.empty:
+            return self
+        months = grouped.index.get_level_values(0).to_numpy(dtype=np.int64)
+        if len(self.months) and months.min() <= self.months[-1]:
+            raise ValueError("이미 반영된 달의 데이터는 추가할 수 없습니다.")
+
+        keyword_labels = grouped.index.get_level_values(1).astype(str)
+        new_labels = [label for label in keyword_labels.unique() if label not in self.keyword_codes]
+        for label in new_labels:
+            self.keyword_codes[label] = len(self.keyword_codes)
+        if new_labels:
+            self.labels = np.concatenate([self.labels, np.array(new_labels, dtype=object)])
+            # 같은 값일 때 키워드 정렬 순서로 순위를 정하기 위한 키
+            self.tie_order = np.argsort(np.argsort(self.labels.astype(str), kind="stable"))
+
+        self.months = np.concatenate([self.months, months])
+        self.keywords = np.concatenate([self.keywords, pd.Index(self.labels).get_indexer(keyword_labels)])
+        self.values = np.concatenate([self.values, grouped.to_numpy(dtype=np.int64)])
+        for month in np.unique(months):
+            lo, hi = np.searchsorted(self.months, [month, month + 1])
+            rows = np.arange(lo, hi)
+            self.monthly[int(month)] = rows[top_k(self.values[rows], self.top_n, self.tie_order[self.keywords[rows]])]
+        self.period.clear()  # 기간 순위는 다음 조회 때 다시 계산
+        return self
+
+    def extended(self, df):
+        """새 달 데이터를 반영한 사본 - 이 인덱스는 이전 데이터 버전의 세션이 계속 쓰므로 그대로 둠"""
+        ranking = copy.copy(self)
+        ranking.keyword_codes = dict(self.keyword_codes)
+        ranking.monthly = dict(self.monthly)
+        ranking.period = {}
+        return ranking.extend(df)
+
+    def period_start(self, since):
+        return 0 if since is None else int(np.searchsorted(self.months, month_key(since)))
+
+    def has_data(self, since=None):
+        return self.period_start(since) < len(self.months)
+
+    def ranking(self, since=None, k=None):
+        """since 이후 합계 기준 상위 k개 (키워드 ID 배열, 합계 배열)"""
+        k = k or self.top_n
+        start = self.period_start(since)
+        cached = self.period.get(start)
+        if cached is None or len(cached[0]) < k:
+            totals = np.bincount(self.keywords[start:], weights=self.values[start:],
+                                 minlength=len(self.labels)).astype(np.int64)
+            ids = np.flatnonzero(np.bincount(self.keywords[start:], minlength=len(self.labels)))
+            ids = ids[top_k(totals[ids], max(k, self.top_n), self.tie_order[ids])]
+            cached = self.period[start] = (ids, totals[ids])
+        return cached
+
+    def top_keywords(self, since=None, start_rank=1, end_rank=None):
+        """기간 순위 start_rank~end_rank위 키워드 목록"""
+        end_rank = end_rank or self.top_n
+        ids, _ = self.ranking(since, end_rank)
+        return list(self.labels[ids[start_rank - 1:end_rank]])
+
+    def series(self, keywords, since=None):
+        """키워드별 월 합계 (키워드, 월 키, 값) - 월 오름차순"""
+        start = self.period_start(since)
+        codes = [self.keyword_codes[keyword] for keyword in keywords if keyword in self.keyword_codes]
+        rows = start + np.flatnonzero(np.isin(self.keywords[start:], codes))
+        return pd.DataFrame({
+            self.keyword_column: self.labels[self.keywords[rows]],
+            month_column: self.months[rows],
+            self.value_column: self.values[rows],
+        })
+
+    def wide_table(self, since=None, top_n=None):
+        """since 이후 월별 상위 top_n 와이드 테이블 (tables.wide_from_ranked 형태)"""
+        top_n = top_n or self.top_n
+        first = month_key(since) if since is not None else None
+        rows = [(month, rank + 1, position)
+                for month, positions in sorted(self.monthly.items()) if first is None or month >= first
+                for rank, position in enumerate(positions[:top_n])]
+        if not rows:
+            return pd.DataFrame()
+        months, ranks, positions = map(np.array, zip(*rows))
+        top = pd.DataFrame({
+            "연도-월": month_labels(months),
+            "순위": ranks,
+            self.keyword_column: self.labels[self.keywords[positions]],
+            self.value_column: self.values[positions],
+        })
+        return wide_from_ranked(top, self.keyword_column, self.value_column)
@@ -0,0 +1,121 @@
+"""백그라운드 데이터 갱신 - 요청 처리와 분리된 스레드에서 다음 데이터 버전을 만들고 원자적으로 교체
+
+    refresher = Refresher()
+    refresher.start()              # 프로세스당 한 번 (app.py는 st.cache_resource로 공유)
+    dataset = refresher.current()  # 세션은 rerun 시작 시 현재 버전을 받아 끝까지 그 버전만 사용
+
+- poll_interval마다 로컬 파일 서명을 확인하고, refresh_interval마다 원본을 다시 내려받는다
+- 서명이 그대로여도 현재 버전이 max_age(기본 refresh_interval)보다 오래되면 다시 구성한다
+  (이전 공유 캐시의 유지 시간 만료와 같은 역할 - 서명으로 잡히지 않는 변경도 주기적으로 반영)
+- 서명이 바뀌면 파싱/정규화 → 스냅샷/월별 집계 → 큐브/인덱스 구성까지 모두 이 스레드에서 끝낸 뒤
+  current 참조만 잠금 안에서 바꾼다 (세션은 갱신을 기다리지 않음)
+- carry를 주면 게시 전에 이전 버전의 파생 객체(키워드 순위 등)를 새 버전으로 옮긴다
+- 이전 버전은 약한 참조로만 추적하므로, 어떤 세션도 참조하지 않게 되면 GC가 회수한다
+"""
+import threading
+import time
+import weakref
+
+from .config import data_dir, refresh_interval, refresh_poll
+from .data import data_signature, load_dataset
+from .fetch import fetch_files
+from .profiling import begin_run, end_run
+
+
+class Refresher:
+    """현재 Dataset 게시 + 백그라운드 갱신 스레드"""
+
+    def __init__(self, data_dir=data_dir, poll_interval=refresh_poll, refresh_interval=refresh_interval,
+                 loader=load_dataset, fetch=True, max_age=refresh_interval, carry=None):
+        self.data_dir = data_dir
+        self.poll_interval = poll_interval
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.carry = carry  # (이전 버전, 새 버전) → 이전 버전의 파생 객체를 새 버전으로 옮김 (게시 전에 호출)
+        self.loader = loader
+        self.fetch = fetch
+        self.live = weakref.WeakValueDictionary()  # 버전 번호 → 아직 회수되지 않은 Dataset
+        self.last_fetch = None
+        self.last_error = None
+        self._current = None
+        self._next_version = 1
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def current(self, timeout=None):
+        """게시된 최신 Dataset - 첫 버전이 준비될 때까지만 대기"""
+        self._ready.wait(timeout)
+        if self._current is None:
+            raise RuntimeError(f"데이터를 준비하지 못했습니다: {self.last_error}")
+        return self._current
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="dataset-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.check()
+            except Exception as e:  # 갱신 실패 시 기존 버전을 계속 사용하고 다음 주기에 다시 시도
+                self.last_error = e
+            self._ready.set()
+            self._stop.wait(self.poll_interval)
+
+    def check(self):
+        """원본/로컬 파일 확인 → 서명이 바뀌었거나 max_age가 지났으면 다음 버전을 구성해 게시 (게시했으면 Dataset 반환)
+
+        다운로드/적재 단계(fetch, read_csv, read_snapshot ...)는 "refresh" 실행으로 측정한다
+        (아무 단계도 거치지 않은 확인은 기록하지 않음).
+        """
+        run = begin_run("refresh", version=self._next_version)
+        try:
+            if self.fetch:
+                self.refresh_files()
+            current = self._current
+            if (current is not None and data_signature(self.data_dir) == current.signature
+                    and time.time() - current.loaded_at < self.max_age):
+                return None
+            dataset = self.loader(version=self._next_version, data_dir=self.data_dir)
+            if self.carry is not None and current is not None:
+                self.carry(current, dataset)
+            self.publish(dataset)
+            return dataset
+        finally:
+            end_run(run, record=bool(run and run.stages))
+
+    def refresh_files(self):
+        """첫 버전은 없는 파일만 받아 바로 시작하고, 이후 refresh_interval마다 바뀐 원본을 교체"""
+        now = time.monotonic()
+        if self.last_fetch is not None and now - self.last_fetch < self.refresh_interval:
+            return
+        try:
+            fetch_files(data_dir=self.data_dir, refresh=self._current is not None)
+        except Exception as e:  # 다운로드 실패 시 기존 파일로 진행
+            self.last_error = e
+        # 첫 버전은 다운로드 없이 시작했으므로 다음 주기에 원본 갱신 확인
+        self.last_fetch = now if self._current is not None else None
+
+    def publish(self, dataset):
+        """현재 버전을 원자적으로 교체 - 이전 버전을 쓰는 세션은 그대로 두고 새 rerun부터 새 버전 사용"""
+        with self._lock:
+            self._current = dataset
+            self._next_version = dataset.version + 1
+            self.live[dataset.version] = dataset
+        self._ready.set()
+
+    def status(self):
+        current = self._current
+        return {
+            "version": current.version if current else None,
+            "loaded_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(current.loaded_at)) if current else None,
+            "live_versions": sorted(self.live.keys()),
+            "last_error": str(self.last_error) if self.last_error else None,
+        }
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from .config import category_dictionaries, count_columns
+
+
+def month_key(value):
+    """날짜 → 정수 월 키 (연도 * 12 + 월 - 1) - 이미 월 키(정수)면 그대로 반환"""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    value = pd.Timestamp(value)
+    return value.year * 12 + value.month - 1
+
+def month_label(key):
+    """정수 월 키 → '연도-월' 문자열"""
+    return f"{key // 12:04d}-{key % 12 + 1:02d}"
+
+def month_keys(dates):
+    """날짜 컬럼 → int16 월 키 배열 (NaT는 -1)"""
+    values = pd.Series(dates).to_numpy(dtype="datetime64[ns]")
+    keys = values.astype("datetime64[M]").astype(np.int64) + 1970 * 12
+    keys[np.isnat(values)] = -1
+    return keys.astype(np.int16)
+
+def month_dates(keys):
+    """월 키 배열 → 각 달 1일의 datetime64[ns] 배열 (문자열을 거치지 않고 정수 연산으로 변환)"""
+    return (np.asarray(keys, dtype=np.int64) - 1970 * 12).astype("datetime64[M]").astype("datetime64[ns]")
+
+def month_labels(keys):
+    """월 키 배열 → '연도-월' 문자열 배열 (고유한 달만 문자열로 변환)"""
+    uniques, inverse = np.unique(np.asarray(keys), return_inverse=True)
+    return np.array([month_label(int(key)) for key in uniques], dtype=object)[inverse]
+
+def downcast_counts(df):
+    """집계 컬럼을 값 범위에 맞는 가장 작은 정수형으로 변환 (결측이 있으면 그대로)"""
+    for column in count_columns:
+        if column in df.columns and pd.api.types.is_integer_dtype(df[column]):
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+    return df
+
+def shared_dictionaries(dataframes):
+    """사전 이름별로 모든 파일의 라벨을 모아 정렬한 공유 CategoricalDtype"""
+    dictionaries = {}
+    for name, columns in category_dictionaries.items():
+        labels = set()
+        for df in dataframes.values():
+            for column in columns:
+                if df is not None and column in df.columns:
+                    values = df[column]
+                    labels.update(values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype)
+                                  else values.dropna().unique())
+        dictionaries[name] = pd.CategoricalDtype(sorted(labels))
+    return dictionaries
+
+def recode(values, dtype):
+    """범주형 컬럼을 공유 사전 코드로 변환 (라벨 비교 없이 코드 매핑 배열로 한 번에)"""
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.Categorical(values, dtype=dtype)
+    codes = values.cat.codes.to_numpy()
+    if not values.cat.categories.equals(dtype.categories):
+        mapping = dtype.categories.get_indexer(values.cat.categories)
+        codes = np.where(codes >= 0, mapping[codes], -1)
+    return pd.Categorical.from_codes(codes, dtype=dtype, validate=False)
+
+def unify_categories(dataframes):
+    """모든 파일의 범주형 컬럼이 같은 사전 객체를 공유하도록 변환 (사전은 프로세스에 한 벌만 유지)"""
+    dictionaries = shared_dictionaries(dataframes)
+    for df in dataframes.values():
+        if df is None:
+            continue
+        for name, columns in category_dictionaries.items():
+            for column in columns:
+                if column in df.columns:
+                    df[column] = recode(df[column], dictionaries[name])
+    return dictionaries
+
+def memory_report(dataframes):
+    """파일 × 컬럼별 메모리 사용량 데이터프레임 (MB)
+
+    범주형 컬럼은 코드 배열만 계산하고, 사전(categories)은 객체별로 한 번만 '(사전)' 행으로 계산한다.
+    """
+    rows, seen = [], set()
+    for file_name, df in dataframes.items():
+        if df is None:
+            continue
+        for column in df.columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                nbytes = values.cat.codes.to_numpy().nbytes
+                categories = values.cat.categories
+                if id(categories) not in seen:
+                    seen.add(id(categories))
+                    rows.append({"파일": file_name, "컬럼": f"{column} (사전)", "dtype": "categories",
+                                 "MB": categories.memory_usage(deep=True) / 1e6})
+            else:
+                nbytes = values.memory_usage(deep=True, index=False)
+            rows.append({"파일": file_name, "컬럼": column, "dtype": str(values.dtype), "MB": nbytes / 1e6})
+    return pd.DataFrame(rows, columns=["파일", "컬럼", "dtype", "MB"])
@@ -0,0 +1,205 @@
+import hashlib
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from .config import category_columns, count_columns, data_dir, indexed_files, month_column, monthly_aggregates
+from .files import atomic_write_json, file_hash, read_json
+from .filters import index_order, sort_for_index
+from .profiling import stage
+from .schema import downcast_counts
+
+# ✅ 스냅샷 형식이 바뀌면 올려서 기존 스냅샷을 무효화
+snapshot_version = 6
+
+# ✅ 증분 적재로 조각(part)이 이보다 많아지면 하나로 합침
+max_parts = 24
+
+# ✅ 증분 적재 판단에 쓰는 원본 끝부분 구간 크기 (이 구간만 해시하므로 파일이 커져도 확인 비용이 일정)
+tail_window = 64 * 1024
+
+# ✅ 원본 내용 해시의 블록 크기 - 블록별 해시를 기록해 두고 증분 적재 때는 덜 찬 마지막 블록부터만 다시 해시
+hash_block = 4 * 1024 * 1024
+
+
+# ✅ 스냅샷 폴더 경로 (Data/.snapshot/<파일명>/)
+def snapshot_dir(file_name, data_dir=data_dir):
+    return os.path.join(data_dir, ".snapshot", os.path.splitext(file_name)[0])
+
+def read_meta(file_name, data_dir=data_dir):
+    """스냅샷 메타데이터 (원본 식별 정보, 최신 날짜, 조각 목록) - 없거나 형식이 다르면 None"""
+    meta = read_json(os.path.join(snapshot_dir(file_name, data_dir), "meta.json"))
+    if not meta or meta.get("version") != snapshot_version:
+        return None
+    return meta
+
+def tail_hash(source_path, size):
+    """size 바이트 직전 tail_window 구간의 해시"""
+    start = max(0, size - tail_window)
+    return file_hash(source_path, limit=size - start, offset=start)
+
+def block_hashes(source_path, size, previous=None):
+    """파일 위치 기준 hash_block 단위 블록별 해시 - previous(이전 식별 정보)의 꽉 찬 블록 해시는 재사용"""
+    reused = min(previous["size"], size) // hash_block if previous else 0
+    blocks = previous["blocks"][:reused] if previous else []
+    for start in range(reused * hash_block, size, hash_block):
+        blocks.append(file_hash(source_path, limit=min(hash_block, size - start), offset=start))
+    return blocks
+
+def source_stamp(source_path, previous=None):
+    """원본 CSV 식별 정보 (크기, 수정 시각, 내용 해시, 블록별 해시, 끝부분 해시)
+
+    내용 해시는 블록별 해시를 합친 값이라 파일 내용에만 달려 있다 (한 번에 적재하든 증분 적재를
+    거듭하든 같은 바이트면 같은 값). previous를 주면 그 뒤에 행만 추가된 것으로 보고 덜 찬 마지막
+    블록부터만 다시 해시한다 (파일 전체를 다시 읽지 않음).
+    """
+    stat = os.stat(source_path)
+    blocks = block_hashes(source_path, stat.st_size, previous)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "hash": hashlib.blake2b("\n".join(blocks).encode()).hexdigest(), "blocks": blocks,
+            "tail_hash": tail_hash(source_path, stat.st_size)}
+
+def is_fresh(meta, source_path):
+    """스냅샷이 현재 원본 CSV에서 만들어진 것인지 확인 (크기/수정 시각 비교)"""
+    if not meta:
+        return False
+    stat = os.stat(source_path)
+    return meta["source"]["size"] == stat.st_size and meta["source"]["mtime_ns"] == stat.st_mtime_ns
+
+def to_snapshot_frame(df):
+    """범주형 컬럼은 category(사전 인코딩), 집계 컬럼은 값 범위에 맞는 가장 작은 정수형으로 변환"""
+    df = df.copy()
+    for column in category_columns:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    for column in count_columns:
+        if column in df.columns and not df[column].isna().any():
+            df[column] = df[column].astype("int64")
+    return downcast_counts(df)
+
+def monthly_aggregate(file_name, df):
+    """월 키 × 집계 기준 컬럼별 합계 - 새로 들어온 행만 넘기면 새 달의 집계만 계산됨"""
+    dimensions = monthly_aggregates.get(file_name)
+    if not dimensions or month_column not in df.columns:
+        return None
+    value_column = next(column for column in count_columns if column in df.columns)
+    df = df[df[month_column] >= 0]  # 날짜가 없는 행 제외
+    return df.groupby([month_column] + dimensions, observed=True)[value_column].sum().reset_index()
+
+def write_table(path, df):
+    """데이터프레임을 Arrow IPC 파일로 저장 (임시 파일 작성 후 교체)"""
+    table = pa.Table.from_pandas(to_snapshot_frame(df), preserve_index=False)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # 압축하지 않아야 메모리 매핑으로 바로 읽을 수 있음
+    with pa.OSFile(tmp_path, "wb") as sink, ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+def arrow_index_order(table, brand_column="브랜드"):
+    """Arrow 테이블의 (브랜드, 월) 정렬 순서 (sort_for_index와 같은 순서)"""
+    brands = table.column(brand_column).combine_chunks()
+    codes = brands.indices.fill_null(-1).to_numpy()
+    categories = brands.dictionary.to_pandas()
+    months = table.column(month_column).to_numpy() if month_column in table.column_names else None
+    return index_order(pd.Categorical.from_codes(codes, categories=categories, validate=False), months)
+
+def read_tables(directory, names, indexed=False):
+    """조각 파일들을 메모리 매핑으로 읽어 하나의 데이터프레임으로 합침
+
+    indexed: 인덱스 대상 파일 - 조각은 각각 (브랜드, 월) 순으로 기록되므로 조각이 하나면 그대로 쓰고,
+    여러 조각(증분 적재)이면 Arrow 쪽에서 한 번만 재배열한다 (pandas 변환 뒤 다시 복사하지 않음).
+    """
+    tables = [ipc.open_file(pa.memory_map(os.path.join(directory, name), "r")).read_all() for name in names]
+    # 조각마다 다운캐스트된 정수형이 다를 수 있으므로 더 넓은 형으로 맞춰서 합침
+    table = pa.concat_tables(tables, promote_options="permissive").unify_dictionaries() if len(tables) > 1 else tables[0]
+    if indexed and len(tables) > 1 and "브랜드" in table.column_names:
+        table = table.take(arrow_index_order(table))
+    # split_blocks: 숫자/날짜 컬럼은 매핑된 버퍼를 복사 없이 그대로 사용
+    return table.to_pandas(split_blocks=True)
+
+def write_part_files(file_name, df, directory, number):
+    """조각 하나(데이터 + 월별 집계)를 파일로 기록 → (조각 파일명, 집계 파일명 또는 None, 최신 날짜)"""
+    part_name = f"part-{number:05d}.arrow"
+    if file_name in indexed_files:
+        df = sort_for_index(df)  # 필터 인덱스용 (브랜드, 월) 순서로 기록 - 읽을 때 다시 정렬하지 않음
+    write_table(os.path.join(directory, part_name), df)
+    aggregate_name = None
+    aggregate = monthly_aggregate(file_name, df)
+    if aggregate is not None:
+        aggregate_name = f"aggregate-{number:05d}.arrow"
+        write_table(os.path.join(directory, aggregate_name), aggregate)
+    high_water = df["날짜"].max() if "날짜" in df.columns and len(df) else None
+    return part_name, aggregate_name, None if high_water is None or pd.isna(high_water) else high_water.isoformat()
+
+def commit_parts(file_name, written, source_path, meta, data_dir=data_dir, source=None):
+    """기록한 조각들 [(조각, 집계, 최신 날짜)]을 순서대로 meta의 조각 목록에 추가하고 저장
+
+    source는 원본 식별 정보 (없으면 원본 전체를 해시해서 구함).
+    """
+    directory = snapshot_dir(file_name, data_dir)
+    high_waters = [pd.Timestamp(high_water) for _, _, high_water in written if high_water]
+    if meta.get("high_water"):
+        high_waters.append(pd.Timestamp(meta["high_water"]))
+    meta.update({
+        "parts": meta["parts"] + [part_name for part_name, _, _ in written],
+        "aggregates": meta["aggregates"] + [aggregate_name for _, aggregate_name, _ in written if aggregate_name],
+        "next_part": meta["next_part"] + len(written),
+        "source": source or source_stamp(source_path),
+        "high_water": max(high_waters).isoformat() if high_waters else None,
+    })
+    atomic_write_json(os.path.join(directory, "meta.json"), meta)
+    # 메타데이터에 없는 이전 조각 정리
+    for name in os.listdir(directory):
+        if name.endswith(".arrow") and name not in meta["parts"] + meta["aggregates"]:
+            os.remove(os.path.join(directory, name))
+    return meta
+
+def write_parts(file_name, df, source_path, meta, data_dir=data_dir, source=None):
+    """조각 하나(데이터 + 월별 집계)를 meta의 조각 목록에 추가 기록"""
+    directory = snapshot_dir(file_name, data_dir)
+    os.makedirs(directory, exist_ok=True)
+    written = write_part_files(file_name, df, directory, meta["next_part"])
+    return commit_parts(file_name, [written], source_path, meta, data_dir, source)
+
+def new_meta(file_name, data_dir=data_dir):
+    """전체 재적재용 빈 메타데이터 (조각 번호는 이전 스냅샷에 이어서 매김)"""
+    previous = read_meta(file_name, data_dir)
+    return {"version": snapshot_version, "parts": [], "aggregates": [],
+            "next_part": previous["next_part"] if previous else 0}
+
+def write_snapshot(file_name, df, source_path, data_dir=data_dir, source=None):
+    """전체 재적재 - 정규화된 데이터프레임 전체로 스냅샷을 새로 만듦 (기존 조각은 정리)"""
+    return write_parts(file_name, df, source_path, new_meta(file_name, data_dir), data_dir, source)
+
+def append_snapshot(file_name, df, source_path, data_dir=data_dir):
+    """증분 적재 - 새 행만 조각으로 추가하고, 조각이 많아지면 하나로 합침
+
+    원본 식별 정보는 추가된 구간(과 덜 찬 마지막 블록)만 해시하므로 적재 비용이 원본 전체 크기와 무관하다
+    (조각을 합칠 때도 같은 식별 정보를 유지).
+    """
+    meta = read_meta(file_name, data_dir)
+    source = source_stamp(source_path, previous=meta["source"])
+    meta = write_parts(file_name, df, source_path, meta, data_dir, source)
+    if len(meta["parts"]) > max_parts:
+        meta = write_snapshot(file_name, read_tables(snapshot_dir(file_name, data_dir), meta["parts"]),
+                              source_path, data_dir, source)
+    return meta
+
+def read_snapshot(file_name, source_path, data_dir=data_dir):
+    """원본 CSV와 일치하는 스냅샷이 있으면 메모리 매핑으로 읽고, 없거나 오래됐으면 None"""
+    meta = read_meta(file_name, data_dir)
+    if not is_fresh(meta, source_path):
+        return None
+    with stage("read_snapshot", file=file_name) as timer:
+        df = read_tables(snapshot_dir(file_name, data_dir), meta["parts"], indexed=file_name in indexed_files)
+        timer.count(rows=len(df))
+    return df
+
+def read_aggregate(file_name, data_dir=data_dir):
+    """적재 시 계산해 둔 월별 집계 (집계 대상이 아닌 파일이면 None)"""
+    meta = read_meta(file_name, data_dir)
+    if not meta or not meta["aggregates"]:
+        return None
+    return read_tables(snapshot_dir(file_name, data_dir), meta["aggregates"])
@@ -0,0 +1,274 @@
+"""DuckDB 백엔드 (선택) - 스냅샷을 Parquet으로 내보내고 대시보드 조회를 매개변수화된 SQL로 실행
+
+    pip install duckdb
+    DASHBOARD_BACKEND=duckdb streamlit run app.py
+
+SqlCube / SqlIndex / SqlRanking은 AggregateCube / FrameIndex / KeywordRanking과 같은 메서드를
+제공하므로 app.py는 객체만 바꿔 끼운다. 키워드 파일은 메모리에 올리지 않고 조회마다 필요한
+컬럼과 행 그룹만 읽는다 - Parquet은 (브랜드, 월 키) 순으로 정렬해 두므로 브랜드/기간 조건은
+행 그룹 통계로 건너뛰고, 남은 스캔은 DuckDB가 여러 스레드로 병렬 처리한다.
+"""
+import os
+import threading
+import weakref
+from collections import Counter
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from .config import count_columns, data_dir, file_links, keyword_columns, month_column, monthly_aggregates
+from .files import atomic_write_json, read_json
+from .ingest import ingest_files
+from .profiling import stage
+from .schema import month_key, month_labels
+from .snapshot import read_meta, snapshot_dir
+from .tables import wide_from_ranked
+
+row_group_size = 128 * 1024
+
+# ✅ 엔진이 등록한 Parquet 경로별 참조 수 - 이전 데이터 버전의 엔진이 회수되기 전에는 파일을 지우지 않음
+live_paths = Counter()
+live_lock = threading.Lock()
+
+
+def table_name(file_name):
+    """파일명 → SQL 뷰 이름 (05.Keyword_Monthly.csv → t_05_keyword_monthly)"""
+    return "t_" + os.path.splitext(file_name)[0].replace(".", "_").lower()
+
+def quote(column):
+    return '"' + column.replace('"', '""') + '"'
+
+def parquet_name(source_hash):
+    """원본 해시별 Parquet 파일명 - 새 버전은 새 파일에 쓰고 이전 버전 엔진은 기존 파일을 계속 읽음"""
+    return f"data-{source_hash[:16]}.parquet"
+
+def remove_stale_parquet(directory, keep):
+    """keep과 어떤 엔진도 참조하지 않는 이전 버전 Parquet 삭제"""
+    with live_lock:
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if name.startswith("data") and name.endswith(".parquet") and path != keep and not live_paths[path]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+def export_parquet(file_name, data_dir=data_dir):
+    """스냅샷 조각들을 (브랜드, 월 키) 순으로 정렬된 Parquet 하나로 내보냄 (스냅샷이 바뀐 경우에만)"""
+    meta = read_meta(file_name, data_dir)
+    directory = snapshot_dir(file_name, data_dir)
+    path = os.path.join(directory, parquet_name(meta["source"]["hash"]))
+    stamp = {"parts": meta["parts"], "hash": meta["source"]["hash"]}
+    if os.path.exists(path) and read_json(os.path.join(directory, "parquet.json")) == stamp:
+        return path
+
+    with stage("export_parquet", file=file_name) as timer:
+        tables = [ipc.open_file(pa.memory_map(os.path.join(directory, name), "r")).read_all() for name in meta["parts"]]
+        table = pa.concat_tables(tables, promote_options="permissive") if len(tables) > 1 else tables[0]
+        # 범주형(사전) 컬럼은 문자열로 - Parquet이 행 그룹마다 사전 인코딩함
+        table = pa.table({name: column.cast(pa.string()) if pa.types.is_dictionary(column.type) else column
+                          for name, column in zip(table.column_names, table.columns)})
+        # 안정 정렬 - 같은 브랜드/월 안에서는 원래 행 순서 유지 (sort_for_index와 같은 순서)
+        keys = [(column, "ascending") for column in ("브랜드", month_column) if column in table.column_names]
+        if keys:
+            table = table.sort_by(keys)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        pq.write_table(table, tmp_path, row_group_size=row_group_size)
+        os.replace(tmp_path, path)
+        timer.count(rows=table.num_rows)
+    atomic_write_json(os.path.join(directory, "parquet.json"), stamp)
+    remove_stale_parquet(directory, keep=path)
+    return path
+
+def in_condition(column, values):
+    """column = ? 또는 column IN (?, ...) 조건과 매개변수 (빈 목록이면 항상 거짓)"""
+    if isinstance(values, str):
+        return f"{quote(column)} = ?", [values]
+    values = list(values)
+    if not values:
+        return "FALSE", []
+    return f"{quote(column)} IN ({', '.join('?' * len(values))})", values
+
+def where_clause(conditions):
+    """[(조건, 매개변수)] → (WHERE 절, 매개변수 목록)"""
+    sql = " AND ".join(condition for condition, _ in conditions) or "TRUE"
+    return sql, [param for _, params in conditions for param in params]
+
+
+class SqlEngine:
+    """Parquet 파일을 뷰로 등록한 인메모리 DuckDB - 조회는 스레드(세션)마다 커서를 열어 실행"""
+
+    def __init__(self, threads=None):
+        import duckdb  # 선택 의존성 - DuckDB 백엔드를 쓸 때만 로드
+
+        self.connection = duckdb.connect()
+        if threads:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        self.columns = {}  # 파일명 → Parquet 컬럼 목록
+        self.paths = []
+        # 엔진이 회수되면 등록한 경로의 참조를 풀고, 그사이 새 버전이 나온 파일은 삭제
+        weakref.finalize(self, release_paths, self.connection, self.paths)
+
+    def register(self, file_name, path):
+        self.columns[file_name] = pq.read_schema(path).names
+        with live_lock:
+            live_paths[path] += 1
+        self.paths.append(path)
+        self.connection.execute(f"CREATE OR REPLACE VIEW {table_name(file_name)} AS "
+                                f"SELECT * FROM read_parquet('{path.replace(chr(39), chr(39) * 2)}')")
+
+    def query(self, sql, params=()):
+        with stage("sql") as timer:
+            df = self.connection.cursor().execute(sql, list(params)).df()
+            timer.count(rows=len(df))
+        return df
+
+
+def release_paths(connection, paths):
+    connection.close()
+    with live_lock:
+        for path in paths:
+            live_paths[path] -= 1
+            if live_paths[path] <= 0:
+                del live_paths[path]
+    for path in paths:
+        directory = os.path.dirname(path)
+        stamp = read_json(os.path.join(directory, "parquet.json"))
+        if stamp and os.path.basename(path) != parquet_name(stamp["hash"]):
+            remove_stale_parquet(directory, keep=os.path.join(directory, parquet_name(stamp["hash"])))
+
+def open_engine(data_dir=data_dir, threads=None):
+    """모든 CSV를 (병렬로) 스냅샷에 반영하고 Parquet으로 내보낸 뒤 DuckDB에 등록 → (엔진, 오류)"""
+    engine = SqlEngine(threads)
+    _, errors = ingest_files(file_links, data_dir)
+    for file_name in file_links:
+        if file_name in errors:
+            continue
+        try:
+            engine.register(file_name, export_parquet(file_name, data_dir))
+        except Exception as e:
+            errors[file_name] = e
+    return engine, errors
+
+
+class SqlCube:
+    """AggregateCube와 같은 조회를 월별 파일에 대한 GROUP BY로 실행"""
+
+    def __init__(self, engine, file_name, dimensions, value_column):
+        self.engine = engine
+        self.table = table_name(file_name)
+        self.dimensions = list(dimensions)
+        self.value_column = value_column
+
+    def conditions(self, filters, since):
+        conditions = [(f"{quote(month_column)} >= ?", [0 if since is None else max(month_key(since), 0)])]
+        for dimension, selected in (filters or {}).items():
+            if selected is not None:
+                conditions.append(in_condition(dimension, selected))
+        return conditions
+
+    def frame(self, by, filters=None, since=None):
+        """by 컬럼(차원 또는 '연도-월')별 합계 데이터프레임 - AggregateCube.frame과 같은 행 순서"""
+        columns = ", ".join(quote(month_column if column == "연도-월" else column) for column in by)
+        conditions = self.conditions(filters, since)
+        conditions += [(f"{quote(column)} IS NOT NULL", []) for column in by if column != "연도-월"]
+        where, params = where_clause(conditions)
+        df = self.engine.query(
+            f"SELECT {columns}, CAST(SUM({quote(self.value_column)}) AS BIGINT) AS {quote(self.value_column)} "
+            f"FROM {self.table} WHERE {where} GROUP BY {columns} ORDER BY {columns}", params)
+        if "연도-월" in by:
+            df[month_column] = month_labels(df[month_column].to_numpy())
+            df = df.rename(columns={month_column: "연도-월"})
+        return df
+
+    def total(self, filters=None, since=None):
+        where, params = where_clause(self.conditions(filters, since))
+        df = self.engine.query(f"SELECT CAST(COALESCE(SUM({quote(self.value_column)}), 0) AS BIGINT) AS total "
+                               f"FROM {self.table} WHERE {where}", params)
+        return int(df["total"].iloc[0])
+
+
+class SqlIndex:
+    """FrameIndex.query와 같은 (브랜드, 채널, 시작 월) 필터 - 결과 행만 읽어 옴"""
+
+    def __init__(self, engine, file_name):
+        self.engine = engine
+        self.table = table_name(file_name)
+
+    def query(self, brand, channels=None, since=None):
+        conditions = [in_condition("브랜드", brand)]
+        if channels is not None:
+            conditions.append(in_condition("채널", channels))
+        if since is not None:
+            conditions.append((f"{quote(month_column)} >= ?", [month_key(since)]))
+        where, params = where_clause(conditions)
+        return self.engine.query(f"SELECT * FROM {self.table} WHERE {where}", params)
+
+
+class SqlRanking:
+    """KeywordRanking과 같은 순위/시계열/와이드 테이블 - (브랜드, 채널 조합, 감성) 조건을 매 조회에 포함"""
+
+    def __init__(self, engine, file_name, brand, channels=None, sentiment=None, top_n=100):
+        self.engine = engine
+        self.table = table_name(file_name)
+        self.keyword_column, self.value_column = keyword_columns[file_name]
+        self.top_n = top_n
+        self.base = [in_condition("브랜드", brand), (f"{quote(self.keyword_column)} IS NOT NULL", [])]
+        if channels is not None:
+            self.base.append(in_condition("채널", channels))
+        if sentiment is not None:
+            self.base.append(in_condition("감성", sentiment))
+
+    def where(self, since, *extra):
+        first = 0 if since is None else max(month_key(since), 0)
+        return where_clause(self.base + [(f"{quote(month_column)} >= ?", [first]), *extra])
+
+    def has_data(self, since=None):
+        where, params = self.where(since)
+        return not self.engine.query(f"SELECT 1 AS found FROM {self.table} WHERE {where} LIMIT 1", params).empty
+
+    def top_keywords(self, since=None, start_rank=1, end_rank=None):
+        """기간 합계 순위 start_rank~end_rank위 키워드 (같은 합계면 키워드 정렬 순)"""
+        end_rank = end_rank or self.top_n
+        keyword, value = quote(self.keyword_column), quote(self.value_column)
+        where, params = self.where(since)
+        df = self.engine.query(
+            f"SELECT {keyword} AS keyword, SUM({value}) AS total FROM {self.table} WHERE {where} "
+            f"GROUP BY {keyword} ORDER BY total DESC, keyword LIMIT ? OFFSET ?",
+            params + [end_rank - start_rank + 1, start_rank - 1])
+        return df["keyword"].tolist()
+
+    def series(self, keywords, since=None):
+        """키워드별 월 합계 (키워드, 월 키, 값) - 월 오름차순"""
+        keyword, value, month = quote(self.keyword_column), quote(self.value_column), quote(month_column)
+        where, params = self.where(since, in_condition(self.keyword_column, keywords))
+        return self.engine.query(
+            f"SELECT {keyword}, {month}, CAST(SUM({value}) AS BIGINT) AS {value} FROM {self.table} "
+            f"WHERE {where} GROUP BY {keyword}, {month} ORDER BY {month}, {keyword}", params)
+
+    def wide_table(self, since=None, top_n=None):
+        """월별 상위 top_n 와이드 테이블 - 월 안의 순위는 row_number 윈도 함수로 계산"""
+        keyword, value, month = quote(self.keyword_column), quote(self.value_column), quote(month_column)
+        where, params = self.where(since)
+        top = self.engine.query(
+            f"WITH monthly AS (SELECT {month}, {keyword}, CAST(SUM({value}) AS BIGINT) AS {value} "
+            f"FROM {self.table} WHERE {where} GROUP BY {month}, {keyword}) "
+            f"SELECT * FROM (SELECT *, row_number() OVER (PARTITION BY {month} ORDER BY {value} DESC, {keyword}) AS \"순위\" "
+            f"FROM monthly) WHERE \"순위\" <= ? ORDER BY {month}, \"순위\"", params + [top_n or self.top_n])
+        if top.empty:
+            return pd.DataFrame()
+        top["연도-월"] = month_labels(top[month_column].to_numpy())
+        return wide_from_ranked(top, self.keyword_column, self.value_column)
+
+
+def sql_cubes(engine):
+    """{파일명: SqlCube} - load_cubes와 같은 키"""
+    return {file_name: SqlCube(engine, file_name, dimensions,
+                               next(column for column in count_columns if column in engine.columns[file_name]))
+            for file_name, dimensions in monthly_aggregates.items() if file_name in engine.columns}
+
+def sql_indexes(engine):
+    """{파일명: SqlIndex} - load_indexes와 같은 키"""
+    return {file_name: SqlIndex(engine, file_name) for file_name in engine.columns}
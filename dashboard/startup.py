@@ -0,0 +1,113 @@
+"""시작 준비(pre-warm) 및 시작 시간 리포트
+
+컨테이너 초기화 단계나 헬스 체크에서 첫 접속 전에 실행하여 원본 다운로드,
+스냅샷/월별 집계 생성, 큐브/인덱스 구성을 미리 끝내 둔다:
+
+    python -m dashboard.startup            # 준비 후 시간 리포트 출력
+    python -m dashboard.startup --report   # 마지막 리포트만 출력
+"""
+import argparse
+import importlib
+import os
+import time
+
+from .config import data_dir
+from .files import atomic_write_json, read_json
+from .profiling import timed
+
+# ✅ import 비용이 큰 모듈 (앞 모듈이 먼저 로드되므로 뒤 모듈 시간은 추가분만 측정됨)
+heavy_modules = ["numpy", "pandas", "pyarrow", "plotly.express", "plotly.graph_objects", "gdown", "chardet"]
+
+report_name = ".startup.json"
+
+# 이 프로세스에서 첫 렌더링을 기록했는지 (배포 후 첫 접속 = cold)
+_rendered = False
+
+
+def report_path(data_dir=data_dir):
+    return os.path.join(data_dir, report_name)
+
+def import_modules(modules=heavy_modules):
+    """모듈별 import 시간 - 설치되지 않은 모듈은 None"""
+    timings = {}
+    for name in modules:
+        try:
+            with timed(timings, name):
+                importlib.import_module(name)
+        except ImportError:
+            timings[name] = None
+    return timings
+
+def update_report(data_dir=data_dir, **sections):
+    """리포트 파일의 섹션만 교체 (사전 준비와 앱 첫 렌더링 기록이 같은 파일을 사용)"""
+    path = report_path(data_dir)
+    report = read_json(path, {})
+    report.update(sections)
+    atomic_write_json(path, report)
+    return report
+
+def prewarm(data_dir=data_dir, refresh=False):
+    """모듈 import → 원본 다운로드 → 스냅샷/집계 적재 → 큐브/인덱스 구성, 단계별 시간 리포트 반환"""
+    steps = {}
+    imports = import_modules()
+
+    from .data import load_cubes, load_dataframes, load_indexes
+    from .fetch import fetch_files
+
+    with timed(steps, "fetch"):
+        fetch_files(data_dir=data_dir, refresh=refresh)
+    with timed(steps, "load"):
+        dataframes, errors = load_dataframes(data_dir)
+    with timed(steps, "cubes"):
+        load_cubes(data_dir)
+    with timed(steps, "indexes"):
+        load_indexes(dataframes)
+
+    return update_report(data_dir, prewarm={
+        "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "imports": imports,
+        "steps": steps,
+        "errors": {file_name: str(error) for file_name, error in errors.items()},
+    })
+
+def record_first_render(seconds, imports=None, data_dir=data_dir):
+    """세션 첫 대시보드 렌더링 시간 기록 - 프로세스의 첫 기록은 cold, 이후는 warm"""
+    global _rendered
+    section = "first_render_warm" if _rendered else "first_render_cold"
+    _rendered = True
+    entry = {"at": time.strftime("%Y-%m-%d %H:%M:%S"), "seconds": round(seconds, 4)}
+    if imports is not None:
+        entry["imports"] = round(imports, 4)
+    try:
+        update_report(data_dir, **{section: entry})
+    except OSError:
+        pass  # 리포트 기록 실패가 화면 렌더링을 막지 않도록
+
+def format_report(report):
+    """리포트 딕셔너리를 사람이 읽을 수 있는 줄 목록으로 변환"""
+    lines = []
+    prewarm = report.get("prewarm")
+    if prewarm:
+        lines.append(f"⏱ 사전 준비 ({prewarm['at']})")
+        for name, seconds in prewarm["imports"].items():
+            lines.append(f"  import {name:<22} {'미설치' if seconds is None else f'{seconds:8.3f}s'}")
+        for name, seconds in prewarm["steps"].items():
+            lines.append(f"  {name:<29} {seconds:8.3f}s")
+        for file_name, error in prewarm["errors"].items():
+            lines.append(f"  ⚠️ {file_name}: {error}")
+    for section, label in [("first_render_cold", "첫 렌더링 (cold)"), ("first_render_warm", "첫 렌더링 (warm)")]:
+        entry = report.get(section)
+        if entry:
+            imports = f", import {entry['imports']:.3f}s" if "imports" in entry else ""
+            lines.append(f"⏱ {label:<28} {entry['seconds']:8.3f}s{imports} ({entry['at']})")
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 사전 준비 및 시작 시간 리포트")
+    parser.add_argument("--report", action="store_true", help="준비 없이 마지막 리포트만 출력")
+    parser.add_argument("--refresh", action="store_true", help="이미 있는 원본 파일도 갱신 확인")
+    args = parser.parse_args()
+
+    report = read_json(report_path(), {}) if args.report else prewarm(refresh=args.refresh)
+    print("\n".join(format_report(report)) or "리포트가 없습니다.")
@@ -0,0 +1,40 @@
+import pandas as pd
+
+
+def wide_from_ranked(top, keyword_column, value_column):
+    """(연도-월, 순위, 키워드, 값) 행들을 순위 × 월 와이드 테이블로 변환"""
+    if top.empty:
+        return pd.DataFrame()
+    wide = top.pivot(index="순위", columns="연도-월", values=[keyword_column, value_column])
+    months = sorted(top["연도-월"].unique())
+    wide = wide.swaplevel(axis=1)[[(month, column) for month in months for column in (keyword_column, value_column)]]
+    # 키워드 수가 적은 달은 빈 칸이 생기므로 정수 표시를 유지하도록 nullable 정수로 변환
+    wide = wide.astype({(month, value_column): "Int64" for month in months})
+    return wide.reset_index(drop=True).rename_axis(columns=[None, None])
+
+def table_months(df):
+    """와이드 테이블의 월 목록 (컬럼 첫 단계, 순서 유지) - 월별 컬럼이 아니면 빈 목록"""
+    if not isinstance(df.columns, pd.MultiIndex):
+        return []
+    return list(dict.fromkeys(df.columns.get_level_values(0)))
+
+def page_count(rows, page_rows):
+    return max(1, -(-rows // page_rows))
+
+def compact_categories(df):
+    """범주형 컬럼에서 쓰지 않는 사전 항목 제거 - 파일 간 공유 사전(전체 키워드) 대신 표시할 행의 값만 남김"""
+    categorical = [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df
+    df = df.copy()
+    for column in categorical:
+        df[column] = df[column].cat.remove_unused_categories()
+    return df
+
+def table_window(df, page=1, page_rows=25, months=None):
+    """page(1부터) 번째 행 구간과 months 월 컬럼만 잘라낸 테이블 - 브라우저로는 이 구간만 전송"""
+    start = (page - 1) * page_rows
+    window = df.iloc[start:start + page_rows]
+    if months is not None:
+        window = window.loc[:, list(months)]
+    return compact_categories(window)
@@ -0,0 +1,342 @@
+"""탭별 화면 구성 - 선택 상태로 그래프(Figure)/테이블을 만드는 부분 (Streamlit 출력 없음)
+
+app.py는 여기서 만든 화면을 화면 캐시를 거쳐 출력만 하고, 사전 렌더링(python -m dashboard.prerender)은
+같은 함수로 전체 선택 조합을 미리 만든다. *_spec 함수는 (화면 캐시 키, 화면 구성 함수)를 돌려주므로
+앱과 사전 렌더링이 항상 같은 키를 사용한다.
+"""
+import pandas as pd
+
+from .brands import compare_brands
+from .config import keyword_columns, month_column, table_top_n
+from .data import source_change
+from .figures import small_multiples
+from .profiling import stage
+from .ranking import KeywordRanking
+from .tables import compact_categories
+
+# 채널별 컬러 매핑
+channel_colors = {
+    "X(트위터)": "#9b1b1b",  # 어두운 버건디 레드 (강한 빨강 톤다운)
+    "커뮤니티": "#8c4a33",  # 브라운 계열 (차분한 느낌)
+    "네이버 카페": "#14532d",  # 다크 그린 (채도를 줄여 어두운 느낌)
+    "다음 카페": "#8b0000",  # 어두운 레드 (톤 다운된 강한 색상)
+    "인스타그램": "#702963",  # 다크 퍼플 (인스타 색상에서 채도 낮춤)
+    "유튜브": "#8b1a1a",  # 유튜브 레드지만 다크톤 적용
+    "블로그": "#20554e",  # 어두운 블루-그린 계열
+    "티스토리": "#5c4033",  # 차분한 다크 브라운
+    "네이버 뉴스": "#1e3a3a",  # 어두운 청록색
+    "다음 뉴스": "#1e3799",  # 다크 네이비 블루
+    "언론사 뉴스": "#2c3e50"  # 차분한 다크 블루그레이
+}
+
+# ✅ 사이드바 기본 채널, 감성/키워드 유형/3번 탭 순위 구간 선택지
+default_channels = ["X(트위터)", "커뮤니티", "네이버 카페", "인스타그램", "블로그"]
+sentiments = ["긍정", "부정", "중립"]
+keyword_types = ["연관어", "감성어", "검색어"]  # ✅ 검색어 추가
+rank_range_options = {
+    "1위~12위": (1, 12),
+    "13위~24위": (13, 24),
+    "25위~36위": (25, 36),
+    "37위~48위": (37, 48),
+    "49위~60위": (49, 60)
+}
+
+
+def period_options(df_buzz):
+    """기간 선택지 → 시작 월 키 (연도 * 12 + 월 - 1) - 캐시 키와 필터 비교에 그대로 사용"""
+    latest_month = int(df_buzz[month_column].max())
+    return {
+        "최근 3개월": latest_month - 2,
+        "최근 6개월": latest_month - 5,
+        "최근 12개월": latest_month - 11,
+        "최근 24개월": latest_month - 23
+    }
+
+def channel_options(df_buzz):
+    """사이드바 채널 선택지와 기본 선택"""
+    dist_channels = [ch for ch in df_buzz['채널'].unique() if ch != "전체"]
+    return dist_channels, [ch for ch in default_channels if ch in dist_channels]
+
+def ranking_rows(dataset, file_name, brand, channels=None, sentiment=None, since=None):
+    """키워드 순위 인덱스를 만들 행 (브랜드/채널 조합/감성, since가 속한 달 이후)"""
+    df = dataset.indexes[file_name].query(brand, channels, since)
+    if sentiment is not None:
+        df = df[df["감성"] == sentiment]
+    return df
+
+# ✅ 키워드 순위 인덱스 - (파일, 브랜드, 채널 조합, 감성)별로 데이터 버전마다 한 번만 구성하여 모든 세션이 공유
+# (월별 상위 100개와 기간별 순위를 부분 선택으로 미리 계산, 순위 구간 선택은 슬라이스)
+def get_keyword_ranking(dataset, file_name, brand, channels=None, sentiment=None):
+    def build():
+        if dataset.engine is not None:
+            from .sql import SqlRanking
+
+            return SqlRanking(dataset.engine, file_name, brand, channels, sentiment, top_n=table_top_n)
+        with stage("filter", file=file_name) as timer:
+            df = ranking_rows(dataset, file_name, brand, channels, sentiment)
+            timer.count(rows=len(df))
+        keyword_column, value_column = keyword_columns[file_name]
+        with stage("keyword_ranking", file=file_name, rows=len(df)):
+            return KeywordRanking(df, keyword_column, value_column, top_n=table_top_n)
+    return dataset.cached(("keyword_ranking", file_name, brand, channels, sentiment), build)
+
+def carry_rankings(previous, dataset):
+    """이전 버전에서 만든 키워드 순위 인덱스를 새 버전으로 옮김 (갱신 스레드에서 새 버전 게시 전에 실행) → 옮긴 개수
+
+    원본 내용이 그대로인 파일의 인덱스는 그대로 넘기고, 뒤에 행만 추가된(증분 적재) 파일의 인덱스는
+    추가된 행만 extend로 반영한 사본을 넘긴다. 그 밖의 파일은 다음 조회 때 새로 구성한다.
+    """
+    if previous is None or previous.engine is not None or dataset.engine is not None:
+        return 0
+    carried = 0
+    for key, ranking in previous.derived():
+        if key[0] != "keyword_ranking" or key[1] not in dataset.indexes:
+            continue
+        _, file_name, brand, channels, sentiment = key
+        change = source_change(previous.sources.get(file_name), dataset.sources.get(file_name))
+        if change == "append":
+            high_water = pd.Timestamp(previous.sources[file_name]["high_water"])
+            df = ranking_rows(dataset, file_name, brand, channels, sentiment, since=high_water)
+            try:
+                ranking = ranking.extended(df[df["날짜"] > high_water])
+            except ValueError:  # 이미 반영된 달에 행이 추가된 경우 - 새로 구성
+                continue
+        elif change != "same":
+            continue
+        dataset.cached(key, lambda ranking=ranking: ranking)
+        carried += 1
+    return carried
+
+# ✅ 탭별 데이터 - 탭마다 실제로 사용하는 선택 값만 인자로 받음
+# (결과는 화면 캐시에 그래프/테이블과 함께 보관되므로 다른 탭의 위젯을 바꿔도 다시 계산하지 않음)
+def social_tab_data(dataset, brand, channels, period_start):
+    """1번 탭 - 언급량/감성 추이, 연관어 테이블 데이터"""
+    buzz_cube = dataset.cubes["01.Social_Buzz_Monthly.csv"]
+    sentiment_cube = dataset.cubes["04.Sentiment_Buzz_Monthly.csv"]
+
+    # 감성 언급량 월별 비율
+    df_sentiment_monthly = sentiment_cube.frame(['연도-월', '채널', '감성'], {'브랜드': brand, '채널': channels}, since=period_start)
+    df_sentiment_monthly['총합'] = df_sentiment_monthly.groupby('연도-월')['언급량'].transform('sum')
+    df_sentiment_monthly['비율'] = df_sentiment_monthly['언급량'] / df_sentiment_monthly['총합'] * 100
+
+    return {
+        "buzz_monthly": buzz_cube.frame(['연도-월', '채널'], {'브랜드': brand, '채널': channels}, since=period_start),
+        "sentiment_monthly": df_sentiment_monthly,
+        "keywords_table": get_keyword_ranking(dataset, "05.Keyword_Monthly.csv", brand, channels).wide_table(period_start),
+    }
+
+def brand_comparison(dataset, file_name, brands, channels, period_start):
+    """1·2번 탭 카드 - 비교 브랜드별 합계/비중/전월 대비 증감 (브랜드 수와 무관하게 큐브 조회 한 번)"""
+    filters = {} if channels is None else {'채널': channels}
+    return compare_brands(dataset.cubes[file_name], brands, filters, since=period_start)
+
+def sentiment_keyword_table(dataset, brand, channels, period_start, sentiment):
+    """1번 탭 - 선택한 감성의 연관어 월별 상위 100개 테이블"""
+    return get_keyword_ranking(dataset, "07.Sentiment_Keyword_Monthly.csv", brand, channels, sentiment).wide_table(period_start)
+
+def search_tab_data(dataset, brand, period_start):
+    """2번 탭 - 검색량 추이, 검색 키워드 테이블 데이터 (채널 선택과 무관)"""
+    search_cube = dataset.cubes["02.SearchVolume_Monthly.csv"]
+    return {
+        "search_monthly": search_cube.frame(['연도-월'], {'브랜드': brand}, since=period_start),
+        "keywords_table": get_keyword_ranking(dataset, "06.Search_Keyword_Monthly.csv", brand).wide_table(period_start),
+    }
+
+def search_demographics(dataset, brand):
+    """2번 탭 - 검색 키워드 성별/연령 비율 (브랜드만 사용, 데이터 버전마다 한 번만 계산)
+
+    키워드 컬럼은 이 브랜드에 나오는 키워드만 남긴 사전으로 바꾼다 (공유 사전 전체가 화면 캐시/전송/산출물에 실리지 않게).
+    """
+    def build():
+        df_gender = dataset.indexes["08.Search_Keyword_Gender_Monthly.csv"].query(brand)
+        df_age = dataset.indexes["09.Search_Keyword_Age_Monthly.csv"].query(brand)
+        gender = df_gender[['키워드', '검색량', '남성(%)', '여성(%)']].sort_values(by='검색량', ascending=False)
+        age = df_age[['키워드', '검색량',
+                      '12세 이하(%)', '13~19세(%)', '20~24세(%)', '25~29세(%)',
+                      '30~39세(%)', '40~49세(%)', '50세 이상(%)']].sort_values(by='검색량', ascending=False)
+        gender, age = compact_categories(gender), compact_categories(age)
+        return df_gender['기간'].iloc[0], gender, df_age['기간'].iloc[0], age
+    return dataset.cached(("search_demographics", brand), build)
+
+def keyword_tab_data(dataset, file_name, brand, channels, period_start, sentiment, start_rank, end_rank):
+    """3번 탭 - 순위 구간 키워드와 키워드별 월별 시계열 (데이터가 없으면 None)"""
+    ranking = get_keyword_ranking(dataset, file_name, brand, channels, sentiment)
+    if not ranking.has_data(period_start):
+        return None
+    # ✅ 기간 순위에서 선택한 순위 구간만 슬라이스 (채널 구분 없이 전체 합산 기준)
+    top_keywords = ranking.top_keywords(period_start, start_rank, end_rank)
+    return top_keywords, ranking.series(top_keywords, since=period_start)
+
+def social_view(dataset, selected_brand, channel_key, selected_period, period_start):
+    """1번 탭 화면 구성 - 언급량/감성 추이 그래프, 연관어 테이블"""
+    import plotly.express as px
+
+    with stage("data:social"):
+        data = social_tab_data(dataset, selected_brand, channel_key, period_start)
+
+    # 언급량 추이 그래프
+    with stage("figure:buzz"):
+        fig_buzz = px.bar(
+            data["buzz_monthly"],
+            x='연도-월',
+            y='언급량',
+            color='채널',
+            barmode='stack',
+            title=f"{selected_brand} {selected_period} 월별 소셜미디어 언급량 변화",
+            color_discrete_map=channel_colors
+        )
+        fig_buzz.update_layout(
+            xaxis_title=None,
+            yaxis_title=None,
+            xaxis=dict(type='category', tickangle=0),
+            showlegend=False
+        )
+        fig_buzz.update_traces(marker=dict(line=dict(width=0)))
+
+    # 감성 언급량 추이 그래프
+    with stage("figure:sentiment"):
+        fig_sentiment = px.bar(
+        data["sentiment_monthly"],
+        x='연도-월',
+        y='비율',
+        color='감성',
+        barmode='stack',
+        title=f"{selected_brand} {selected_period} 감성별 비율 변화",
+        color_discrete_map = { "긍정": "#00008B", "부정": "#8B0000", "중립": "#4E4E50"}
+        )
+
+        fig_sentiment.update_layout(
+            xaxis_title=None,
+            yaxis_title=None,
+            xaxis=dict(type='category', tickangle=0),
+            showlegend=False
+        )
+
+        fig_sentiment.update_traces(marker=dict(line=dict(width=0)))
+
+    return {
+        "buzz": fig_buzz,
+        "sentiment": fig_sentiment,
+        "keywords": data["keywords_table"],
+    }
+
+def search_view(dataset, selected_brand, selected_period, period_start):
+    """2번 탭 화면 구성 - 검색량 추이 그래프, 검색 키워드/성별/연령 테이블"""
+    import plotly.express as px
+
+    with stage("data:search"):
+        data = search_tab_data(dataset, selected_brand, period_start)
+
+    # 검색량 추이 그래프
+    with stage("figure:search"):
+        fig_search = px.bar(
+            data["search_monthly"],
+            x='연도-월',
+            y='검색량',
+            barmode='group',
+            title=f"{selected_brand} {selected_period} 월별 검색량 변화",
+            color_discrete_sequence=["#4B0082"]
+        )
+        fig_search.update_layout(
+            xaxis_title=None,
+            yaxis_title=None,
+            xaxis=dict(type='category', tickangle=0)
+        )
+        fig_search.update_traces(marker=dict(line=dict(width=0)))
+
+    with stage("data:search_demographics"):
+        gender_period, df_gender, age_period, df_age = search_demographics(dataset, selected_brand)
+
+    return {
+        "search": fig_search,
+        "keywords": data["keywords_table"],
+        "gender": (gender_period, df_gender),
+        "age": (age_period, df_age),
+    }
+
+def keyword_grid_view(dataset, selected_brand, channels, selected_period, period_start, keyword_type, sentiment, start_rank, end_rank):
+    """3번 탭 화면 구성 - 순위 구간 키워드별 월별 추이 격자 그래프 (데이터가 없으면 None)"""
+    with stage("data:keyword_grid"):
+        if keyword_type == "연관어":
+            result = keyword_tab_data(dataset, "05.Keyword_Monthly.csv", selected_brand, channels, period_start, None, start_rank, end_rank)
+            keyword_column = "연관어"
+        elif keyword_type == "감성어":
+            result = keyword_tab_data(dataset, "07.Sentiment_Keyword_Monthly.csv", selected_brand, channels, period_start, sentiment, start_rank, end_rank)
+            keyword_column = "연관어"
+        elif keyword_type == "검색어":
+            result = keyword_tab_data(dataset, "06.Search_Keyword_Monthly.csv", selected_brand, None, period_start, None, start_rank, end_rank)  # ✅ 검색어 데이터 적용
+            keyword_column = "키워드"
+
+    if result is None:
+        return None
+    top_keywords, df_selected = result
+    with stage("figure:keyword_grid", keywords=len(top_keywords)):
+        # ✅ 원래 사용했던 컬러 매핑 적용
+        color_map = {
+            "연관어": "#4B0082",  # Dark Purple
+            "긍정": "#00008B",  # Dark Blue
+            "부정": "#8B0000",  # Dark Red
+            "중립": "#4E4E50",  # Gray
+            "검색어": "#008B8B"  # Dark Cyan
+        }
+        bar_color = color_map[keyword_type] if keyword_type in color_map else color_map[sentiment]
+
+        # ✅ 채널별 구분 없이 하나의 막대그래프 유지 - 12개 셀의 트레이스/축 설정을 모아 Figure를 한 번에 생성
+        fig = small_multiples(
+            df_selected, top_keywords, keyword_column,
+            "검색량" if keyword_type == "검색어" else "언급량",
+            rows=4, cols=3,
+            trace=dict(marker=dict(color=bar_color)),
+            xaxis=dict(
+                type="date",
+                dtick="M1",
+                tickformat="%y-%m",
+                showgrid=False,
+                tickangle=-45 if selected_period in ["최근 24개월", "최근 12개월"] else 0,
+                tickfont=dict(color="white", size=10 if selected_period == "최근 24개월" else 13)
+            ),
+            yaxis=dict(
+                showgrid=False,
+                gridcolor='#d3d3d3',
+                gridwidth=0.1,
+                tickfont=dict(color="white"),
+                tickformat="~s"
+            ),
+            layout=dict(
+                height=800,
+                width=1800,
+                title_text="",
+                title_x=0.5,
+                showlegend=False,
+                plot_bgcolor="#0e1117",
+                paper_bgcolor="#0e1117",
+                font=dict(color="white"),
+                margin=dict(l=40, r=40, t=60, b=40)
+            )
+        )
+    return fig
+
+# ✅ 화면별 (캐시 키, 구성 함수) - 키에는 그 화면이 실제로 사용하는 선택 값만 넣음
+def cards_spec(dataset, file_name, compare_key, channel_key, period_start):
+    return (("cards", file_name, compare_key, channel_key, period_start),
+            lambda: brand_comparison(dataset, file_name, compare_key, channel_key, period_start))
+
+def social_spec(dataset, selected_brand, channel_key, selected_period, period_start):
+    return (("social", selected_brand, channel_key, selected_period, period_start),
+            lambda: social_view(dataset, selected_brand, channel_key, selected_period, period_start))
+
+def sentiment_keywords_spec(dataset, selected_brand, channel_key, period_start, selected_sentiment):
+    return (("sentiment_keywords", selected_brand, channel_key, period_start, selected_sentiment),
+            lambda: sentiment_keyword_table(dataset, selected_brand, channel_key, period_start, selected_sentiment))
+
+def search_spec(dataset, selected_brand, selected_period, period_start):
+    return (("search", selected_brand, selected_period, period_start),
+            lambda: search_view(dataset, selected_brand, selected_period, period_start))
+
+def keyword_grid_spec(dataset, selected_brand, channel_key, selected_period, period_start, keyword_type, selected_sentiment, selected_range):
+    """3번 탭 격자 - 유형별로 사용하지 않는 채널/감성은 캐시 키에서 제외"""
+    channels = None if keyword_type == "검색어" else channel_key
+    sentiment = selected_sentiment if keyword_type == "감성어" else None
+    start_rank, end_rank = rank_range_options[selected_range]
+    return (("keyword_grid", selected_brand, channels, selected_period, period_start, keyword_type, sentiment, start_rank, end_rank),
+            lambda: keyword_grid_view(dataset, selected_brand, channels, selected_period, period_start, keyword_type, sentiment, start_rank, end_rank))
@@ -0,0 +1,93 @@
+"""화면(view) 캐시 - 완성된 그래프(Figure)와 테이블을 선택 상태별로 보관해 모든 세션이 공유
+
+키는 (화면 이름, 브랜드, 채널 조합, 기간, 감성, 키워드 유형, 순위 구간 ...) 튜플이고,
+더 새로운 데이터 버전(Dataset.version)이 들어오면 이전 버전 항목을 모두 버린다 (아직 이전 버전을
+쓰는 세션의 화면은 만들어 돌려주기만 하고 저장하지 않음). 그래프는 한 번 직렬화한 형태
+(SerializedFigure)로 보관하므로 출력할 때 다시 직렬화하지 않는다. 전체 크기(그래프는 직렬화된
+JSON 길이, 테이블은 메모리 사용량)와 항목 수에 상한을 두고 오래 쓰지 않은 항목부터 내보낸다.
+캐시에 있는 화면은 pandas 집계와 plotly 그래프 생성을 모두 건너뛴다.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from .config import view_cache_entries, view_cache_mb
+
+
+def serialize_figures(value):
+    """화면 값 안의 그래프를 직렬화된 그래프로 바꿈 (dict/list/tuple은 재귀적으로)"""
+    if isinstance(value, dict):
+        return {key: serialize_figures(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(serialize_figures(item) for item in value)
+    if hasattr(value, "to_plotly_json"):
+        from .payloads import serialize_figure  # plotly 그래프가 있을 때만 로드
+        return serialize_figure(value)
+    return value
+
+def payload_size(value):
+    """캐시 항목 크기(바이트) 추정 - 그래프는 serialize_figures를 거친 값이어야 함 (직렬화된 길이)"""
+    if isinstance(value, dict):
+        return sum(payload_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(item) for item in value)
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return getattr(value, "nbytes", 64)
+
+
+class ViewCache:
+    """데이터 버전별 크기 제한 LRU (스레드 안전 - 여러 세션이 동시에 조회)"""
+
+    def __init__(self, max_bytes=view_cache_mb * 1024 * 1024, max_entries=view_cache_entries):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.version = None
+        self.entries = OrderedDict()  # key → (값, 크기)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def lookup(self, version, key, build):
+        """key의 화면 반환 → (값, 캐시 적중 여부) - 없으면 build()로 만들어 저장"""
+        with self.lock:
+            if self.version is None or version > self.version:
+                self._reset(version)
+            entry = self.entries.get(key) if version == self.version else None
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], True
+            self.misses += 1
+
+        # 화면 구성은 잠금 밖에서 (동시에 같은 화면을 만들면 마지막 결과가 남음)
+        value = serialize_figures(build())
+        size = payload_size(value)
+        with self.lock:
+            if version == self.version and size <= self.max_bytes:
+                previous = self.entries.pop(key, None)
+                if previous is not None:
+                    self.bytes -= previous[1]
+                self.entries[key] = (value, size)
+                self.bytes += size
+                self._evict()
+        return value, False
+
+    def _reset(self, version):
+        self.version = version
+        self.entries.clear()
+        self.bytes = 0
+
+    def _evict(self):
+        while self.entries and (self.bytes > self.max_bytes or len(self.entries) > self.max_entries):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {"entries": len(self.entries), "mb": round(self.bytes / 1e6, 1),
+                    "hits": self.hits, "misses": self.misses,
+                    "hit_rate": round(self.hits / lookups, 3) if lookups else None}